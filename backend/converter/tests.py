@@ -1,3 +1,125 @@
-from django.test import TestCase
+import os
+import tempfile
 
-# Create your tests here.
+from django.test import SimpleTestCase
+from docx import Document
+
+from converter.utils import extractor
+
+
+class DocumentParsingTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "Sample_Market.docx")
+
+    def _write(self, summary):
+        doc = Document()
+        doc.add_paragraph("Introduction")
+        doc.add_paragraph(summary)
+        doc.save(self.path)
+
+    def test_rewritten_file_is_parsed_again(self):
+        self._write("First summary.")
+        self.assertEqual(extractor.extract_meta_description(self.path), "First summary.")
+
+        self._write("Second summary.")
+        self.assertEqual(extractor.extract_meta_description(self.path), "Second summary.")
+
+    def test_shared_document_matches_path(self):
+        self._write("Shared summary.")
+        doc = Document(self.path)
+        self.assertEqual(
+            extractor.extract_meta_description(self.path, doc=doc),
+            extractor.extract_meta_description(self.path),
+        )
+
+
+class SkuTests(SimpleTestCase):
+    # (filename, SKU code, SKU URL) pinned from the original step-by-step cleanup
+    CASES = [
+        ("Global Oil and Gas Market (2024-2030).docx", "oil gas market", "global oil gas market"),
+        ("Global_Anti-Lock_Braking_and_Safety_Market.docx",
+         "global anti lock braking and safety market", "global_anti lock_braking_and_safety_market"),
+        ("Pumps - and Valves Market.docx", "pumps valves market", "pumps valves market"),
+        ("Food & Beverage Market.docx", "food beverage market", "food beverage market"),
+        ("GLOBAL-AND-global Market.docx", "market", "global global market"),
+        ("Globalization Market.docx", "globalization market", "globalization market"),
+        ("Café Équipement Market.docx", "caf quipement market", "café équipement market"),
+        # Kelvin sign: case-folds to "k" but is not in [a-zA-Z], so the SKU code blanks it
+        ("\u212aelvin Sensor Market.docx", "elvin sensor market", "kelvin sensor market"),
+    ]
+
+    def test_sku_code_and_url(self):
+        for filename, code, url in self.CASES:
+            path = os.path.join("uploads", filename)
+            with self.subTest(filename=filename):
+                self.assertEqual(extractor.extract_sku_code(path), code)
+                self.assertEqual(extractor.extract_sku_url(path), url)
+
+
+class ForecastTitleTests(SimpleTestCase):
+    # "İ" lowercases to two code points, so positions must come from the original text
+    CASES = [
+        ("Ceramic Tile Market Forecast, 2024-2030 by region", "Ceramic Tile Market Forecast, 2024-2030"),
+        ("İİİİİİİİİİ Market Forecast,2024-2030", "İİİİİİİİİİ Market Forecast,2024-2030"),
+        ("İstanbul İzmir İnegöl Market Forecast 2024 2030 and 2031 beyond",
+         "İstanbul İzmir İnegöl Market Forecast 2024 2030"),
+        ("Forecast 2024-2030 for the Market", ""),
+        ("Ceramic Tile Market Forecast, 2030", ""),
+    ]
+
+    def test_forecast_title_prefix(self):
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                end = extractor._forecast_title_end(text)
+                self.assertEqual(text[:end] if end != -1 else "", expected)
+
+
+class MarketTitlePrefixTests(SimpleTestCase):
+    CASES = [
+        ("İzmir İstanbul Ceramic Tile Market overview for buyers", "İzmir İstanbul Ceramic Tile Market"),
+        ("The Global Ceramic Tile MARKET by Type, Forecast 2024-2030", "The Global Ceramic Tile MARKET"),
+        ("Tiles are popular. Ceramic Tile Market", ""),
+        ("Ceramic tiles overview", ""),
+    ]
+
+    def test_market_title_prefix(self):
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(extractor._market_title_prefix(text), expected)
+
+
+class RevenueForecastLabelTests(SimpleTestCase):
+    CASES = [
+        # The normalized label matches "forecast in" even without a year
+        ("Revenue Forecast by Region", True),
+        ("Revenue Forecasts in USD", True),
+        ("Revenue  Forecast 2030", True),
+        ("Revenue\nForecast in 2030", True),
+        ("Revenue Forecast (2030)", True),
+        ("Market Size Forecast 2030", True),
+        ("Market Size Value in 2030", True),
+        ("Revenue Forecast", False),
+        ("Market Size 2024", False),
+        ("Forecast Period", False),
+        ("CAGR 2024-2030", False),
+    ]
+
+    def test_forecast_labels(self):
+        for label, expected in self.CASES:
+            with self.subTest(label=label):
+                self.assertIs(extractor._is_forecast_label(label), expected)
+
+    def test_seo_title_uses_forecast_row(self):
+        doc = Document()
+        table = doc.add_table(rows=3, cols=2)
+        for row, (attr, details) in zip(table.rows, [("Report Attribute", "Details"),
+                                                     ("Forecast Period", "2024 - 2030"),
+                                                     ("Revenue Forecast by Region", "USD 4.2 Billion")]):
+            row.cells[0].text = attr
+            row.cells[1].text = details
+        self.assertEqual(
+            extractor.extract_seo_title("Sample_Market.docx", doc=doc),
+            "Sample Market Size ($ 4.2 Billion) 2030",
+        )
@@ -4,6 +4,7 @@ import json
 import html
 import re
 import os
+import logging
 import pandas as pd
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.table import CT_Tbl
@@ -14,6 +15,9 @@ from docx.text.run import Run
 import concurrent.futures
 import threading
 from functools import lru_cache
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
 
 # ------------------- Helpers -------------------
 DASH = "–"  # en-dash for year ranges
@@ -37,26 +41,31 @@ def _get_pattern(pattern_key: str, pattern: str):
             _pattern_cache[pattern_key] = re.compile(pattern, re.I | re.X)
         return _pattern_cache[pattern_key]
 
+EMOJI_RE = re.compile(
+    "[" 
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F700-\U0001F77F"  # alchemical
+    "\U0001F780-\U0001F7FF"  # geometric
+    "\U0001F800-\U0001F8FF"  # arrows
+    "\U0001F900-\U0001F9FF"  # supplemental
+    "\U0001FA00-\U0001FAFF"  # chess, symbols
+    "\U00002600-\U000026FF"  # misc symbols
+    "\U00002700-\U000027BF"  # dingbats
+    "\U00002B00-\U00002BFF"  # arrows & symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00010000-\U0010ffff"
+    "]+", flags=re.UNICODE
+)
+
 def remove_emojis(text: str) -> str:
     """Universal emoji remover."""
-    emoji_pattern = re.compile(
-        "[" 
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map
-        "\U0001F700-\U0001F77F"  # alchemical
-        "\U0001F780-\U0001F7FF"  # geometric
-        "\U0001F800-\U0001F8FF"  # arrows
-        "\U0001F900-\U0001F9FF"  # supplemental
-        "\U0001FA00-\U0001FAFF"  # chess, symbols
-        "\U00002600-\U000026FF"  # misc symbols
-        "\U00002700-\U000027BF"  # dingbats
-        "\U00002B00-\U00002BFF"  # arrows & symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-       "\U00010000-\U0010ffff"
-        "]+", flags=re.UNICODE
-    )
-    return emoji_pattern.sub(r'', text or "")
+    text = text or ""
+    # Every character in EMOJI_RE is outside ASCII, and str.isascii() is a constant-time flag check
+    if text.isascii():
+        return text
+    return EMOJI_RE.sub(r'', text)
 
 # ------------------- Normalization ------------------- 
 def _norm(s: str) -> str:
@@ -77,8 +86,37 @@ def _inline_title(text: str) -> str:
                 return right
     return ""
 
+YEAR_RANGE_RE = re.compile(r"20\d{2}\s*[\-–]\s*20\d{2}")
+
 def _year_range_present(text: str) -> bool:
-    return bool(re.search(r"20\d{2}\s*[\-–]\s*20\d{2}", text))
+    return bool(YEAR_RANGE_RE.search(text))
+
+
+# ------------------- Paragraph Cache -------------------
+class _Para(NamedTuple):
+    """Stripped paragraph text with its lowercase form, length and first line."""
+    text: str
+    lower: str
+    length: int
+    first_line: str
+    first_lower: str
+    lead: int  # leading whitespace stripped from the raw text
+
+
+def _paragraph_cache(doc):
+    """Read each paragraph's text once; empty paragraphs are kept so indices match doc.paragraphs."""
+    paras = []
+    for p in doc.paragraphs:
+        raw = p.text
+        text = raw.strip()
+        lower = text.lower()
+        if '\n' in text:
+            first_line = text.partition('\n')[0].strip()
+            first_lower = first_line.lower()
+        else:
+            first_line, first_lower = text, lower
+        paras.append(_Para(text, lower, len(text), first_line, first_lower, len(raw) - len(raw.lstrip())))
+    return paras
 
 
 def _clean_final_title(title: str) -> str:
@@ -102,6 +140,9 @@ def _clean_final_title(title: str) -> str:
     return title
 
 
+BY_SEGMENT_RE = re.compile(r"\bby\s+\w")
+
+
 def _ensure_filename_start_and_year(title: str, filename: str) -> str:
     # Normalize for comparison
     title_lower = title.lower()
@@ -110,17 +151,17 @@ def _ensure_filename_start_and_year(title: str, filename: str) -> str:
     title_normalized = title_lower.replace('-', ' ').replace('_', ' ')
     
     # Extract key words from filename (excluding common words)
-    filename_keywords = [w for w in filename_normalized.split() if w not in ['market', 'the', 'and', 'or']]
+    filename_keywords = tuple(w for w in filename_normalized.split() if w not in {'market', 'the', 'and', 'or'})
     
     # Check if title already contains filename keywords
     matching_keywords = sum(1 for kw in filename_keywords if kw in title_normalized)
     
     # Don't prepend when title looks complete: has "Market", " By ", and (2+ filename keywords or 2+ "By" segments)
-    by_count = len(re.findall(r"\bby\s+\w", title_lower))
+    # (the "By" segments are only counted when the keyword check alone is not enough)
     looks_complete = (
         " by " in title_lower
         and "market" in title_lower
-        and (matching_keywords >= min(2, len(filename_keywords)) or by_count >= 2)
+        and (matching_keywords >= min(2, len(filename_keywords)) or len(BY_SEGMENT_RE.findall(title_lower)) >= 2)
     )
     # Only prepend filename if title doesn't already contain it (and isn't a complete doc title)
     if not looks_complete and matching_keywords < min(3, len(filename_keywords)) and not title_lower.startswith(filename_lower):
@@ -315,7 +356,7 @@ def determine_toc_logic(doc):
             # Check for bold (including <strong> tags)
             executive_summary_bold = any(run.bold for run in para.runs if run.text.strip()) or '<strong>' in text or '<b>' in text
             executive_summary_in_list = is_list_item(para) or any(char in text for char in ['•', '-', '–', '○', '◦', '‣', '▪', '▫', '*', '+']) or re.match(r'^\d+[\.\)]', text)
-            print(f"DEBUG: Executive Summary found: '{text[:50]}...' - Bold: {executive_summary_bold}, In List: {executive_summary_in_list}")
+            logger.debug("Executive Summary found: '%.50s...' - Bold: %s, In List: %s", text, executive_summary_bold, executive_summary_in_list)
             continue
             
         # Only check lines after Executive Summary
@@ -336,7 +377,7 @@ def determine_toc_logic(doc):
         if para_count == 1:
             first_line_after_bold = is_bold
             first_line_after_in_list = is_in_list
-            print(f"DEBUG: First line after Executive Summary: '{text[:50]}...' - Bold: {is_bold}, In List: {is_in_list}")
+            logger.debug("First line after Executive Summary: '%.50s...' - Bold: %s, In List: %s", text, is_bold, is_in_list)
         
         # Check for nested lists (parent/child structure)
         # LOGIC 2 is detected when we have a mix of main headings and list items
@@ -344,38 +385,39 @@ def determine_toc_logic(doc):
         # to determine which logic to use
     
     # Logic detection
-    print(f"DEBUG: Detection results - para_count: {para_count}, has_nested_lists: {has_nested_lists}")
-    print(f"DEBUG: executive_summary_bold: {executive_summary_bold}, executive_summary_in_list: {executive_summary_in_list}")
-    print(f"DEBUG: first_line_after_bold: {first_line_after_bold}, first_line_after_in_list: {first_line_after_in_list}")
+    logger.debug("Detection results - para_count: %s, has_nested_lists: %s", para_count, has_nested_lists)
+    logger.debug("executive_summary_bold: %s, executive_summary_in_list: %s", executive_summary_bold, executive_summary_in_list)
+    logger.debug("first_line_after_bold: %s, first_line_after_in_list: %s", first_line_after_bold, first_line_after_in_list)
     
     if para_count >= 1:
         # LOGIC 2: Parent-child structure (Executive Summary bold+list, first line after non-bold+list)
         if executive_summary_bold and executive_summary_in_list and first_line_after_in_list and not first_line_after_bold:
-            print("DEBUG: Selected LOGIC 2 (Parent-child structure: Executive Summary bold+list, first line after non-bold+list)")
+            logger.debug("Selected LOGIC 2 (Parent-child structure: Executive Summary bold+list, first line after non-bold+list)")
             return 2
         
         # LOGIC 1: Executive Summary bold, first line after in list (non-bold) but not parent-child
         elif executive_summary_bold and first_line_after_in_list and not first_line_after_bold:
-            print("DEBUG: Selected LOGIC 1 (Executive Summary bold, first line after list non-bold)")
+            logger.debug("Selected LOGIC 1 (Executive Summary bold, first line after list non-bold)")
             return 1
         
         # LOGIC 3: Executive Summary bold, first line after in list (bold)
         elif executive_summary_bold and first_line_after_in_list and first_line_after_bold:
-            print("DEBUG: Selected LOGIC 3 (Executive Summary bold, first line after list bold)")
+            logger.debug("Selected LOGIC 3 (Executive Summary bold, first line after list bold)")
             return 3
         
         # Special case: If Executive Summary is bold and first line after is bold but not detected as list,
         # but we can see from context that it should be LOGIC 3 (based on user's image)
         elif executive_summary_bold and first_line_after_bold and not first_line_after_in_list:
-            print("DEBUG: Selected LOGIC 3 (Executive Summary bold, first line after bold but not detected as list - forcing LOGIC 3)")
+            logger.debug("Selected LOGIC 3 (Executive Summary bold, first line after bold but not detected as list - forcing LOGIC 3)")
             return 3
     
     # Default to logic 1
-    print("DEBUG: Selected LOGIC 1 (default)")
+    logger.debug("Selected LOGIC 1 (default)")
     return 1
 
-def extract_toc(docx_path):
-    doc = Document(docx_path)
+def extract_toc(docx_path, doc=None):
+    if doc is None:
+        doc = Document(docx_path)
     html_output = []
     capture = False
     inside_list = False
@@ -387,7 +429,7 @@ def extract_toc(docx_path):
     
     # Determine which logic to use for this file
     logic_type = determine_toc_logic(doc)
-    print(f"DEBUG: Logic type determined: {logic_type}")  # Debug output
+    logger.debug("Logic type determined: %s", logic_type)  # Debug output
 
     def clean_heading(text):
         """Clean heading text by removing numbering, bullets, and extra spaces"""
@@ -508,7 +550,7 @@ def extract_toc(docx_path):
             # Apply single logic based on document structure
             if logic_type == 1:
                 # LOGIC 1: Bold = H2, Non-bold = p tags (preserve nested structure)
-                print(f"DEBUG LOGIC 1: Processing '{text[:30]}...' - is_bold: {is_bold}")
+                logger.debug("LOGIC 1: Processing '%.30s...' - is_bold: %s", text, is_bold)
                 
                 # Check if this is a nested list item - rely primarily on Word's list formatting
                 is_word_list_item = is_list_item(para)
@@ -522,7 +564,7 @@ def extract_toc(docx_path):
                     is_in_list = has_bullet_chars or has_numbering or is_word_list_item
                     
                     # Debug: Check what's being detected
-                    print(f"DEBUG: Bold text '{text[:50]}...' - has_bullet_chars: {has_bullet_chars}, has_numbering: {has_numbering}, is_word_list_item: {is_word_list_item}, is_in_list: {is_in_list}")
+                    logger.debug("Bold text '%.50s...' - has_bullet_chars: %s, has_numbering: %s, is_word_list_item: %s, is_in_list: %s", text, has_bullet_chars, has_numbering, is_word_list_item, is_in_list)
                     
                     if is_in_list:
                         # This is bold text within a list item - keep it as part of the list
@@ -547,7 +589,7 @@ def extract_toc(docx_path):
                             html_output.append("<ul>")  # Start nested list for children
                             inside_list = True
                             list_depth = 2  # We have main list + nested list
-                            print(f"DEBUG LOGIC 1: Added bold parent item with nested list: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 1: Added bold parent item with nested list: %.30s...", formatted_content)
                         else:
                             # This is a bold list item (not a parent)
                             if not inside_list:
@@ -556,7 +598,7 @@ def extract_toc(docx_path):
                                 list_depth = 1
                             
                             html_output.append(f"<li><p>{formatted_content}</p></li>")
-                            print(f"DEBUG LOGIC 1: Added bold list item: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 1: Added bold list item: %.30s...", formatted_content)
                     else:
                         # Bold text is NOT in list - treat as heading
                         # Close any open lists first
@@ -572,7 +614,7 @@ def extract_toc(docx_path):
                             # For headings, keep only <strong> tags, remove <b> tags
                             heading_text = heading_text.replace('<b>', '').replace('</b>', '')
                             html_output.append(f"\n<strong>{heading_text}</strong>")
-                            print(f"DEBUG LOGIC 1: Added <strong> for bold heading (not in list): {heading_text[:30]}...")
+                            logger.debug("LOGIC 1: Added <strong> for bold heading (not in list): %.30s...", heading_text)
                 else:
                     # Non-bold text - check if it's a nested list item
                     if is_nested_list:
@@ -611,7 +653,7 @@ def extract_toc(docx_path):
                             inside_list = True
                             list_depth = 2  # We have main list + nested list
                             parent_list_style = current_list_style  # Set parent style
-                            print(f"DEBUG LOGIC 1: Added parent item with nested list: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 1: Added parent item with nested list: %.30s...", formatted_content)
                         else:
                             # Check if this should be a new main section (like "Strategy Analysis")
                             is_new_main_section = ("Strategy Analysis:" in formatted_content )
@@ -632,7 +674,7 @@ def extract_toc(docx_path):
                                     list_depth = 1
                                 
                                 html_output.append(f"<li><p>{formatted_content}</p></li>")
-                                print(f"DEBUG LOGIC 1: Added main list item: {formatted_content[:30]}...")
+                                logger.debug("LOGIC 1: Added main list item: %.30s...", formatted_content)
                             else:
                                 # Check if this should be a main level item
                                 should_be_main_level = is_main_level_item(para, formatted_content, parent_list_style)
@@ -643,7 +685,7 @@ def extract_toc(docx_path):
                                     html_output.append("</li>")  # Close parent item
                                     list_depth = 1  # Back to main list level
                                     parent_list_style = current_list_style  # Update parent style
-                                    print(f"DEBUG LOGIC 1: Main level item detected - closing child list: {formatted_content[:30]}...")
+                                    logger.debug("LOGIC 1: Main level item detected - closing child list: %.30s...", formatted_content)
                                 
                                 # Add as main list item
                                 if not inside_list:
@@ -653,7 +695,7 @@ def extract_toc(docx_path):
                                     parent_list_style = current_list_style  # Set parent style
                                 
                                 html_output.append(f"<li><p>{formatted_content}</p></li>")
-                                print(f"DEBUG LOGIC 1: Added list item: {formatted_content[:30]}...")
+                                logger.debug("LOGIC 1: Added list item: %.30s...", formatted_content)
                     elif ":" in formatted_content and formatted_content.strip().endswith(":"):
                         # This is a parent item that should have nested children (not detected as list item)
                         if inside_list:
@@ -668,7 +710,7 @@ def extract_toc(docx_path):
                         html_output.append("<ul>")  # Start nested list for children
                         inside_list = True
                         list_depth = 2  # We have main list + nested list
-                        print(f"DEBUG LOGIC 1: Added parent item with nested list (non-list): {formatted_content[:30]}...")
+                        logger.debug("LOGIC 1: Added parent item with nested list (non-list): %.30s...", formatted_content)
                     else:
                         # This is regular paragraph text - close any open list first
                         if inside_list:
@@ -681,7 +723,7 @@ def extract_toc(docx_path):
                         formatted_content = runs_to_html_with_links(para.runs)
                         if formatted_content:
                             html_output.append(f"<p>{formatted_content}</p>")
-                            print(f"DEBUG LOGIC 1: Added <p> for regular text: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 1: Added <p> for regular text: %.30s...", formatted_content)
                         
             elif logic_type == 2:
                 # LOGIC 2: Parent-child structure with nested list support
@@ -703,7 +745,7 @@ def extract_toc(docx_path):
                         # For headings, keep only <strong> tags, remove <b> tags
                         heading_text = heading_text.replace('<b>', '').replace('</b>', '')
                         html_output.append(f"\n<strong>{heading_text}</strong>")
-                        print(f"DEBUG LOGIC 2: Added parent heading: {heading_text[:30]}...")
+                        logger.debug("LOGIC 2: Added parent heading: %.30s...", heading_text)
                 else:
                     # Non-bold text = Child item (list item)
                     # Check if this is a nested list item - rely primarily on Word's list formatting
@@ -750,7 +792,7 @@ def extract_toc(docx_path):
                             inside_list = True
                             list_depth = 2  # We have main list + nested list
                             parent_list_style = current_list_style  # Set parent style
-                            print(f"DEBUG LOGIC 2: Added parent item with nested list: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 2: Added parent item with nested list: %.30s...", formatted_content)
                         else:
                             # Check if this should be a new main section (like "Strategy Analysis")
                             is_new_main_section = ("Strategy Analysis:" in formatted_content or
@@ -773,7 +815,7 @@ def extract_toc(docx_path):
                                     list_depth = 1
                                 
                                 html_output.append(f"<li><p>{formatted_content}</p></li>")
-                                print(f"DEBUG LOGIC 2: Added main list item: {formatted_content[:30]}...")
+                                logger.debug("LOGIC 2: Added main list item: %.30s...", formatted_content)
                             else:
                                 # Check if this should be a main level item
                                 should_be_main_level = is_main_level_item(para, formatted_content, parent_list_style)
@@ -784,7 +826,7 @@ def extract_toc(docx_path):
                                     html_output.append("</li>")  # Close parent item
                                     list_depth = 1  # Back to main list level
                                     parent_list_style = current_list_style  # Update parent style
-                                    print(f"DEBUG LOGIC 2: Main level item detected - closing child list: {formatted_content[:30]}...")
+                                    logger.debug("LOGIC 2: Main level item detected - closing child list: %.30s...", formatted_content)
                                 
                                 # Add as main list item
                                 if not inside_list:
@@ -794,7 +836,7 @@ def extract_toc(docx_path):
                                     parent_list_style = current_list_style  # Set parent style
                                 
                                 html_output.append(f"<li><p>{formatted_content}</p></li>")
-                                print(f"DEBUG LOGIC 2: Added list item: {formatted_content[:30]}...")
+                                logger.debug("LOGIC 2: Added list item: %.30s...", formatted_content)
                     elif ":" in formatted_content and formatted_content.strip().endswith(":"):
                         # This is a parent item that should have nested children (not detected as list item)
                         if inside_list:
@@ -809,7 +851,7 @@ def extract_toc(docx_path):
                         html_output.append("<ul>")  # Start nested list for children
                         inside_list = True
                         list_depth = 2  # We have main list + nested list
-                        print(f"DEBUG LOGIC 2: Added parent item with nested list (non-list): {formatted_content[:30]}...")
+                        logger.debug("LOGIC 2: Added parent item with nested list (non-list): %.30s...", formatted_content)
                     else:
                         # This is regular paragraph text - close any open list first
                         if inside_list:
@@ -822,11 +864,11 @@ def extract_toc(docx_path):
                         formatted_content = runs_to_html_with_links(para.runs)
                         if formatted_content:
                             html_output.append(f"<p>{formatted_content}</p>")
-                            print(f"DEBUG LOGIC 2: Added <p> for regular text: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 2: Added <p> for regular text: %.30s...", formatted_content)
                     
             elif logic_type == 3:
                 # LOGIC 3: Create exact nested structure matching lines 1-195
-                print(f"DEBUG LOGIC 3: Processing '{text[:30]}...' - is_bold: {is_bold}")
+                logger.debug("LOGIC 3: Processing '%.30s...' - is_bold: %s", text, is_bold)
                 
                 # Get formatted content
                 formatted_content = runs_to_html_with_links(para.runs)
@@ -888,7 +930,7 @@ def extract_toc(docx_path):
                     if text_indent > 0 and list_level == 0:
                         list_level = 1
                     
-                    print(f"DEBUG LOGIC 3: List level: {list_level} for '{formatted_content[:30]}...'")
+                    logger.debug("LOGIC 3: List level: %s for '%.30s...'", list_level, formatted_content)
                     
                     # Check if this item should have nested children (contains colon and ends with colon)
                     # OR is a regional market analysis item
@@ -917,7 +959,7 @@ def extract_toc(docx_path):
                         inside_list = True
                         list_depth = 2  # We have main list + nested list
                         parent_list_style = current_list_style  # Set parent style
-                        print(f"DEBUG LOGIC 3: Added parent item with nested list: {formatted_content[:30]}...")
+                        logger.debug("LOGIC 3: Added parent item with nested list: %.30s...", formatted_content)
                     else:
                         # This is a child item or regular list item
                         # Check if this should be a grand child item (ends with colon)
@@ -933,7 +975,7 @@ def extract_toc(docx_path):
                                 html_output.append("<ul>")  # Start grand child list
                                 nested_list_open = True
                                 list_depth = 3  # We have main + nested + grand child
-                                print(f"DEBUG LOGIC 3: Added grand child item: {formatted_content[:30]}...")
+                                logger.debug("LOGIC 3: Added grand child item: %.30s...", formatted_content)
                             else:
                                 # Not inside nested list, create new main list
                                 if not inside_list:
@@ -942,7 +984,7 @@ def extract_toc(docx_path):
                                     list_depth = 1
                                 
                                 html_output.append(f"<li><p>{formatted_content}</p></li>")
-                                print(f"DEBUG LOGIC 3: Added list item: {formatted_content[:30]}...")
+                                logger.debug("LOGIC 3: Added list item: %.30s...", formatted_content)
                         elif "Country-Level Breakdown:" in formatted_content:
                             # Special handling for Country-Level Breakdown - always treat as child item
                             if not inside_list:
@@ -953,7 +995,7 @@ def extract_toc(docx_path):
                             html_output.append(f"<li><p><strong>{formatted_content}</strong></p>")
                             html_output.append("<ul>")  # Start nested list for countries
                             list_depth = 2  # We have main list + nested list
-                            print(f"DEBUG LOGIC 3: Added Country-Level Breakdown as child item: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 3: Added Country-Level Breakdown as child item: %.30s...", formatted_content)
                         else:
                             # Check if this should be a main level item
                             should_be_main_level = is_main_level_item(para, formatted_content, parent_list_style)
@@ -964,7 +1006,7 @@ def extract_toc(docx_path):
                                 html_output.append("</li>")  # Close parent item
                                 list_depth = 1  # Back to main list level
                                 parent_list_style = current_list_style  # Update parent style
-                                print(f"DEBUG LOGIC 3: Main level item detected - closing child list: {formatted_content[:30]}...")
+                                logger.debug("LOGIC 3: Main level item detected - closing child list: %.30s...", formatted_content)
                             
                             # Add as main list item
                             if not inside_list:
@@ -974,7 +1016,7 @@ def extract_toc(docx_path):
                                 parent_list_style = current_list_style  # Set parent style
                             
                             html_output.append(f"<li><p>{formatted_content}</p></li>")
-                            print(f"DEBUG LOGIC 3: Added list item: {formatted_content[:30]}...")
+                            logger.debug("LOGIC 3: Added list item: %.30s...", formatted_content)
                         
                 elif is_bold and not is_list_item_detected:
                     # Bold heading - close any open lists first
@@ -988,7 +1030,7 @@ def extract_toc(docx_path):
                     heading_text = clean_heading(text)
                     if heading_text:
                         html_output.append(f"\n<strong>{heading_text}</strong>")
-                        print(f"DEBUG LOGIC 3: Added bold heading: {heading_text[:30]}...")
+                        logger.debug("LOGIC 3: Added bold heading: %.30s...", heading_text)
                         
                 elif ":" in formatted_content and formatted_content.strip().endswith(":") and "Country-Level Breakdown:" not in formatted_content:
                     # This is a parent item that should have nested children (not detected as list item)
@@ -1004,7 +1046,7 @@ def extract_toc(docx_path):
                     html_output.append("<ul>")  # Start nested list for children
                     inside_list = True
                     list_depth = 2  # We have main list + nested list
-                    print(f"DEBUG LOGIC 3: Added parent item with nested list (non-list): {formatted_content[:30]}...")
+                    logger.debug("LOGIC 3: Added parent item with nested list (non-list): %.30s...", formatted_content)
                         
                 else:
                     # Regular paragraph text
@@ -1017,7 +1059,7 @@ def extract_toc(docx_path):
                     
                     if formatted_content:
                         html_output.append(f"<p>{formatted_content}</p>")
-                        print(f"DEBUG LOGIC 3: Added paragraph: {formatted_content[:30]}...")
+                        logger.debug("LOGIC 3: Added paragraph: %.30s...", formatted_content)
 
     # Close any remaining lists
     if inside_list:
@@ -1083,14 +1125,14 @@ def extract_methodology_from_faqschema(docx_path):
 # ------------------- Report Coverage -------------------
 def extract_report_coverage_table_with_style(docx_path):
     doc = Document(docx_path)
-    print(f"DEBUG: Found {len(doc.tables)} tables in document")  # Debug log
+    logger.debug("Found %s tables in document", len(doc.tables))  # Debug log
     
     for table_idx, table in enumerate(doc.tables):
         if len(table.rows) == 0:
             continue
             
         first_row_text = " ".join([c.text.strip().lower() for c in table.rows[0].cells])
-        print(f"DEBUG: Table {table_idx} first row: {first_row_text}")  # Debug log
+        logger.debug("Table %s first row: %s", table_idx, first_row_text)  # Debug log
         
         # Check if this looks like a report coverage table
         is_report_table = (
@@ -1104,7 +1146,7 @@ def extract_report_coverage_table_with_style(docx_path):
         )
         
         if is_report_table:
-            print(f"DEBUG: Found report coverage table at index {table_idx}")  # Debug log
+            logger.debug("Found report coverage table at index %s", table_idx)  # Debug log
             html_parts = []
             html_parts.append('<h2><strong>7.1. Report Coverage Table</strong></h2>')
             html_parts.append('<table style="border-collapse: collapse; width: 100%; margin: 10px 0;"><tbody>')
@@ -1137,10 +1179,10 @@ def extract_report_coverage_table_with_style(docx_path):
                 html_parts.append("</tr>")
             
             html_parts.append("</tbody></table>")
-            print(f"DEBUG: Generated HTML for report coverage table")  # Debug log
+            logger.debug("Generated HTML for report coverage table")  # Debug log
             return "\n".join(html_parts)
     
-    print("DEBUG: No report coverage table found")  # Debug log
+    logger.debug("No report coverage table found")  # Debug log
     return ""
 
 # ------------------- Extra Extractors -------------------
@@ -1399,14 +1441,14 @@ def extract_all_data_fast(file_path: str):
         result['report'] = '\n'.join(report_parts)
         
         # Extract other fields (these are lightweight)
-        result['methodology'] = extract_methodology_from_faqschema(file_path)
-        result['seo_title'] = extract_seo_title(file_path)
-        result['breadcrumb_text'] = extract_breadcrumb_text(file_path)
+        result['methodology'] = extract_methodology_from_faqschema(file_path, doc=doc)
+        result['seo_title'] = extract_seo_title(file_path, doc=doc)
+        result['breadcrumb_text'] = extract_breadcrumb_text(file_path, doc=doc)
         result['skucode'] = extract_sku_code(file_path)
         result['urlrp'] = extract_sku_url(file_path)
-        result['breadcrumb_schema'] = extract_breadcrumb_schema(file_path)
-        result['meta'] = extract_meta_description(file_path)
-        result['schema2'] = extract_faq_schema(file_path)
+        result['breadcrumb_schema'] = extract_breadcrumb_schema(file_path, doc=doc)
+        result['meta'] = extract_meta_description(file_path, doc=doc)
+        result['schema2'] = extract_faq_schema(file_path, doc=doc)
         
         return result
         
@@ -1522,7 +1564,7 @@ def _extract_labeled_inline_title(text: str) -> str:
     low = candidate.lower()
     # Be conservative: only accept if it looks like a real long-form title.
     # Some docs contain lines like "AC Power Source Market (Long-Form)" which are not the full segmented title.
-    by_count = len(re.findall(r"\bby\s+\w", low))
+    by_count = len(BY_SEGMENT_RE.findall(low))
     has_year_range = bool(re.search(r"20\d{2}\s*[\-–]\s*20\d{2}", candidate))
     looks_long_form = (
         ("market" in low)
@@ -1536,12 +1578,597 @@ def _extract_labeled_inline_title(text: str) -> str:
         return ""
 
     # Trim any trailing text after the first year-range (common in SEO/JSON blocks)
-    yr = re.search(r"20\d{2}\s*[\-–]\s*20\d{2}", candidate)
+    yr = YEAR_RANGE_RE.search(candidate)
     if yr:
         candidate = candidate[:yr.end()].strip()
 
     return candidate
 
+# "By X " header prefixes, tried when a candidate header paragraph is too long for the plain substring test.
+BY_PHASE_TYPE_HEADER_RE = re.compile(r'^by\s+phase\s+type\s')
+BY_OUTPUT_POWER_HEADER_RE = re.compile(r'^by\s+(?:output\s+power|power\s+output)\s')
+BY_PRODUCT_TYPE_HEADER_RE = re.compile(r'^by\s+(?:product\s+)?type\s')
+BY_APPLICATION_HEADER_RE = re.compile(r'^by\s+(?:treatment\s+type|application)\s')
+BY_END_USER_HEADER_RE = re.compile(r'^by\s+end[-\s]?user\s')
+BY_DISTRIBUTION_HEADER_RE = re.compile(r'^by\s+distribution\s+channel\s')
+BY_REGION_HEADER_RE = re.compile(r'^by\s+(?:region|geography)\s')
+
+# One scan over a segment header paragraph to find which value-list phrasings it uses.
+# Lookaheads keep matches zero-width so overlapping triggers are all reported.
+SEGMENT_HEADER_TRIGGER_RE = re.compile(
+    r"""(?=
+        (?P<encompassing>encompassing\s)
+      | (?P<divided>divided\s+into\s)
+      | (?P<leading>\s(?:are|is)\s+the\s+(?:leading|dominant))
+      | (?P<usage>finds\s+usage\s+in\s)
+      | (?P<applications>applications\s+across\s)
+      | (?P<available>available\s+across\s)
+      | (?P<spans>spans\s)
+      | (?P<distributed>distributed\s+across\s)
+    )""",
+    re.I | re.X,
+)
+
+# Keyword families behind each segment slot in extract_title; a constructed
+# segmented title needs at least two different families in the document.
+SEGMENT_KEYWORD_FAMILIES = (
+    ('by phase type',),
+    ('by output power', 'by power output'),
+    ('by treatment type', 'by application'),
+    ('by diagnostic approach', 'by diagnostic technology', 'by type', 'by product type'),
+    ('by end-user', 'by end user'),
+    ('by distribution channel',),
+    ('by region', 'by geography'),
+)
+
+# Phrases that mark a segment header paragraph as carrying its own value list.
+SEGMENT_HEADER_TRIGGERS = (
+    'divided into',
+    'finds usage in',
+    'applications across',
+    'find applications across',
+    'available across',
+    'spans',
+    'includes',
+    'comprises',
+    'distributed across',
+    'usage in',
+    'encompassing',
+    'remains',
+    'represents',
+    'leading',
+    'category',
+    'area',
+)
+
+# Paragraph openings that are commentary rather than segment values.
+SEGMENT_EXCLUDE_PHRASES = (
+    'market analysis', 'market share', 'this segment', 'this area', 'this region',
+    'key stakeholders', 'projected share',
+)
+
+# Forward scan after a segment header: a "By ..." paragraph opens the next section.
+SEGMENT_SECTION_BREAK_RE = re.compile(r'By\s+', re.I)
+
+# Lowercase openings that disqualify a colon heading or a standalone heading as a segment value.
+# Longer phrases already covered by a shorter entry ("the global", "the g-csf market") are left out.
+COLON_VALUE_BAD_PREFIXES = (
+    'by ', 'the ', 'this ', 'these ', 'aml ', 'market', 'key ', 'other ', 'projected ', 'oem', 'rest of',
+)
+HEADING_VALUE_BAD_PREFIXES = (
+    'by ', 'the ', 'this ', 'these ', 'market', 'key ', 'projected ', 'products such',
+)
+
+# Patterns used per paragraph and per value while collecting segment values.
+SEGMENT_COLON_HEADING_RE = re.compile(r'([A-Z][a-zA-Z0-9\s&]+(?:\([A-Za-z0-9\s,]+\))?)\s*:')
+SEGMENT_HEADING_GROUP_RE = re.compile(r'([A-Z][A-Za-z0-9\s&\-]+(?:\([A-Za-z0-9\s,\-]+\))?)')
+SEGMENT_VALUE_LIST_RE = re.compile(r'([A-Z][^,]+(?:,\s*[A-Z][^,]+){0,5}(?:,\s*and\s+[A-Z][^,]+)?)')
+VALUE_DESCRIPTION_SPLIT_RE = re.compile(
+    r'\s+(?:remain|are|encompass|represent|account|drive|continue|include|comprise)', re.I
+)
+VALUE_LIST_SPLIT_RE = re.compile(r',\s*(?:and\s+)?')
+TRAILING_AND_RE = re.compile(r',\s*and\s+([A-Z][^,]+)')
+LEADING_ARTICLE_RE = re.compile(r'^(The|This|These|That)\s+', re.I)
+PAREN_CONTENT_RE = re.compile(r'\s*\([^)]+\)')
+PAREN_GROUP_RE = re.compile(r'\(([^)]+)\)')
+UPPER_ABBREVIATION_RE = re.compile(r'[A-Z]{2,}$')
+PAREN_ABBREVIATION_RE = re.compile(r'\(([A-Z][A-Z0-9\-]{1,})\)')
+CONNECTOR_WORD_RE = re.compile(r'\b(And|To|Of|In|For|With|The)\b')
+
+# Phrase lists for the segment value checks, built once rather than per value.
+HEADING_DESCRIPTIVE_PHRASES = (
+    'increased', 'access to', 'growth rate', 'expected to', 'impact', 'trend', 'outlook',
+    'driven by', 'the largest', 'the dominant', 'patients with', 'g-csf is', 'targeted',
+    'treatments', 'improve patient', 'outcomes', 'healthcare', 'infrastructure',
+)
+SEGMENT_SENTENCE_VERBS = (
+    'is employed', 'are used', 'is used', 'are employed', 'focuses on', 'targeting',
+    'including', 'such as', 'helps in', 'provides', 'allows', 'enables', 'ensures',
+    'aims to', 'seeks to', 'designed to', 'used to', 'intended to',
+)
+# Region names a segment value may mention, and the broader keywords a region value must contain.
+# Every name contains one of the keywords, so a keyword hit also covers the names.
+REGION_NAMES = (
+    'north america', 'europe', 'asia-pacific', 'latin america', 'middle east', 'africa',
+    'asia pacific', 'lamea',
+)
+REGION_KEYWORDS = (
+    'north america', 'south america', 'europe', 'asia', 'pacific', 'latin america',
+    'middle east', 'africa', 'lamea', 'apac', 'emea', 'america', 'oceania',
+)
+REGION_NAME_RE = re.compile('|'.join(map(re.escape, REGION_NAMES)))
+REGION_KEYWORD_RE = re.compile('|'.join(map(re.escape, REGION_KEYWORDS)))
+INVALID_REGION_TERMS = (
+    'influence', 'market size', 'volume', 'diagnostics', 'methodology',
+    'process', 'research', 'data sources', 'government', 'regulatory',
+    'historical', 'overview', 'emerging', 'technological', 'stakeholders',
+)
+# Narrower list used while collecting colon headings for the region section
+NON_REGION_HEADING_TERMS = (
+    'influence', 'market size', 'volume', 'diagnostics', 'methodology', 'process', 'research', 'data sources',
+)
+# Single-word standalone headings that are never segment values
+HEADING_GENERIC_WORDS = frozenset(('impact', 'trend', 'outlook', 'growth', 'share', 'market', 'targeted'))
+# Generic single words rejected only as the whole value
+SEGMENT_GENERIC_VALUES = frozenset(('impact', 'trend', 'outlook', 'growth', 'share', 'targeted'))
+SEGMENT_INVALID_PHRASES = (
+    'increased', 'access to', 'growth rate', 'expected to', 'driven by',
+    'the largest', 'improve patient', 'treatments to', 'outcomes',
+    'healthcare infrastructure', 'reflects', 'differences in',
+    'definition and scope', 'overview of', 'research methodology', 'research process',
+    'primary and secondary', 'data sources', 'emerging opportunities', 'technological advances',
+    'across various', 'each targeting', 'each with', 'vary widely',
+    'government and regulatory', 'historical market', 'market size and volume',
+    'this is the most', 'this is the critical', 'dimension of segmentation',
+    'in 2024,', 'in 2024 ', 'the most critical dimension',
+)
+# Short connector words used to tell long descriptive sentences from segment names
+SENTENCE_CONNECTOR_WORDS = ('to', 'for', 'with', 'and', 'of', 'in', 'at', 'on', 'by')
+SENTENCE_PREPOSITIONS = frozenset(('to', 'for', 'with', 'of', 'in', 'at', 'on', 'by'))
+SEGMENT_DESCRIPTION_PHRASES = (
+    'the primary', 'this segment', 'this sub-segment', 'this application',
+    'the end users', 'the market', 'the largest', 'the dominant',
+    'this is the', 'the most critical',
+)
+HEADING_SENTENCE_INDICATORS = (
+    'is employed', 'are used', 'is used', 'are employed', 'focuses on',
+    'targeting', 'including', 'such as', 'helps in', 'provides',
+    'across various', 'each targeting', 'each with',
+)
+
+# One compiled alternation per phrase list: a single regex scan per value instead of a
+# Python-level loop over every phrase.
+HEADING_SENTENCE_INDICATOR_RE = re.compile('|'.join(map(re.escape, HEADING_SENTENCE_INDICATORS)))
+HEADING_DESCRIPTIVE_PHRASE_RE = re.compile('|'.join(map(re.escape, HEADING_DESCRIPTIVE_PHRASES)))
+SEGMENT_SENTENCE_VERB_RE = re.compile('|'.join(map(re.escape, SEGMENT_SENTENCE_VERBS)))
+INVALID_REGION_TERM_RE = re.compile('|'.join(map(re.escape, INVALID_REGION_TERMS)))
+NON_REGION_HEADING_TERM_RE = re.compile('|'.join(map(re.escape, NON_REGION_HEADING_TERMS)))
+SEGMENT_INVALID_PHRASE_RE = re.compile('|'.join(map(re.escape, SEGMENT_INVALID_PHRASES)))
+SEGMENT_DESCRIPTION_PHRASE_RE = re.compile('|'.join(map(re.escape, SEGMENT_DESCRIPTION_PHRASES)))
+
+def _lower_group(match):
+    """re.sub callback that lowercases the first group."""
+    return match.group(1).lower()
+
+def _clean_segment_value(val, section_type):
+    """Return a collected segment value in its final form, or None if it reads like description text."""
+    # Strip "(e.g., X)" from segment values so we get short form (e.g. "Internal Stabilization Systems" not "Internal Stabilization Systems (e.g., Internal...")
+    if "(e.g." in val:
+        val = val.split("(e.g.", 1)[0].strip()
+    if not val:
+        return None
+    val_lower = val.lower()
+
+    # Special handling for region section
+    if section_type == 'region':
+        # Must contain region keywords and no invalid terms
+        if not REGION_KEYWORD_RE.search(val_lower):
+            return None
+        if INVALID_REGION_TERM_RE.search(val_lower):
+            return None
+
+    # Skip if it contains sentence verbs/patterns (description text)
+    if SEGMENT_SENTENCE_VERB_RE.search(val_lower):
+        return None
+
+    # Skip if it's clearly not a valid segment value
+    if val_lower in SEGMENT_GENERIC_VALUES or SEGMENT_INVALID_PHRASE_RE.search(val_lower):
+        return None
+
+    # Skip if it's too long and looks like a description/sentence
+    if len(val) > 60 and any(word in val_lower for word in SENTENCE_CONNECTOR_WORDS):
+        # Count distinct prepositions - if too many, it's likely a sentence
+        if len(SENTENCE_PREPOSITIONS.intersection(val_lower.split())) > 2:
+            return None
+
+    # Skip if it starts with lowercase (likely part of a sentence)
+    if val[0].islower():
+        return None
+
+    # Skip if it contains common description phrases
+    if SEGMENT_DESCRIPTION_PHRASE_RE.search(val_lower):
+        return None
+
+    return val
+
+def _split_comma_values(value_text):
+    """Split a comma list into trimmed items, each cut before its first description verb."""
+    items = []
+    for item in value_text.split(','):
+        item = item.strip()
+        verb = VALUE_DESCRIPTION_SPLIT_RE.search(item)
+        items.append(item[:verb.start()] if verb else item)
+    return items
+
+def _format_segment(label, values, limit=6):
+    """Title part like "By Application (A, B, C)" listing at most `limit` values."""
+    return f"{label} ({', '.join(values[:limit])})"
+
+@lru_cache(maxsize=256)
+def _filename_keywords(filename_normalized):
+    """Filename keywords for the title scan: (keywords, keywords longer than 3 chars, matches needed)."""
+    keywords = tuple(w for w in filename_normalized.split() if w not in {'market', 'the', 'and', 'or', 'global'})
+    long_keywords = tuple(kw for kw in keywords if len(kw) > 3)
+    # For 2-word market names, require both words to match (more flexible)
+    # For longer names, require at least 2 keywords or 70% match
+    needed = max(2, min(len(keywords), 3)) if len(keywords) > 2 else len(keywords)
+    return keywords, long_keywords, needed
+
+def _has_keywords(text, keywords, needed):
+    """True once at least `needed` of `keywords` occur in `text`; stops counting at the threshold."""
+    if needed <= 0:
+        return True
+    for kw in keywords:
+        if kw in text:
+            needed -= 1
+            if not needed:
+                return True
+    return False
+
+def _market_title_prefix(clean_text):
+    """Text up to and including the first "market", or "" if a sentence ends before it."""
+    title_match = MARKET_PREFIX_TITLE_RE.match(clean_text)
+    return title_match.group(1).strip() if title_match else ""
+
+def _forecast_title_end(clean_text):
+    """End of the shortest prefix running through "market", "forecast" and two years, or -1 if there is none."""
+    # Positions are taken from clean_text itself: lower() can change the length (e.g. "İ"), so
+    # indices into the lowercased text would not line up
+    market = MARKET_WORD_RE.search(clean_text)
+    forecast = FORECAST_WORD_RE.search(clean_text, market.end()) if market else None
+    first_year = YEAR_RE.search(clean_text, forecast.end()) if forecast else None
+    second_year = YEAR_RE.search(clean_text, first_year.end()) if first_year else None
+    return second_year.end() if second_year else -1
+
+# Patterns for the extract_title fallback cascade (first-50 paragraph scan and title assembly).
+# Patterns only ever applied to lowercased text are compiled without re.I.
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+DIGIT_RANGE_RE = re.compile(r'(\d)\s*[-]\s*(\d)')
+BRIDGE_TO_LUNG_RE = re.compile(r'Bridge-To-Lung', re.I)
+GLOBAL_MARKET_TITLE_RE = re.compile(r'(?:^the\s+)?global\s+([^.]*?)\s+market', re.I)
+GLOBAL_PREFIX_RE = re.compile(r'^(?:The\s+)?Global\s+', re.I)
+TITLE_SEGMENT_BY_RE = re.compile(r'by\s+(?:application|product\s+type|type|end[-\s]*user|region|geography)')
+SEGMENTATION_HINT_RE = re.compile(r'by\s+(?:application|product\s+type|type|end[-\s]*user|region|geography|segment)')
+YEAR_RE = re.compile(r'20\d{2}')
+YEAR_SPAN_RE = re.compile(r'(20\d{2}.*?20\d{2})')
+NUMBERED_HEADING_RE = re.compile(r'\d+[\.\)]\s*')
+MARKET_PREFIX_TITLE_RE = re.compile(r'([^.]*?market)', re.I)
+MARKET_WORD_RE = re.compile(r'market', re.I)
+FORECAST_WORD_RE = re.compile(r'forecast', re.I)
+FORECAST_YEARS_RE = re.compile(r'forecast\s*[,:]\s*20\d{2}[\s\-–]20\d{2}')
+FORECAST_LABEL_RE = re.compile(r'forecast\s*[,:]')
+# Display order for mapped segment values; anything else keeps its order after these.
+TECHNOLOGY_VALUE_RANK = {'Molecular Diagnostics': 0, 'Flow Cytometry': 1, 'NGS': 2, 'Liquid Biopsy': 3, 'IHC': 4, 'Others': 5}
+GCSF_ENDUSER_RANK = {'Hospitals': 0, 'Oncology Clinics': 1, 'Ambulatory Surgical Centers': 2, 'Homecare Settings': 3}
+# Canonical capitalization for phase values, keyed by lowercase text
+PHASE_VALUE_NAMES = {'single phase': 'Single Phase', 'three phase': 'Three Phase'}
+
+# ------------------- Segment title parts -------------------
+# Each builder takes the values found under a segment header, the header text, the paragraph cache and
+# whether this is a G-CSF market, and returns (label, cleaned values) for one "By X (...)" title part.
+
+def _phase_title_part(values, header, paras, is_gcsf_market):
+    """Phase Type (power/electrical markets): trimmed values with canonical capitalization."""
+    cleaned_values = []
+    seen = set()
+    for val in values:
+        v = val.strip()
+        if not v:
+            continue
+        # normalize capitalization for common values
+        v = PHASE_VALUE_NAMES.get(v.lower(), v)
+        if v not in seen:
+            cleaned_values.append(v)
+            seen.add(v)
+    return "By Phase Type", cleaned_values
+
+def _output_power_title_part(values, header, paras, is_gcsf_market):
+    """Output Power (power/electrical markets): normalized values with en-dash ranges."""
+    cleaned_values = []
+    seen = set()
+    for val in values:
+        v = _norm(val)
+        if not v:
+            continue
+        # ensure we use en-dash between numeric ranges
+        v = DIGIT_RANGE_RE.sub(rf'\1{DASH}\2', v)
+        if v not in seen:
+            cleaned_values.append(v)
+            seen.add(v)
+    return "By Output Power", cleaned_values
+
+def _diagnostic_title_part(values, header, paras, is_gcsf_market):
+    """Technology/Type: Diagnostic Technology names for medical markets, else a generic Product Type."""
+    segment_text = header.lower()
+    is_generic_type = 'type' in segment_text  # also covers "product type"
+
+    # Clean up values - map to expected names for medical, preserve for generic
+    cleaned_values = []
+    seen = set()
+    for val in values:
+        val_lower = val.lower()
+        if 'molecular diagnostics' in val_lower and 'Molecular Diagnostics' not in seen:
+            cleaned_values.append('Molecular Diagnostics')
+            seen.add('Molecular Diagnostics')
+        if 'flow cytometry' in val_lower and 'Flow Cytometry' not in seen:
+            cleaned_values.append('Flow Cytometry')
+            seen.add('Flow Cytometry')
+        if ('ngs' in val_lower or 'next generation sequencing' in val_lower or 'next-gen sequencing' in val_lower) and 'NGS' not in seen:
+            cleaned_values.append('NGS')
+            seen.add('NGS')
+        if 'liquid biopsy' in val_lower and 'Liquid Biopsy' not in seen:
+            cleaned_values.append('Liquid Biopsy')
+            seen.add('Liquid Biopsy')
+        if ('immunohistochemistry' in val_lower or ('ihc' in val_lower and val_lower != 'others')) and 'IHC' not in seen:
+            cleaned_values.append('IHC')
+            seen.add('IHC')
+        if ('others' in val_lower or val == 'Others') and 'Others' not in seen:
+            cleaned_values.append('Others')
+            seen.add('Others')
+
+    # Also search document-wide for NGS and Liquid Biopsy if not found
+    # One pass over the document serves both lookups
+    need_ngs = 'NGS' not in seen
+    need_liquid = 'Liquid Biopsy' not in seen
+    found_ngs = found_liquid = False
+    if need_ngs or need_liquid:
+        for para in paras:
+            text_lower = para.lower
+            # Same window as the first 100 characters of the unstripped text
+            if 'diagnostic' not in text_lower[:max(0, 100 - para.lead)]:
+                continue
+            if need_ngs and not found_ngs and ('ngs' in text_lower or 'next generation sequencing' in text_lower):
+                found_ngs = True
+            if need_liquid and not found_liquid and 'liquid biopsy' in text_lower:
+                found_liquid = True
+            if found_ngs == need_ngs and found_liquid == need_liquid:
+                break
+    if found_ngs:
+        cleaned_values.append('NGS')
+        seen.add('NGS')
+    if found_liquid:
+        cleaned_values.append('Liquid Biopsy')
+        seen.add('Liquid Biopsy')
+
+    # Use "By Technology" for medical markets
+    if cleaned_values:
+        # cleaned_values holds no duplicates, so a stable sort gives the preferred order
+        cleaned_values.sort(key=lambda v: TECHNOLOGY_VALUE_RANK.get(v, len(TECHNOLOGY_VALUE_RANK)))
+        return "By Technology", cleaned_values
+    if is_generic_type:
+        # Generic type segmentation - clean up values
+        cleaned_values = []
+        seen = set()
+        for val in values:
+            val_lower = val.lower()
+            # Map G-CSF specific values
+            if 'innovator' in val_lower and 'g-csf' in val_lower:
+                # Clean "Innovator G-CSF Drugs" to "Innovator G-CSF"
+                cleaned_values.append('Innovator G-CSF')
+                seen.add('Innovator G-CSF')
+            elif 'biosimilar' in val_lower:
+                cleaned_values.append('Biosimilars')
+                seen.add('Biosimilars')
+            elif val not in seen:
+                cleaned_values.append(val)
+                seen.add(val)
+        # Use "by Type" for G-CSF markets, "By Product Type" for others
+        if 'type of product' in segment_text or is_gcsf_market:
+            return "by Type", cleaned_values
+        return "By Product Type", cleaned_values
+    # Default: preserve values and use "By Product Type" for generic markets
+    return "By Product Type", [val for val in values if len(val) < 50][:6]
+
+def _treatment_title_part(values, header, paras, is_gcsf_market):
+    """Application (Treatment/Application): known applications mapped, generic ones preserved."""
+    # Clean up values - preserve original for generic markets
+    cleaned_values = []
+    seen = set()
+    for val in values:
+        val_lower = val.lower()
+        # Medical-specific mappings
+        if 'disease diagnosis' in val_lower:
+            cleaned_values.append('Disease Diagnosis')
+            seen.add('Disease Diagnosis')
+        elif 'prognostic' in val_lower:
+            cleaned_values.append('Prognostic Determination')
+            seen.add('Prognostic Determination')
+        elif 'treatment monitoring' in val_lower:
+            cleaned_values.append('Treatment Monitoring')
+            seen.add('Treatment Monitoring')
+        elif 'recurrence' in val_lower:
+            cleaned_values.append('Recurrence Detection')
+            seen.add('Recurrence Detection')
+        # G-CSF specific mappings
+        elif 'chemotherapy-induced neutropenia' in val_lower:
+            if 'Chemotherapy-Induced Neutropenia' not in seen:
+                cleaned_values.append('Chemotherapy-Induced Neutropenia')
+                seen.add('Chemotherapy-Induced Neutropenia')
+        elif 'bone marrow failure' in val_lower:
+            if 'Bone Marrow Failure' not in seen:
+                cleaned_values.append('Bone Marrow Failure')
+                seen.add('Bone Marrow Failure')
+        elif ('stem cell transplantation' in val_lower or 'hematopoietic stem cell' in val_lower or 
+              'post-hematopoietic' in val_lower):
+            if 'Stem Cell Transplantation' not in seen:
+                cleaned_values.append('Stem Cell Transplantation')
+                seen.add('Stem Cell Transplantation')
+        elif 'chronic neutropenia' in val_lower:
+            if 'Chronic Neutropenia' not in seen:
+                cleaned_values.append('Chronic Neutropenia')
+                seen.add('Chronic Neutropenia')
+        elif val not in seen:
+            # For generic markets, preserve as-is but clean up
+            # Fix specific capitalization issues
+            # Fix "Bridge-To-Lung" -> "Bridge-to-Lung"
+            if 'bridge' in val_lower and 'lung' in val_lower:
+                val = BRIDGE_TO_LUNG_RE.sub('Bridge-to-Lung', val)
+            # Map "Other Applications" to "Industrial" if needed
+            if 'other' in val_lower and 'industrial' in val_lower:
+                if 'Industrial' not in seen:
+                    cleaned_values.append('Industrial')
+                    seen.add('Industrial')
+            elif 'other application' in val_lower:
+                # Skip "Other Applications" if we have Industrial already
+                if 'Industrial' not in seen:
+                    cleaned_values.append('Industrial')
+                    seen.add('Industrial')
+            else:
+                cleaned_values.append(val)
+                seen.add(val)
+    # Keep consistent capitalization for titles
+    return "By Application", cleaned_values
+
+def _enduser_title_part(values, header, paras, is_gcsf_market):
+    """End-User Industry: known end users mapped to standard names, others preserved."""
+    # Clean up values - preserve all found values
+    cleaned_values = []
+    seen = set()
+
+    for val in values:
+        val_lower = val.lower()
+        # Medical-specific mappings
+        if 'hospitals' in val_lower:
+            if 'Hospitals' not in seen:
+                cleaned_values.append('Hospitals')
+                seen.add('Hospitals')
+        elif 'diagnostic laborator' in val_lower:
+            if 'Diagnostic Laboratories' not in seen:
+                cleaned_values.append('Diagnostic Laboratories')
+                seen.add('Diagnostic Laboratories')
+        elif 'research' in val_lower and ('institut' in val_lower or 'academic' in val_lower):
+            if 'Research Institutions' not in seen:
+                cleaned_values.append('Research Institutions')
+                seen.add('Research Institutions')
+        # G-CSF specific end-user mappings
+        elif 'hospital' in val_lower:
+            if 'Hospitals' not in seen:
+                cleaned_values.append('Hospitals')
+                seen.add('Hospitals')
+        elif 'oncology clinic' in val_lower:
+            if 'Oncology Clinics' not in seen:
+                cleaned_values.append('Oncology Clinics')
+                seen.add('Oncology Clinics')
+        elif 'ambulatory' in val_lower and ('surgical' in val_lower or 'surgery' in val_lower):
+            if 'Ambulatory Surgical Centers' not in seen:
+                cleaned_values.append('Ambulatory Surgical Centers')
+                seen.add('Ambulatory Surgical Centers')
+        elif 'homecare' in val_lower or 'home care' in val_lower:
+            if 'Homecare Settings' not in seen:
+                cleaned_values.append('Homecare Settings')
+                seen.add('Homecare Settings')
+        elif 'pharmaceutical' in val_lower:
+            if 'Pharmaceuticals' not in seen:
+                # Map to "Pharmaceuticals" or "Pharmaceutical Industry"
+                if 'industry' in val_lower:
+                    cleaned_values.append('Pharmaceuticals')
+                    seen.add('Pharmaceuticals')
+                else:
+                    cleaned_values.append('Pharmaceuticals')
+                    seen.add('Pharmaceuticals')
+        elif 'food' in val_lower:
+            if 'Food Industry' not in seen:
+                cleaned_values.append('Food Industry')
+                seen.add('Food Industry')
+        elif 'cosmetic' in val_lower:
+            if 'Cosmetics & Personal Care' not in seen:
+                cleaned_values.append('Cosmetics & Personal Care')
+                seen.add('Cosmetics & Personal Care')
+        elif 'agricultural' in val_lower or 'agriculture' in val_lower:
+            if 'Agriculture' not in seen:
+                cleaned_values.append('Agriculture')
+                seen.add('Agriculture')
+        elif 'industrial' in val_lower or 'other' in val_lower:
+            if 'Industrial' not in seen:
+                cleaned_values.append('Industrial')
+                seen.add('Industrial')
+        elif val not in seen:
+            # Preserve original value
+            cleaned_values.append(val)
+            seen.add(val)
+
+    # For G-CSF markets, also search document-wide for "Ambulatory Surgical Centers" if not found
+    if is_gcsf_market and 'Ambulatory Surgical Centers' not in seen:
+        for para in paras:
+            para_text_lower = para.lower
+            if 'ambulatory' in para_text_lower and ('surgical center' in para_text_lower or 'asc' in para_text_lower):
+                cleaned_values.append('Ambulatory Surgical Centers')
+                seen.add('Ambulatory Surgical Centers')
+                break
+
+    # For G-CSF markets, ensure correct order: Hospitals, Oncology Clinics, Ambulatory Surgical Centers, Homecare Settings
+    # (values outside the preferred order follow in their original order)
+    if is_gcsf_market and cleaned_values:
+        cleaned_values.sort(key=lambda v: GCSF_ENDUSER_RANK.get(v, len(GCSF_ENDUSER_RANK)))
+
+    # Use "by End-User" for G-CSF, "By End User" for others (remove "Industry")
+    if is_gcsf_market:
+        return "by End-User", cleaned_values
+    # Check if segment text says "By End User" (without Industry)
+    if 'industry' not in header.lower():
+        return "By End User", cleaned_values
+    return "By End-User Industry", cleaned_values
+
+def _distribution_title_part(values, header, paras, is_gcsf_market):
+    """Distribution Channel: retail channels mapped to standard names, others preserved."""
+    # Clean up values
+    cleaned_values = []
+    seen = set()
+    for val in values:
+        val_lower = val.lower()
+        # Map to standard names
+        if 'supermarket' in val_lower or 'hypermarket' in val_lower:
+            if 'Supermarkets' not in seen:
+                cleaned_values.append('Supermarkets')
+                seen.add('Supermarkets')
+        elif 'online' in val_lower and 'retail' in val_lower:
+            if 'Online Retail' not in seen:
+                cleaned_values.append('Online Retail')
+                seen.add('Online Retail')
+        elif 'convenience' in val_lower and 'store' in val_lower:
+            if 'Convenience Stores' not in seen:
+                cleaned_values.append('Convenience Stores')
+                seen.add('Convenience Stores')
+        elif 'foodservice' in val_lower or 'food service' in val_lower:
+            if 'Foodservice' not in seen:
+                cleaned_values.append('Foodservice')
+                seen.add('Foodservice')
+        elif val not in seen:
+            cleaned_values.append(val)
+            seen.add(val)
+
+    return ("by Distribution Channel" if is_gcsf_market else "By Distribution Channel"), cleaned_values
+
+# Segment title parts in title order (Geography is added separately); order matters for consistency
+SEGMENT_TITLE_BUILDERS = (
+    ('phase', _phase_title_part),
+    ('output_power', _output_power_title_part),
+    ('diagnostic', _diagnostic_title_part),
+    ('treatment', _treatment_title_part),
+    ('enduser', _enduser_title_part),
+    ('distribution', _distribution_title_part),
+)
+
 def paragraph_to_html(para):
     text = para.text.strip()
     if not text:
@@ -1589,42 +2216,46 @@ def runs_to_html(runs):
             parts.append(txt)
     return "".join(parts).strip()
 
-def extract_title(docx_path: str) -> str:
-    doc = Document(docx_path)
+def extract_title(docx_path: str, doc=None) -> str:
+    if doc is None:
+        doc = Document(docx_path)
     filename = os.path.splitext(os.path.basename(docx_path))[0]
     filename_low = filename.lower()
-    blocks = [(p, (p.text or "").strip()) for p in doc.paragraphs if (p.text or "").strip()]
+    # Paragraph text is read from the document once; every pass below works on this cache
+    paras = _paragraph_cache(doc)
+    blocks = [para.text for para in paras if para.text]
 
     # Priority -1: standalone "Report Title (Long-Form)" or "Long-Form Report Title" -> title may be next paragraph or same para after newline (Moved_Files_26 style)
-    for i, (_, text) in enumerate(blocks):
+    for i, text in enumerate(blocks):
         clean = remove_emojis(text)
         # Same paragraph can be "A.1. Long-Form Report Title:\nMedical Nonwoven... Market By ... Forecast, 2024–2030"
         if "\n" in clean:
-            first_line = clean.split("\n", 1)[0].strip()
-            rest = clean.split("\n", 1)[1].strip() if "\n" in clean else ""
+            first_line, _, rest = clean.partition("\n")
+            first_line = first_line.strip()
+            rest = rest.strip()
             if HEADER_LINE_RE.match(first_line) and len(rest) >= 40:
                 low = rest.lower()
-                by_count = len(re.findall(r"\bby\s+\w", low))
+                by_count = len(BY_SEGMENT_RE.findall(low))
                 has_seg = "segment revenue estimation" in low and "forecast" in low
-                has_yr = bool(re.search(r"20\d{2}\s*[\-–]\s*20\d{2}", rest))
+                has_yr = _year_range_present(rest)
                 if (has_seg and has_yr) or (by_count >= 2 and "market" in low and has_yr):
                     return _ensure_filename_start_and_year(_norm(rest), filename)
         if not HEADER_LINE_RE.match(clean):
             continue
         if i + 1 >= len(blocks):
             break
-        next_text = remove_emojis(blocks[i + 1][1])
+        next_text = remove_emojis(blocks[i + 1])
         if len(next_text) < 40:
             continue
         low = next_text.lower()
-        by_count = len(re.findall(r"\bby\s+\w", low))
+        by_count = len(BY_SEGMENT_RE.findall(low))
         has_seg = "segment revenue estimation" in low and "forecast" in low
-        has_yr = bool(re.search(r"20\d{2}\s*[\-–]\s*20\d{2}", next_text))
+        has_yr = _year_range_present(next_text)
         if (has_seg and has_yr) or (by_count >= 2 and "market" in low and has_yr):
             return _ensure_filename_start_and_year(_norm(next_text), filename)
 
     # Priority 0: inline "Report Title (Long-Form) ..." lines
-    for _, text in blocks:
+    for text in blocks:
         inline = _extract_labeled_inline_title(remove_emojis(text))
         if inline:
             return _ensure_filename_start_and_year(inline, filename)
@@ -1637,7 +2268,7 @@ def extract_title(docx_path: str) -> str:
                     return _ensure_filename_start_and_year(inline, filename)
 
     capture = False
-    for _, text in blocks:
+    for text in blocks:
         text = remove_emojis(text)
         if capture:
             return _ensure_filename_start_and_year(text, filename)
@@ -1669,7 +2300,7 @@ def extract_title(docx_path: str) -> str:
 
     # Collect paragraphs that look like the doc title (filename + forecast); prefer exact short form (no "(e.g.").
     filename_forecast_candidates = []
-    for _, text in blocks:
+    for text in blocks:
         low = text.lower()
         if low.startswith("full report title") or low.startswith("full title"):
             inline = _inline_title(text)
@@ -1705,29 +2336,29 @@ def extract_title(docx_path: str) -> str:
     )
     
     # Check all paragraphs for detailed title pattern
-    for para_idx, para in enumerate(doc.paragraphs):
-        text = para.text.strip()
+    for para_idx, para in enumerate(paras):
+        text = para.text
         if not text:
             continue
         
-        clean_text = remove_emojis(text)
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        clean_text = WHITESPACE_RUN_RE.sub(' ', remove_emojis(text)).strip()
+        clean_lower = clean_text.lower()
         
         # Check if this paragraph contains the detailed segmented title pattern
         # Must have "By Treatment Type" and "By Diagnostic Approach" and "Forecast" and year range
-        if ('by treatment type' in clean_text.lower() and 
-            'by diagnostic approach' in clean_text.lower() and
-            'forecast' in clean_text.lower() and
-            re.search(r'20\d{2}.*?20\d{2}', clean_text)):
+        if ('by treatment type' in clean_lower and 
+            'by diagnostic approach' in clean_lower and
+            'forecast' in clean_lower and
+            YEAR_SPAN_RE.search(clean_text)):
             
             # Verify it contains the market name (filename keywords)
             filename_keywords = [w for w in filename_normalized.replace(' market', '').split() if w and len(w) > 2]
-            matching_keywords = sum(1 for kw in filename_keywords if kw.lower() in clean_text.lower())
+            matching_keywords = sum(1 for kw in filename_keywords if kw in clean_lower)
             
             # If it matches enough keywords or contains the pattern, extract it
             if matching_keywords >= min(2, len(filename_keywords)) or detailed_title_pattern2.search(clean_text):
                 # Find the end (year range) first
-                year_match = re.search(r'(20\d{2}.*?20\d{2})', clean_text)
+                year_match = YEAR_SPAN_RE.search(clean_text)
                 if not year_match:
                     continue
                 
@@ -1779,9 +2410,17 @@ def extract_title(docx_path: str) -> str:
     segmentation_found = False
     segments = {}
     
+    # Cheap precheck: with fewer than two segment families anywhere, neither the
+    # constructed title nor the inline detailed match below can succeed.
+    full_text_lower = remove_emojis('\n'.join(para.text for para in paras)).lower()
+    family_hits = sum(
+        1 for family in SEGMENT_KEYWORD_FAMILIES
+        if any(kw in full_text_lower for kw in family)
+    )
+    
     # Look for segmentation sections (By Treatment Type, By Diagnostic Approach, By End-User, By Region)
-    for para_idx, para in enumerate(doc.paragraphs):
-        text = para.text.strip()
+    for para_idx, para in enumerate(paras if family_hits >= 2 else ()):
+        text = para.text
         if not text:
             continue
         
@@ -1796,7 +2435,7 @@ def extract_title(docx_path: str) -> str:
                 and (
                     len(clean_text) < 120
                     or clean_text_lower.startswith('by phase type')
-                    or re.match(r'^by\s+phase\s+type\s', clean_text_lower)
+                    or BY_PHASE_TYPE_HEADER_RE.match(clean_text_lower)
                 )
             ):
                 segments['phase'] = clean_text
@@ -1810,7 +2449,7 @@ def extract_title(docx_path: str) -> str:
                     len(clean_text) < 140
                     or clean_text_lower.startswith('by output power')
                     or clean_text_lower.startswith('by power output')
-                    or re.match(r'^by\s+(?:output\s+power|power\s+output)\s', clean_text_lower)
+                    or BY_OUTPUT_POWER_HEADER_RE.match(clean_text_lower)
                 )
             ):
                 segments['output_power'] = clean_text
@@ -1827,7 +2466,7 @@ def extract_title(docx_path: str) -> str:
                 (len(clean_text) < 100 or 
                  clean_text_lower.startswith('by application') or 
                  clean_text_lower.startswith('by treatment type') or
-                 re.match(r'^by\s+(?:treatment\s+type|application)\s', clean_text_lower))):
+                 BY_APPLICATION_HEADER_RE.match(clean_text_lower))):
                 # This is likely a section header, mark it for extraction
                 segments['treatment'] = clean_text
                 segmentation_found = True
@@ -1844,7 +2483,7 @@ def extract_title(docx_path: str) -> str:
                  clean_text_lower.startswith('by product type') or 
                  clean_text_lower.startswith('by type') or
                  clean_text_lower.startswith('by diagnostic') or
-                 re.match(r'^by\s+(?:product\s+)?type\s', clean_text_lower))):
+                 BY_PRODUCT_TYPE_HEADER_RE.match(clean_text_lower))):
                 # This is likely a section header, mark it for extraction
                 if 'diagnostic' not in segments:  # Only set if not already set by medical-specific pattern
                     segments['diagnostic'] = clean_text
@@ -1857,7 +2496,7 @@ def extract_title(docx_path: str) -> str:
                 (len(clean_text) < 100 or 
                  clean_text_lower.startswith('by end user') or 
                  clean_text_lower.startswith('by end-user') or
-                 re.match(r'^by\s+end[-\s]?user\s', clean_text_lower))):
+                 BY_END_USER_HEADER_RE.match(clean_text_lower))):
                 # This is likely a section header, mark it for extraction
                 segments['enduser'] = clean_text
                 segmentation_found = True
@@ -1877,7 +2516,7 @@ def extract_title(docx_path: str) -> str:
                 (len(clean_text) < 100 or 
                  clean_text_lower.startswith('by region') or 
                  clean_text_lower.startswith('by geography') or
-                 re.match(r'^by\s+(?:region|geography)\s', clean_text_lower))):
+                 BY_REGION_HEADER_RE.match(clean_text_lower))):
                 # This is likely a section header, mark it for extraction
                 segments['region'] = clean_text
                 segmentation_found = True
@@ -1904,11 +2543,12 @@ def extract_title(docx_path: str) -> str:
         # Collect actual values from following paragraphs after section headers
         # Store paragraph indices for each segment
         segment_indices = {}
-        for para_idx, para in enumerate(doc.paragraphs):
-            text = para.text.strip()
+        for para_idx, para in enumerate(paras):
+            text = para.text
             if not text:
                 continue
-            clean_text_lower = text.lower()
+            clean_text_lower = para.lower
+            text_len = para.length
             
             # Exclude "Market Analysis by..." patterns
             if 'market analysis' in clean_text_lower:
@@ -1917,46 +2557,52 @@ def extract_title(docx_path: str) -> str:
             # Check for segment headers - also handle longer paragraphs that start with "By X, ..."
             # Use more flexible matching - check if text starts with "By X" (with optional comma)
             if 'by phase type' in clean_text_lower:
-                if len(text) < 140 or clean_text_lower.startswith('by phase type') or re.match(r'^by\s+phase\s+type\s', clean_text_lower):
+                if text_len < 140 or clean_text_lower.startswith('by phase type') or BY_PHASE_TYPE_HEADER_RE.match(clean_text_lower):
                     segment_indices['phase'] = para_idx
             elif 'by output power' in clean_text_lower or 'by power output' in clean_text_lower:
-                if len(text) < 160 or clean_text_lower.startswith('by output power') or clean_text_lower.startswith('by power output') or re.match(r'^by\s+(?:output\s+power|power\s+output)\s', clean_text_lower):
+                if text_len < 160 or clean_text_lower.startswith('by output power') or clean_text_lower.startswith('by power output') or BY_OUTPUT_POWER_HEADER_RE.match(clean_text_lower):
                     segment_indices['output_power'] = para_idx
             elif ('by diagnostic technology' in clean_text_lower or 'by diagnostic approach' in clean_text_lower or 
                  ('by type' in clean_text_lower and 'by phase type' not in clean_text_lower) or 'by product type' in clean_text_lower or 'by type of product' in clean_text_lower):
                 # Allow short headers OR paragraphs that start with "By X" (even if longer)
-                if len(text) < 100 or clean_text_lower.startswith('by product type') or clean_text_lower.startswith('by type') or clean_text_lower.startswith('by diagnostic') or re.match(r'^by\s+(?:product\s+)?type\s', clean_text_lower):
+                if text_len < 100 or clean_text_lower.startswith('by product type') or clean_text_lower.startswith('by type') or clean_text_lower.startswith('by diagnostic') or BY_PRODUCT_TYPE_HEADER_RE.match(clean_text_lower):
                     if 'diagnostic' not in segment_indices:  # Only set if not already set
                         segment_indices['diagnostic'] = para_idx
             elif 'by treatment type' in clean_text_lower or 'by application' in clean_text_lower:
                 # Allow short headers OR paragraphs that start with "By X"
-                if len(text) < 100 or clean_text_lower.startswith('by application') or clean_text_lower.startswith('by treatment type') or re.match(r'^by\s+(?:treatment\s+type|application)\s', clean_text_lower):
+                if text_len < 100 or clean_text_lower.startswith('by application') or clean_text_lower.startswith('by treatment type') or BY_APPLICATION_HEADER_RE.match(clean_text_lower):
                     segment_indices['treatment'] = para_idx
             elif 'by end-user' in clean_text_lower or 'by end user' in clean_text_lower:
                 # Allow short headers OR paragraphs that start with "By X"
-                if len(text) < 100 or clean_text_lower.startswith('by end user') or clean_text_lower.startswith('by end-user') or re.match(r'^by\s+end[-\s]?user\s', clean_text_lower):
+                if text_len < 100 or clean_text_lower.startswith('by end user') or clean_text_lower.startswith('by end-user') or BY_END_USER_HEADER_RE.match(clean_text_lower):
                     segment_indices['enduser'] = para_idx
             elif 'by distribution channel' in clean_text_lower:
                 # Allow short headers OR paragraphs that start with "By X"
-                if len(text) < 100 or clean_text_lower.startswith('by distribution channel') or re.match(r'^by\s+distribution\s+channel\s', clean_text_lower):
+                if text_len < 100 or clean_text_lower.startswith('by distribution channel') or BY_DISTRIBUTION_HEADER_RE.match(clean_text_lower):
                     segment_indices['distribution'] = para_idx
             elif 'by region' in clean_text_lower or 'by geography' in clean_text_lower:
                 # Allow short headers OR paragraphs that start with "By X"
-                if len(text) < 100 or clean_text_lower.startswith('by region') or clean_text_lower.startswith('by geography') or re.match(r'^by\s+(?:region|geography)\s', clean_text_lower):
+                if text_len < 100 or clean_text_lower.startswith('by region') or clean_text_lower.startswith('by geography') or BY_REGION_HEADER_RE.match(clean_text_lower):
                     segment_indices['region'] = para_idx
         
         # Extract actual values from paragraphs following headers
         # Also search document-wide for certain values that might be mentioned elsewhere
         def extract_segment_values(para_idx, section_type='', max_paras=20):
             """Extract segment values from paragraphs following the header"""
+            # section_type is fixed for the whole call; branch on a local flag instead of comparing strings
+            is_region_section = section_type == 'region'
             values = []
-            exclude_phrases = ['market analysis', 'market share', 'this segment', 'this area', 'this region', 'key stakeholders', 'projected share']
+            values_seen = set()  # mirrors values for O(1) duplicate checks
+            
+            def add_value(value):
+                values.append(value)
+                values_seen.add(value)
+            
             skip_intro = True  # Skip first paragraph which is often introductory
-            region_names = ['north america', 'europe', 'asia-pacific', 'latin america', 'middle east', 'africa', 'asia pacific', 'lamea']
             
             # Check if the segment header paragraph itself contains values (e.g., "By Product Type, the market is divided into X, Y, Z")
             # Also check if header is "By X" followed by description on same line
-            header_para = doc.paragraphs[para_idx].text.strip()
+            header_para = paras[para_idx].text
             if header_para and len(header_para) > 20:
                 # Try to extract values from the header paragraph itself
                 # Look for patterns like "divided into X, Y, and Z" or "finds usage in X, Y, Z" or "spans X, Y, Z"
@@ -1967,40 +2613,24 @@ def extract_title(docx_path: str) -> str:
                 # Pattern: "By Product Type\nInjectables remain..." or "By Application\nFacial aesthetics..."
                 if re.match(r'^by\s+', header_lower):
                     # Split by newline - first part is header, rest is description
-                    parts = header_para.split('\n', 1)
-                    if len(parts) > 1:
-                        description = parts[1].strip()
+                    _, newline, description = header_para.partition('\n')
+                    if newline:
+                        description = description.strip()
                         # Extract values from description
                         header_lower = description.lower()
                         header_para = description  # Use description for value extraction
                 
                 # Common patterns: "divided into", "finds usage in", "spans", "includes", "comprises", "distributed across"
                 # Also check for "encompassing", "remains", "represents", "are", etc.
-                if any(pattern in header_lower for pattern in [
-                    'divided into',
-                    'finds usage in',
-                    'applications across',
-                    'find applications across',
-                    'available across',
-                    'spans',
-                    'includes',
-                    'comprises',
-                    'distributed across',
-                    'usage in',
-                    'encompassing',
-                    'remains',
-                    'represents',
-                    'leading',
-                    'category',
-                    'area',
-                ]):
+                if any(pattern in header_lower for pattern in SEGMENT_HEADER_TRIGGERS):
                     # Extract values from the header paragraph
                     # More specific patterns for different segment types
+                    header_triggers = {m.lastgroup for m in SEGMENT_HEADER_TRIGGER_RE.finditer(header_para)}
                     # Pattern 1: "encompassing X, Y, and Z" (e.g., "encompassing botulinum toxin, dermal fillers, and collagen stimulators")
-                    encompassing_match = re.search(r'encompassing\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
+                    encompassing_match = re.search(r'encompassing\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE) if 'encompassing' in header_triggers else None
                     if encompassing_match:
                         value_text = encompassing_match.group(1).strip()
-                        value_parts = re.split(r',\s*(?:and\s+)?', value_text)
+                        value_parts = VALUE_LIST_SPLIT_RE.split(value_text)
                         for part in value_parts:
                             part = part.strip()
                             if part:
@@ -2012,15 +2642,15 @@ def extract_title(docx_path: str) -> str:
                                     if len(main_value) < 100 and main_value.lower() not in ['the', 'market', 'segment']:
                                         main_value = re.sub(r'^(the|a|an)\s+', '', main_value, flags=re.I).strip()
                                         if main_value:
-                                            values.append(main_value)
+                                            add_value(main_value)
                     
                     # Pattern 1b: "divided into X, Y, and Z" or "divided into X, Y, Z" or "broadly divided into"
-                    divided_match = re.search(r'(?:broadly\s+)?divided into\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
+                    divided_match = re.search(r'(?:broadly\s+)?divided into\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE) if 'divided' in header_triggers else None
                     if divided_match:
                         value_text = divided_match.group(1).strip()
                         # Split by comma and handle "and" before last item
                         # Handle "X, Y, and Z" pattern
-                        value_parts = re.split(r',\s*(?:and\s+)?', value_text)
+                        value_parts = VALUE_LIST_SPLIT_RE.split(value_text)
                         for part in value_parts:
                             part = part.strip()
                             # Extract just the main value (before any description)
@@ -2035,7 +2665,7 @@ def extract_title(docx_path: str) -> str:
                                         main_value = main_value.title()
                                         # Fix common issues: "And" -> "and", "To" -> "to", "Of" -> "of" (but not in abbreviations like "ECMO")
                                         if 'ecmo' not in main_value.lower():
-                                            main_value = re.sub(r'\b(And|To|Of|In|For|With|The)\b', lambda m: m.group(1).lower(), main_value)
+                                            main_value = CONNECTOR_WORD_RE.sub(_lower_group, main_value)
                                         # But keep first word and acronyms capitalized
                                         if main_value:
                                             main_value = main_value[0].upper() + main_value[1:]
@@ -2045,7 +2675,7 @@ def extract_title(docx_path: str) -> str:
                                         # Clean up common prefixes
                                         main_value = re.sub(r'^(the|a|an)\s+', '', main_value, flags=re.I).strip()
                                         if main_value:
-                                            values.append(main_value)
+                                            add_value(main_value)
                     
                     # Pattern 2a: "represents the dominant application area" -> extract from sentence
                     # Pattern: "X represents..." or "X remains..." where X is the value
@@ -2057,32 +2687,29 @@ def extract_title(docx_path: str) -> str:
                             first_value = first_cap_match.group(1).strip()
                             # Remove any trailing words before "represents" or "remains"
                             first_value = re.split(r'\s+(?:represents|remains|is|are|account)', first_value, 1)[0].strip()
-                            # Title case for multi-word
+                            # The ^[A-Z] anchor above guarantees the value is already capitalized
                             if first_value and len(first_value) < 50 and first_value.lower() not in ['the', 'by', 'market']:
-                                # Capitalize if needed
-                                if first_value[0].islower():
-                                    first_value = first_value.title()
-                                values.append(first_value)
+                                add_value(first_value)
                     
                     # Pattern 2b: "leading service providers" -> extract values
                     # Pattern: "X, Y, and Z are the leading..."
-                    leading_match = re.search(r'^([^.]+?)\s+(?:are|is)\s+the\s+(?:leading|dominant)', header_para, re.IGNORECASE)
+                    leading_match = re.search(r'^([^.]+?)\s+(?:are|is)\s+the\s+(?:leading|dominant)', header_para, re.IGNORECASE) if 'leading' in header_triggers else None
                     if leading_match:
                         value_text = leading_match.group(1).strip()
-                        value_parts = re.split(r',\s*(?:and\s+)?', value_text)
+                        value_parts = VALUE_LIST_SPLIT_RE.split(value_text)
                         for part in value_parts:
                             part = part.strip()
                             if part and len(part) > 3 and part[0].isupper():
                                 if len(part) < 80:
-                                    values.append(part)
+                                    add_value(part)
                     
                     # Pattern 2c: "finds usage in X, Y, Z" or "finds usage in X, Y, and Z"
-                    usage_match = re.search(r'finds usage in\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
+                    usage_match = re.search(r'finds usage in\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE) if 'usage' in header_triggers else None
                     if usage_match:
                         value_text = usage_match.group(1).strip()
                         # Extract values, handling parentheses like "(ARDS)"
                         # Split by comma, but handle "and" before last item
-                        value_parts = re.split(r',\s*(?:and\s+)?', value_text)
+                        value_parts = VALUE_LIST_SPLIT_RE.split(value_text)
                         for part in value_parts:
                             part = part.strip()
                             if part:
@@ -2115,26 +2742,22 @@ def extract_title(docx_path: str) -> str:
                                             # Title case the main part, but handle multi-word properly
                                             main_part = main_part.title()
                                             # Fix common issues: "And" -> "and", "To" -> "to", "Of" -> "of"
-                                            # But keep "To" in phrases like "Bridge-to-Lung" as lowercase
-                                            main_part = re.sub(r'\b(And|To|Of|In|For|With|The)\b', lambda m: m.group(1).lower(), main_part)
-                                            # Fix hyphenated phrases: "Bridge-To-Lung" -> "Bridge-to-Lung" or "Trauma-Induced" -> "Trauma-Induced" (keep "Induced" capitalized)
-                                            # Handle "Bridge-To-Lung" pattern
-                                            main_part = re.sub(r'([A-Z][a-z]+)-To-([A-Z][a-z]+)', r'\1-to-\2', main_part)
-                                            # Handle "Bridge-to-Lung" already correct
-                                            main_part = re.sub(r'([A-Z][a-z]+)-to-([A-Z][a-z]+)', r'\1-to-\2', main_part)
+                                            # This also turns "Bridge-To-Lung" into "Bridge-to-Lung" ("-" is a word boundary)
+                                            # while "Trauma-Induced" keeps "Induced" capitalized
+                                            main_part = CONNECTOR_WORD_RE.sub(_lower_group, main_part)
                                             # But keep first word capitalized
                                             if main_part:
                                                 main_part = main_part[0].upper() + main_part[1:]
                                             main_value = f"{main_part} ({abbrev})"
                                     if len(main_value) < 100:  # Increased limit for longer values
-                                        values.append(main_value)
+                                        add_value(main_value)
 
                     # Pattern 2d: "find applications across X, Y, and Z" / "applications across X, Y, Z"
-                    apps_match = re.search(r'(?:find(?:s)?\s+)?applications\s+across\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
+                    apps_match = re.search(r'(?:find(?:s)?\s+)?applications\s+across\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE) if 'applications' in header_triggers else None
                     if apps_match:
                         value_text = apps_match.group(1).strip()
                         value_text = re.sub(r'^(?:a\s+wide\s+range\s+of\s+)?', '', value_text, flags=re.I).strip()
-                        value_parts = re.split(r',\s*(?:and\s+)?', value_text)
+                        value_parts = VALUE_LIST_SPLIT_RE.split(value_text)
                         for part in value_parts:
                             part = part.strip()
                             if not part:
@@ -2144,34 +2767,36 @@ def extract_title(docx_path: str) -> str:
                                 # Title-case common nouns but keep acronyms/ampersands
                                 if main_value[0].islower():
                                     main_value = main_value.title()
-                                values.append(main_value)
+                                add_value(main_value)
 
                     # Pattern 2e: "available across a wide spectrum – X, Y, and Z"
-                    avail_match = re.search(
-                        r'available\s+across\s+(?:a\s+wide\s+spectrum\s*)?[–\-]\s*([^.]*?)(?:\.|$)',
-                        header_para,
-                        re.IGNORECASE,
-                    )
-                    if not avail_match:
-                        avail_match = re.search(r'available\s+across\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
+                    avail_match = None
+                    if 'available' in header_triggers:
+                        avail_match = re.search(
+                            r'available\s+across\s+(?:a\s+wide\s+spectrum\s*)?[–\-]\s*([^.]*?)(?:\.|$)',
+                            header_para,
+                            re.IGNORECASE,
+                        )
+                        if not avail_match:
+                            avail_match = re.search(r'available\s+across\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
                     if avail_match:
                         value_text = avail_match.group(1).strip()
                         # Strip leading filler like "a wide spectrum –"
                         value_text = re.sub(r'^(?:a\s+wide\s+spectrum\s*)?[–\-]\s*', '', value_text, flags=re.I).strip()
-                        value_parts = re.split(r',\s*(?:and\s+)?', value_text)
+                        value_parts = VALUE_LIST_SPLIT_RE.split(value_text)
                         for part in value_parts:
                             part = part.strip()
                             if not part:
                                 continue
                             main_value = re.split(r'\s+(?:serve|serves|remain|represent|account|are|is)\b', part, 1, flags=re.I)[0].strip()
                             if main_value and len(main_value) < 80:
-                                values.append(main_value)
+                                add_value(main_value)
                     
                     # Pattern 3: "spans X, Y, Z" or "spans X, Y, and Z" or "adoption spans X, Y, Z"
-                    spans_match = re.search(r'(?:adoption\s+)?spans\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
+                    spans_match = re.search(r'(?:adoption\s+)?spans\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE) if 'spans' in header_triggers else None
                     if spans_match:
                         value_text = spans_match.group(1).strip()
-                        value_parts = re.split(r',\s*(?:and\s+)?', value_text)
+                        value_parts = VALUE_LIST_SPLIT_RE.split(value_text)
                         for part in value_parts:
                             part = part.strip()
                             if part:
@@ -2182,18 +2807,16 @@ def extract_title(docx_path: str) -> str:
                                     if main_value[0].islower():
                                         main_value = main_value.title()
                                         # Fix common issues: "And" -> "and", "To" -> "to", "Of" -> "of"
-                                        main_value = re.sub(r'\b(And|To|Of|In|For|With|The)\b', lambda m: m.group(1).lower(), main_value)
-                                        # Fix hyphenated phrases: "Bridge-To-Lung" -> "Bridge-to-Lung"
-                                        main_value = re.sub(r'([A-Z][a-z]+)-To-([A-Z][a-z]+)', r'\1-to-\2', main_value)
-                                        main_value = re.sub(r'([A-Z][a-z]+)-to-([A-Z][a-z]+)', r'\1-to-\2', main_value)
+                                        # Also fixes hyphenated phrases: "Bridge-To-Lung" -> "Bridge-to-Lung"
+                                        main_value = CONNECTOR_WORD_RE.sub(_lower_group, main_value)
                                         # But keep first word capitalized
                                         if main_value:
                                             main_value = main_value[0].upper() + main_value[1:]
                                     if len(main_value) < 100:  # Increased limit
-                                        values.append(main_value)
+                                        add_value(main_value)
                     
                     # Pattern 4a: For region segment - "North America represents the largest market..."
-                    if section_type == 'region' and 'represents' in header_lower:
+                    if is_region_section and 'represents' in header_lower:
                         # Extract first capitalized phrase (region name)
                         region_match = re.search(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', header_para)
                         if region_match:
@@ -2201,14 +2824,11 @@ def extract_title(docx_path: str) -> str:
                             # Remove trailing words before "represents"
                             region_value = re.split(r'\s+(?:represents|is|remains|follows|supported)', region_value, 1)[0].strip()
                             if region_value and len(region_value) < 50 and region_value.lower() not in ['the', 'by', 'market']:
-                                # Title case
-                                if region_value[0].islower():
-                                    region_value = region_value.title()
-                                if region_value not in values:
-                                    values.append(region_value)
+                                if region_value not in values_seen:
+                                    add_value(region_value)
                     
                     # Pattern 4: "distributed across X, Y, Z"
-                    distributed_match = re.search(r'distributed across\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE)
+                    distributed_match = re.search(r'distributed across\s+([^.]*?)(?:\.|$)', header_para, re.IGNORECASE) if 'distributed' in header_triggers else None
                     if distributed_match:
                         value_text = distributed_match.group(1).strip()
                         # Handle "X, Y, and Z (LAMEA)" pattern
@@ -2217,13 +2837,13 @@ def extract_title(docx_path: str) -> str:
                             part = part.strip()
                             if part:
                                 # Remove parentheses like "(LAMEA)"
-                                main_value = re.sub(r'\s*\([^)]+\)', '', part).strip()
+                                main_value = PAREN_CONTENT_RE.sub('', part).strip()
                                 if main_value and len(main_value) > 3:
                                     # Capitalize first letter if lowercase
                                     if main_value[0].islower():
                                         main_value = main_value[0].upper() + main_value[1:]
                                     if len(main_value) < 80:
-                                        values.append(main_value)
+                                        add_value(main_value)
                     
                     # If we confidently extracted a list from the header, don't keep mining narrative
                     # paragraphs (avoids picking sentences like "The X segment is expanding quickly").
@@ -2258,26 +2878,24 @@ def extract_title(docx_path: str) -> str:
                             # Look for comma-separated values
                             if ',' in line:
                                 # Extract values from comma-separated list
-                                line_values = re.split(r',\s*(?:and\s+)?', line)
+                                line_values = VALUE_LIST_SPLIT_RE.split(line)
                                 for val in line_values:
                                     val = val.strip()
                                     # Extract first part before description words
-                                    val = re.split(r'\s+(?:remain|are|encompass|represent|account|drive|continue|include|comprise)', val, 1, flags=re.I)[0].strip()
+                                    val = VALUE_DESCRIPTION_SPLIT_RE.split(val, 1)[0].strip()
                                     if val and len(val) > 3 and val[0].isupper():
                                         if len(val) < 80:
-                                            # Capitalize properly
-                                            if val[0].islower():
-                                                val = val[0].upper() + val[1:]
-                                            if val not in values:
-                                                values.append(val)
+                                            if val not in values_seen:
+                                                add_value(val)
             
-            for i in range(para_idx + 1, min(para_idx + max_paras + 1, len(doc.paragraphs))):
-                text = doc.paragraphs[i].text.strip()
+            for i in range(para_idx + 1, min(para_idx + max_paras + 1, len(paras))):
+                para = paras[i]
+                text = para.text
                 if not text:
                     continue
                 
                 # Check if this paragraph starts a new section (starts with "By ")
-                if re.match(r'^By\s+', text, re.I):
+                if SEGMENT_SECTION_BREAK_RE.match(text):
                     break
                 
                 # Skip very short text (less than 3 chars) unless it's a single capitalized word
@@ -2285,173 +2903,126 @@ def extract_title(docx_path: str) -> str:
                     continue
                 
                 # Handle paragraphs that might contain newlines - extract first line as potential heading
-                # Split by newline and check first line
-                first_line = text.split('\n')[0].strip() if '\n' in text else text
+                first_line = para.first_line
+                
+                # Every value pattern below needs an ASCII capital first, so other lines only end the intro skip
+                if not ('A' <= first_line[0] <= 'Z'):
+                    skip_intro = False
+                    continue
                 
                 # Also check if first line contains comma-separated values (might be list of segment values)
                 if ',' in first_line and len(first_line) < 200:
                     # Try to extract values from comma-separated list at start of paragraph
                     # Pattern: "Value1, Value2, and Value3 represent..." or "Value1, Value2, Value3"
-                    value_match = re.match(r'^([A-Z][^,]+(?:,\s*[A-Z][^,]+){0,5}(?:,\s*and\s+[A-Z][^,]+)?)', first_line)
+                    value_match = SEGMENT_VALUE_LIST_RE.match(first_line)
                     if value_match:
                         value_text = value_match.group(1).strip()
                         # Remove trailing "and" if present
-                        value_text = re.sub(r',\s*and\s+([A-Z][^,]+)', r', \1', value_text)
-                        value_parts = re.split(r',\s*', value_text)
-                        for val in value_parts:
-                            val = val.strip()
-                            # Extract before description words
-                            val = re.split(r'\s+(?:remain|are|encompass|represent|account|drive|continue|include|comprise)', val, 1, flags=re.I)[0].strip()
+                        value_text = TRAILING_AND_RE.sub(r', \1', value_text)
+                        for val in _split_comma_values(value_text):
                             if val and len(val) > 3 and val[0].isupper():
                                 if len(val) < 80:
-                                    if val not in values:
-                                        values.append(val)
+                                    if val not in values_seen:
+                                        add_value(val)
                 
                 text = first_line  # Use first line for extraction
                 
-                text_lower = text.lower()
+                text_lower = para.first_lower
                 
                 # Skip introductory paragraphs (usually longer, don't start with capital word + colon)
                 # But be more lenient - only skip if it's clearly an intro paragraph
                 # Check if it starts with a capitalized heading first - if so, don't skip
-                starts_with_capital_heading = re.match(r'^[A-Z][a-zA-Z0-9\s&\-]+(?:\([A-Za-z0-9\s,\-]+\))?', text)
-                if skip_intro and len(text) > 100 and not starts_with_capital_heading:
+                # The same capitalized-heading match is reused for the standalone heading check below
+                heading_prefix = SEGMENT_HEADING_GROUP_RE.match(text)
+                if skip_intro and len(text) > 100 and not heading_prefix:
                     skip_intro = False
                     continue
                 skip_intro = False
                 
                 # Skip if starts with excluded phrases
-                if any(text_lower.startswith(phrase) for phrase in exclude_phrases):
+                if text_lower.startswith(SEGMENT_EXCLUDE_PHRASES):
                     continue
                 
                 # Look for capitalized words that might be segment values
                 # Pattern: "Technology Name:" or "Technology Name (Description)" - must start with capital and end with colon
-                match = re.match(r'^([A-Z][a-zA-Z0-9\s&]+(?:\([A-Za-z0-9\s,]+\))?)\s*[:]', text)
+                match = SEGMENT_COLON_HEADING_RE.match(text)
                 if match:
                     value = match.group(1).strip()
                     # Remove parentheses content for cleaner output (e.g., "Canned Fish (Tuna, Salmon, Sardines)" -> "Canned Fish")
                     # But keep it if it's an abbreviation like "(PGPR)" or "(AML)"
                     if '(' in value and ')' in value:
-                        paren_match = re.search(r'\(([^)]+)\)', value)
+                        paren_match = PAREN_GROUP_RE.search(value)
                         if paren_match:
                             paren_content = paren_match.group(1).strip()
                             # If it's all uppercase letters (abbreviation), keep it
                             # Otherwise, remove the parentheses content
-                            if not re.match(r'^[A-Z]{2,}$', paren_content):
-                                value = re.sub(r'\s*\([^)]+\)', '', value).strip()
+                            if not UPPER_ABBREVIATION_RE.match(paren_content):
+                                value = PAREN_CONTENT_RE.sub('', value).strip()
                     # Clean up value - remove common prefixes
-                    value = re.sub(r'^(The|This|These|That)\s+', '', value, flags=re.I).strip()
+                    value = LEADING_ARTICLE_RE.sub('', value).strip()
                     value_lower = value.lower()
                     
                     # Check if it's a region name
-                    is_region_name = any(region in value_lower for region in region_names)
+                    is_region_name = REGION_NAME_RE.search(value_lower) is not None
                     
                     # Skip region names if we're not extracting for the region section
-                    if is_region_name and section_type != 'region':
+                    if is_region_name and not is_region_section:
                         continue
                     
                     # For region section, only accept known region names or region-like patterns
-                    if section_type == 'region':
+                    if is_region_section:
                         # Must be a known region or look like a region name
                         if not is_region_name:
                             # Check if it looks like a region name (short, capitalized, no verbs)
                             if (len(value) > 40 or 
-                                any(verb in value_lower for verb in ['influence', 'market size', 'volume', 'diagnostics', 'methodology', 'process', 'research', 'data sources'])):
+                                NON_REGION_HEADING_TERM_RE.search(value_lower)):
                                 continue  # Skip non-region values
                     
                     # Check if it's a valid value - more flexible for generic markets
                     # Allow longer values (up to 60 chars) and more words (up to 8) for compound names
                     is_valid = (len(value) < 70 and 
-                               not value_lower.startswith(('by ', 'the ', 'this ', 'these ', 'aml ', 'market', 'key ', 'the global', 'other ', 'projected ')) and
+                               not value_lower.startswith(COLON_VALUE_BAD_PREFIXES) and
                                len(value.split()) <= 10 and  # Increased for compound names like "Food & Beverages"
-                               value not in values and
+                               value not in values_seen and
                                'market analysis' not in value_lower and
                                'market share' not in value_lower and
                                'projected share' not in value_lower and
                                'the market' not in value_lower and
                                'the end users' not in value_lower and
-                               'end-user' not in value_lower and
-                               not value_lower.startswith('oem') and
-                               not value_lower.startswith('rest of'))  # Exclude "Rest of the World"
+                               'end-user' not in value_lower)
                     
                     # Allow "Diagnostic Laboratories" and similar compound terms, but exclude standalone "Diagnostic"
                     if is_valid:
                         if value_lower.startswith('diagnostic'):
                             # Allow if it's a compound term like "Diagnostic Laboratories"
                             if 'laborator' in value_lower or 'service' in value_lower or 'center' in value_lower:
-                                values.append(value)
+                                add_value(value)
                         else:
                             # Normalize "and" to "&" for compound names if needed
                             # But keep "and" for regions like "Middle East & Africa"
-                            if ' and ' in value and section_type != 'region':
+                            if ' and ' in value and not is_region_section:
                                 # For application/industry segments, use &
                                 value = value.replace(' and ', ' & ')
-                            values.append(value)
-                
-                # Also check for values that might appear at the start of longer paragraphs
-                # Pattern: First few words before colon, even if followed by more text
-                # This handles cases like "Food and Beverages: The largest application segment..."
-                if not match and len(text) > 50:  # Only for longer paragraphs
-                    # Look for pattern: Capital words followed by colon, within first 100 chars
-                    text_start = text[:100]
-                    alt_match = re.search(r'^([A-Z][a-zA-Z0-9\s&]+(?:\([A-Za-z0-9\s,]+\))?)\s*[:]', text_start)
-                    if alt_match:
-                        value = alt_match.group(1).strip()
-                        
-                        # Skip if it looks like a sentence with verbs (description text)
-                        value_lower_check = value.lower()
-                        sentence_indicators = ['is employed', 'are used', 'is used', 'are employed', 'focuses on', 'targeting', 'including', 'such as']
-                        if any(indicator in text_lower for indicator in sentence_indicators):
-                            # This is likely a description, not a segment value
-                            pass
-                        else:
-                            # Remove parentheses content for cleaner output (e.g., "Canned Fish (Tuna, Salmon, Sardines)" -> "Canned Fish")
-                            # But keep it if it's an abbreviation like "(PGPR)" or "(AML)"
-                            if '(' in value and ')' in value:
-                                paren_match = re.search(r'\(([^)]+)\)', value)
-                                if paren_match:
-                                    paren_content = paren_match.group(1).strip()
-                                    # If it's all uppercase letters (abbreviation), keep it
-                                    # Otherwise, remove the parentheses content
-                                    if not re.match(r'^[A-Z]{2,}$', paren_content):
-                                        value = re.sub(r'\s*\([^)]+\)', '', value).strip()
-                            value = re.sub(r'^(The|This|These|That)\s+', '', value, flags=re.I).strip()
-                            value_lower = value.lower()
-                            
-                            # Same validation as above
-                            is_region_name = any(region in value_lower for region in region_names)
-                            if is_region_name and section_type != 'region':
-                                pass  # Skip
-                            elif (len(value) < 70 and 
-                                  not value_lower.startswith(('by ', 'the ', 'this ', 'these ', 'market', 'key ', 'other ', 'rest of', 'projected ')) and
-                                  len(value.split()) <= 10 and
-                                  value not in values and
-                                  'market analysis' not in value_lower and
-                                  'market share' not in value_lower and
-                                  'projected share' not in value_lower):
-                                # Normalize "and" to "&" for compound names
-                                if ' and ' in value and section_type != 'region':
-                                    value = value.replace(' and ', ' & ')
-                                values.append(value)
+                            add_value(value)
                 
                 # Also check for standalone capitalized headings (without colons)
                 # Pattern: Text that starts with capital letter, is reasonably short, and looks like a heading
                 # This handles cases where headings appear on their own line or followed by description on same line
-                if not match and len(text) > 0:
+                if not match:
                     # Check if text starts with a capitalized heading pattern
                     # Pattern: Capital words that might be a heading, possibly followed by description
                     # Extract just the first capitalized phrase (the heading part) - be more flexible
                     # Try to match up to first sentence break or newline
                     heading_match = None
                     # First try: exact match for standalone heading (no description)
-                    if re.match(r'^[A-Z][a-zA-Z0-9\s&\-]+(?:\([A-Za-z0-9\s,\-]+\))?$', text.strip()):
-                        heading_match = text.strip()
+                    if heading_prefix and heading_prefix.end() == len(text):
+                        heading_match = text
                     else:
                         # Second try: heading followed by description - extract first part
                         # More flexible pattern: match capitalized words until we hit lowercase word (description starts)
                         # Pattern: Match capitalized words, hyphens, and spaces until we hit a lowercase letter
                         # This handles "Bone Marrow Failure Syndromes\nPatients..." or "Post-Hematopoietic Stem Cell Transplantation\nG-CSF..."
-                        heading_pattern = re.match(r'^([A-Z][A-Za-z0-9\s&\-]+(?:\([A-Za-z0-9\s,\-]+\))?)', text)
+                        heading_pattern = heading_prefix
                         if heading_pattern:
                             potential_heading = heading_pattern.group(1).strip()
                             # Check if what follows is description (starts with lowercase or is end of text)
@@ -2475,35 +3046,33 @@ def extract_title(docx_path: str) -> str:
                         is_heading_like = (
                             len(potential_value) <= 80 and  # Not too long
                             len(potential_value.split()) <= 8 and  # Not too many words
-                            not re.match(r'^\d+[\.\)]\s*', potential_value) and  # Not numbered
-                            not value_lower.startswith(('by ', 'the ', 'this ', 'these ', 'market', 'key ', 'projected ', 'products such', 'the g-csf market')) and
+                            not value_lower.startswith(HEADING_VALUE_BAD_PREFIXES) and
                             'market analysis' not in value_lower and
                             'market share' not in value_lower and
                             'projected share' not in value_lower and
-                            potential_value not in values
+                            potential_value not in values_seen
                         )
                         
                         if is_heading_like:
                             # Check if it's a region name (skip if not extracting for region)
-                            is_region_name = any(region in value_lower for region in region_names)
-                            if is_region_name and section_type != 'region':
+                            is_region_name = REGION_NAME_RE.search(value_lower) is not None
+                            if is_region_name and not is_region_section:
                                 pass  # Skip
                             else:
-                                # Clean up the value
-                                value = re.sub(r'^(The|This|These|That)\s+', '', potential_value, flags=re.I).strip()
-                                value_lower = value.lower()
+                                # Clean up the value; value_lower only changes if a leading article was removed
+                                value, article_count = LEADING_ARTICLE_RE.subn('', potential_value)
+                                if article_count:
+                                    value = value.strip()
+                                    value_lower = value.lower()
                                 
                                 # Skip if it contains sentence verbs/patterns (description text)
-                                sentence_indicators = ['is employed', 'are used', 'is used', 'are employed', 'focuses on', 
-                                                      'targeting', 'including', 'such as', 'helps in', 'provides', 
-                                                      'across various', 'each targeting', 'each with']
-                                if any(indicator in value_lower for indicator in sentence_indicators):
+                                if HEADING_SENTENCE_INDICATOR_RE.search(value_lower):
                                     pass  # Skip description text
                                 # Skip if it contains phrases that indicate it's not a segment value
-                                elif any(phrase in value_lower for phrase in ['increased', 'access to', 'growth rate', 'expected to', 'impact', 'trend', 'outlook', 'driven by', 'the largest', 'the dominant', 'patients with', 'g-csf is', 'targeted', 'treatments', 'improve patient', 'outcomes', 'healthcare', 'infrastructure']):
+                                elif HEADING_DESCRIPTIVE_PHRASE_RE.search(value_lower):
                                     pass  # Skip descriptive phrases
                                 # Skip if it's a single generic word that's not a proper segment value
-                                elif len(value.split()) == 1 and value_lower in ['impact', 'trend', 'outlook', 'growth', 'share', 'market', 'targeted']:
+                                elif len(value.split()) == 1 and value_lower in HEADING_GENERIC_WORDS:
                                     pass  # Skip generic single words
                                 # Skip if it's too long and looks like a sentence/description
                                 elif len(value) > 60:
@@ -2519,27 +3088,22 @@ def extract_title(docx_path: str) -> str:
                                     else:
                                         # Might be valid, but validate further
                                         if len(value) >= 3 and len(value) <= 80:
-                                            values.append(value)
+                                            add_value(value)
                                 # Only add if it's a reasonable heading (not too generic)
                                 elif len(value) >= 3 and len(value) <= 80:
-                                    values.append(value)
+                                    add_value(value)
             
             # For region section, handle "Rest of the World" or "Latin America, Middle East & Africa" specially
-            if section_type == 'region' and values:
+            if is_region_section and values:
                 # Filter to only keep valid region names
                 valid_regions = []
-                region_keywords = ['north america', 'south america', 'europe', 'asia', 'pacific', 'latin america', 
-                                 'middle east', 'africa', 'lamea', 'apac', 'emea', 'america', 'oceania']
                 
                 for val in values:
                     val_lower = val.lower()
                     # Check if it's a known region or contains region keywords
-                    if any(region in val_lower for region in region_names + region_keywords):
+                    if REGION_KEYWORD_RE.search(val_lower):
                         # Additional validation: exclude non-region terms
-                        invalid_region_terms = ['influence', 'market size', 'volume', 'diagnostics', 'methodology', 
-                                               'process', 'research', 'data sources', 'government', 'regulatory',
-                                               'historical', 'overview', 'emerging', 'technological', 'stakeholders']
-                        if not any(term in val_lower for term in invalid_region_terms):
+                        if not INVALID_REGION_TERM_RE.search(val_lower):
                             valid_regions.append(val)
                 
                 # If we found valid regions, use them; otherwise keep original values
@@ -2547,92 +3111,32 @@ def extract_title(docx_path: str) -> str:
                     values = valid_regions
                 
                 # Check if we have "Rest of the World" pattern
+                # The expanded-form lookup doesn't depend on the value, so it runs at most once
+                lamea_expanded = None
                 for i, val in enumerate(values):
-                    if 'rest of' in val.lower() or 'lamea' in val.lower():
-                        # Look for expanded form in document
-                        for para in doc.paragraphs[para_idx:para_idx+max_paras+5]:
-                            para_text = para.text.lower()
-                            if 'latin america' in para_text and 'middle east' in para_text and 'africa' in para_text:
-                                # Replace with proper format
-                                values[i] = 'Latin America, Middle East & Africa'
-                                break
+                    val_lower = val.lower()
+                    if 'rest of' in val_lower or 'lamea' in val_lower:
+                        if lamea_expanded is None:
+                            # Look for expanded form in document
+                            lamea_expanded = any(
+                                'latin america' in para.lower and 'middle east' in para.lower and 'africa' in para.lower
+                                for para in paras[para_idx:para_idx+max_paras+5]
+                            )
+                        if lamea_expanded:
+                            # Replace with proper format
+                            values[i] = 'Latin America, Middle East & Africa'
             
             # Clean up all values - remove any invalid ones
             final_values = []
-            # Common verbs and sentence patterns that indicate description text, not segment values
-            sentence_verbs = ['is employed', 'are used', 'is used', 'are employed', 'focuses on', 'targeting', 
-                            'including', 'such as', 'helps in', 'provides', 'allows', 'enables', 'ensures',
-                            'aims to', 'seeks to', 'designed to', 'used to', 'intended to']
-            
-            # Region-specific validation
-            region_keywords = ['north america', 'south america', 'europe', 'asia', 'pacific', 'latin america', 
-                             'middle east', 'africa', 'lamea', 'apac', 'emea', 'america', 'oceania']
-            invalid_region_terms = ['influence', 'market size', 'volume', 'diagnostics', 'methodology', 
-                                   'process', 'research', 'data sources', 'government', 'regulatory',
-                                   'historical', 'overview', 'emerging', 'technological', 'stakeholders']
             
             for val in values:
-                # Strip "(e.g., X)" from segment values so we get short form (e.g. "Internal Stabilization Systems" not "Internal Stabilization Systems (e.g., Internal...")
-                if "(e.g." in val or "(e.g.," in val:
-                    val = val.split("(e.g.")[0].strip().split("(e.g.,")[0].strip()
-                if not val:
-                    continue
-                val_lower = val.lower()
-                
-                # Special handling for region section
-                if section_type == 'region':
-                    # Must contain region keywords
-                    if not any(region in val_lower for region in region_keywords):
-                        continue
-                    # Must not contain invalid terms
-                    if any(term in val_lower for term in invalid_region_terms):
-                        continue
-                
-                # Skip if it contains sentence verbs/patterns (description text)
-                if any(verb in val_lower for verb in sentence_verbs):
-                    continue
-                    
-                # Skip if it's clearly not a valid segment value
-                invalid_patterns = [
-                    'impact', 'trend', 'outlook', 'growth', 'share', 'targeted',
-                    'increased', 'access to', 'growth rate', 'expected to', 'driven by',
-                    'the largest', 'improve patient', 'treatments to', 'outcomes',
-                    'healthcare infrastructure', 'reflects', 'differences in',
-                    'definition and scope', 'overview of', 'research methodology', 'research process',
-                    'primary and secondary', 'data sources', 'emerging opportunities', 'technological advances',
-                    'across various', 'each targeting', 'each with', 'vary widely',
-                    'government and regulatory', 'historical market', 'market size and volume',
-                    'this is the most', 'this is the critical', 'dimension of segmentation',
-                    'in 2024,', 'in 2024 ', 'the most critical dimension',
-                ]
-                if (val_lower in invalid_patterns[:6] or 
-                    any(phrase in val_lower for phrase in invalid_patterns[6:])):
-                    continue
-                    
-                # Skip if it's too long and looks like a description/sentence
-                if len(val) > 60:
-                    # Check for sentence structure (contains verbs, prepositions indicating description)
-                    if any(word in val_lower for word in ['to', 'for', 'with', 'and', 'of', 'in', 'at', 'on', 'by']):
-                        # Count prepositions - if too many, it's likely a sentence
-                        prep_count = sum(1 for word in ['to', 'for', 'with', 'of', 'in', 'at', 'on', 'by'] if word in val_lower.split())
-                        if prep_count > 2:
-                            continue
-                
-                # Skip if it starts with lowercase (likely part of a sentence)
-                if val and val[0].islower():
-                    continue
-                    
-                # Skip if it contains common description phrases
-                desc_phrases = ['the primary', 'this segment', 'this sub-segment', 'this application',
-                              'the end users', 'the market', 'the largest', 'the dominant',
-                              'this is the', 'the most critical']
-                if any(phrase in val_lower for phrase in desc_phrases):
-                    continue
-                
-                # Allow valid values
-                final_values.append(val)
+                val = _clean_segment_value(val, section_type)
+                if val:
+                    final_values.append(val)
+                    if len(final_values) == 8:  # Increased limit to 8 values for comprehensive segments
+                        break
             
-            return final_values[:8]  # Increased limit to 8 values for comprehensive segments
+            return final_values
         
         # Construct base market name
         # Don't replace hyphens inside parentheses (e.g., "(G-CSF)" should stay as is)
@@ -2663,9 +3167,11 @@ def extract_title(docx_path: str) -> str:
         # Extract market name keywords for abbreviation matching
         market_keywords = [w for w in filename_lower.replace(' market', '').split() if len(w) > 3]
         
-        for i, para in enumerate(doc.paragraphs[:20]):  # Check more paragraphs
+        # Reads the paragraph cache built at the top of extract_title, so the document text is not walked again.
+        # A filename abbreviation always wins (see below), so the scan is skipped when there is one.
+        for para in (paras[:20] if not preserved_abbrev else ()):  # Check more paragraphs
             text = para.text
-            text_lower = text.lower()
+            text_lower = para.lower
             
             # Check if paragraph contains market name keywords
             has_market_keywords = any(kw in text_lower for kw in market_keywords)
@@ -2673,7 +3179,7 @@ def extract_title(docx_path: str) -> str:
             if has_market_keywords:
                 # Look for abbreviation pattern: "Market Name (ABBR)" or "Market Name(ABBR)"
                 # Pattern: word(s) followed by (uppercase letters, may include hyphens like "G-CSF")
-                abbrev_pattern = re.search(r'\(([A-Z][A-Z0-9\-]{1,})\)', text)
+                abbrev_pattern = PAREN_ABBREVIATION_RE.search(text)
                 if abbrev_pattern:
                     abbrev = abbrev_pattern.group(1)
                     # Verify it's near market name
@@ -2695,371 +3201,64 @@ def extract_title(docx_path: str) -> str:
                         abbreviation = '(AML)'
                         break
         
-        # If abbreviation is already in the name (from filename), don't add it again
-        # Also check if abbreviation is different from what's already in filename
-        if preserved_abbrev and abbreviation:
-            # Check if they match (case-insensitive)
-            if preserved_abbrev.lower() == abbreviation.lower():
-                abbreviation = None  # Don't add duplicate
-            # Also check if abbreviation is already mentioned in the base_market_name
-            elif abbreviation.lower() in base_market_name.lower():
-                abbreviation = None  # Don't add if already present
-        
-        # Add abbreviation after disease name but before other words if found
-        # Check if abbreviation is already in the base_market_name (from filename)
-        abbrev_in_name = abbreviation and abbreviation.lower() in base_market_name.lower()
-        # Also check if base_market_name already has an abbreviation (from filename) - don't add duplicate
-        if preserved_abbrev:
-            # If filename already has an abbreviation (like "(VV ECLS)"), don't add another one (like "(ECMO)")
-            # Only exception: G-CSF format where we need to rearrange
-            abbrev_in_name = True
-            # Reset abbreviation to None to prevent adding duplicate
-            abbreviation = None
-        elif abbreviation and abbreviation.lower() in base_market_name.lower():
-            # If abbreviation is already in base_market_name, don't add it
-            abbrev_in_name = True
-            abbreviation = None
-        if abbreviation and not abbrev_in_name:
+        # Add abbreviation after disease name but before other words if found.
+        # If the filename already has an abbreviation (like "(VV ECLS)") no other one (like "(ECMO)") is added;
+        # the G-CSF format is rearranged separately below. Abbreviations already in the name aren't repeated.
+        base_lower = filename_lower  # base_market_name is unchanged since filename_lower was taken
+        if abbreviation and abbreviation.lower() not in base_lower:
             # Insert after the disease name (before "Diagnostics" or "Market")
             # Pattern: "Acute Myeloid Leukemia (AML) Diagnostics Market"
-            if 'diagnostics' in base_market_name.lower():
+            if 'diagnostics' in base_lower:
                 base_market_name = base_market_name.replace(' Diagnostics', f' {abbreviation} Diagnostics')
-            elif 'market' in base_market_name.lower():
+            elif 'market' in base_lower:
                 base_market_name = base_market_name.replace(' Market', f' {abbreviation} Market')
             else:
                 base_market_name = f"{base_market_name} {abbreviation}"
+            base_lower = base_market_name.lower()
         
-        if not base_market_name.lower().endswith('market'):
+        if not base_lower.endswith('market'):
             base_market_name = f"{base_market_name} Market"
+            base_lower += ' market'
         
         # Special handling for G-CSF format: "G-CSF (Granulocyte Colony Stimulating Factors) Market"
         # Check if we have abbreviation and full name pattern
         if preserved_abbrev and '(G-CSF)' in preserved_abbrev.upper():
             # Check if full name is in the base_market_name
-            if 'granulocyte colony stimulating factors' in base_market_name.lower():
+            if 'granulocyte colony stimulating factors' in base_lower:
                 # Extract abbreviation and full name
                 abbrev = 'G-CSF'
                 full_name = 'Granulocyte Colony Stimulating Factors'
                 # Reconstruct as "G-CSF (Granulocyte Colony Stimulating Factors) Market"
                 base_market_name = f"{abbrev} ({full_name}) Market"
+                base_lower = base_market_name.lower()
         
         # Build the detailed title
         title_parts = [base_market_name]
+        # G-CSF markets use their own labels ("by Type", "by End-User", ...) and comma separators
+        is_gcsf_market = 'g-csf' in base_lower
         
-        # Build title parts in specific order: Phase Type, Output Power, Product Type, Distribution Channel, Application, End-User, Geography
-        # Note: Order matters for consistency
-
-        # 0. Phase Type (for power/electrical markets)
-        if 'phase' in segments and 'phase' in segment_indices:
-            phase_values = extract_segment_values(segment_indices['phase'], 'phase')
-            if phase_values:
-                cleaned_values = []
-                for val in phase_values:
-                    v = val.strip()
-                    if not v:
-                        continue
-                    # normalize capitalization for common values
-                    if v.lower() == 'single phase':
-                        v = 'Single Phase'
-                    elif v.lower() == 'three phase':
-                        v = 'Three Phase'
-                    if v not in cleaned_values:
-                        cleaned_values.append(v)
-                if cleaned_values:
-                    title_parts.append(f"By Phase Type ({', '.join(cleaned_values[:6])})")
-
-        # 0.5 Output Power (for power/electrical markets)
-        if 'output_power' in segments and 'output_power' in segment_indices:
-            output_values = extract_segment_values(segment_indices['output_power'], 'output_power')
-            if output_values:
-                cleaned_values = []
-                for val in output_values:
-                    v = _norm(val)
-                    if not v:
-                        continue
-                    # ensure we use en-dash between numeric ranges
-                    v = re.sub(r'(\d)\s*[-]\s*(\d)', rf'\1{DASH}\2', v)
-                    if v not in cleaned_values:
-                        cleaned_values.append(v)
-                if cleaned_values:
-                    title_parts.append(f"By Output Power ({', '.join(cleaned_values[:6])})")
-        
-        # 1. Technology/Type (Diagnostic Technology or generic Product Type)
-        if 'diagnostic' in segments:
-            if 'diagnostic' in segment_indices:
-                diagnostic_values = extract_segment_values(segment_indices['diagnostic'], 'diagnostic')
-                if diagnostic_values:
-                    # Check if this is medical-specific or generic segmentation
-                    segment_text = segments['diagnostic'].lower()
-                    is_medical = 'diagnostic' in segment_text and ('technology' in segment_text or 'approach' in segment_text)
-                    is_generic_type = 'type' in segment_text or 'product type' in segment_text
-                    
-                    # Clean up values - map to expected names for medical, preserve for generic
-                    cleaned_values = []
-                    
-                    if is_medical:
-                        # Medical-specific mapping
-                        expected_order = ['Molecular Diagnostics', 'Flow Cytometry', 'NGS', 'Liquid Biopsy', 'IHC', 'Others']
-                    for val in diagnostic_values:
-                        val_lower = val.lower()
-                        if 'molecular diagnostics' in val_lower and 'Molecular Diagnostics' not in cleaned_values:
-                            cleaned_values.append('Molecular Diagnostics')
-                        if 'flow cytometry' in val_lower and 'Flow Cytometry' not in cleaned_values:
-                            cleaned_values.append('Flow Cytometry')
-                        if ('ngs' in val_lower or 'next generation sequencing' in val_lower or 'next-gen sequencing' in val_lower) and 'NGS' not in cleaned_values:
-                            cleaned_values.append('NGS')
-                        if 'liquid biopsy' in val_lower and 'Liquid Biopsy' not in cleaned_values:
-                            cleaned_values.append('Liquid Biopsy')
-                        if ('immunohistochemistry' in val_lower or ('ihc' in val_lower and val_lower != 'others')) and 'IHC' not in cleaned_values:
-                            cleaned_values.append('IHC')
-                        if ('others' in val_lower or val == 'Others') and 'Others' not in cleaned_values:
-                            cleaned_values.append('Others')
-                    
-                        # Also search document-wide for NGS and Liquid Biopsy if not found
-                    if 'NGS' not in cleaned_values:
-                        for para in doc.paragraphs:
-                            text_lower = para.text.lower()
-                            if ('ngs' in text_lower or 'next generation sequencing' in text_lower) and 'diagnostic' in text_lower[:100]:
-                                cleaned_values.append('NGS')
-                                break
-                    if 'Liquid Biopsy' not in cleaned_values:
-                        for para in doc.paragraphs:
-                            text_lower = para.text.lower()
-                            if 'liquid biopsy' in text_lower and 'diagnostic' in text_lower[:100]:
-                                cleaned_values.append('Liquid Biopsy')
-                                break
-                    
-                        # Use "By Technology" for medical markets
-                    if cleaned_values:
-                        ordered_values = []
-                        preferred_order = ['Molecular Diagnostics', 'Flow Cytometry', 'NGS', 'Liquid Biopsy', 'IHC', 'Others']
-                        for preferred in preferred_order:
-                            if preferred in cleaned_values:
-                                ordered_values.append(preferred)
-                        for val in cleaned_values:
-                            if val not in ordered_values:
-                                ordered_values.append(val)
-                        title_parts.append(f"By Technology ({', '.join(ordered_values[:6])})")
-                    elif is_generic_type:
-                        # Generic type segmentation - clean up values
-                        cleaned_values = []
-                        for val in diagnostic_values:
-                            val_lower = val.lower()
-                            # Map G-CSF specific values
-                            if 'innovator' in val_lower and 'g-csf' in val_lower:
-                                # Clean "Innovator G-CSF Drugs" to "Innovator G-CSF"
-                                if 'drugs' in val_lower:
-                                    cleaned_values.append('Innovator G-CSF')
-                                else:
-                                    cleaned_values.append('Innovator G-CSF')
-                            elif 'biosimilar' in val_lower:
-                                cleaned_values.append('Biosimilars')
-                            elif val not in cleaned_values:
-                                cleaned_values.append(val)
-                        
-                        if cleaned_values:
-                            # Use "by Type" for G-CSF markets, "By Product Type" for others
-                            segment_text = segments.get('diagnostic', '').lower()
-                            if 'type of product' in segment_text or ('g-csf' in base_market_name.lower()):
-                                title_parts.append(f"by Type ({', '.join(cleaned_values[:6])})")
-                            else:
-                                title_parts.append(f"By Product Type ({', '.join(cleaned_values[:6])})")
-                    else:
-                        # Default: preserve values and use "By Product Type" for generic markets
-                        cleaned_values = [val for val in diagnostic_values if len(val) < 50][:6]
-                        if cleaned_values:
-                            # Use "By Product Type" for generic markets
-                            segment_text = segments.get('diagnostic', '').lower()
-                            if 'product type' in segment_text or 'type' in segment_text:
-                                title_parts.append(f"By Product Type ({', '.join(cleaned_values)})")
-                            else:
-                                title_parts.append(f"By Product Type ({', '.join(cleaned_values)})")
-        
-        # 2. Application (Treatment/Application)
-        if 'treatment' in segments:
-            if 'treatment' in segment_indices:
-                treatment_values = extract_segment_values(segment_indices['treatment'], 'treatment')
-                if treatment_values:
-                    # Clean up values - preserve original for generic markets
-                    cleaned_values = []
-                    for val in treatment_values:
-                        val_lower = val.lower()
-                        # Medical-specific mappings
-                        if 'disease diagnosis' in val_lower:
-                            cleaned_values.append('Disease Diagnosis')
-                        elif 'prognostic' in val_lower:
-                            cleaned_values.append('Prognostic Determination')
-                        elif 'treatment monitoring' in val_lower:
-                            cleaned_values.append('Treatment Monitoring')
-                        elif 'recurrence' in val_lower:
-                            cleaned_values.append('Recurrence Detection')
-                        # G-CSF specific mappings
-                        elif 'chemotherapy-induced neutropenia' in val_lower:
-                            if 'Chemotherapy-Induced Neutropenia' not in cleaned_values:
-                                cleaned_values.append('Chemotherapy-Induced Neutropenia')
-                        elif 'bone marrow failure' in val_lower:
-                            if 'Bone Marrow Failure' not in cleaned_values:
-                                cleaned_values.append('Bone Marrow Failure')
-                        elif ('stem cell transplantation' in val_lower or 'hematopoietic stem cell' in val_lower or 
-                              'post-hematopoietic' in val_lower):
-                            if 'Stem Cell Transplantation' not in cleaned_values:
-                                cleaned_values.append('Stem Cell Transplantation')
-                        elif 'chronic neutropenia' in val_lower:
-                            if 'Chronic Neutropenia' not in cleaned_values:
-                                cleaned_values.append('Chronic Neutropenia')
-                        elif val not in cleaned_values:
-                            # For generic markets, preserve as-is but clean up
-                            # Fix specific capitalization issues
-                            # Fix "Bridge-To-Lung" -> "Bridge-to-Lung"
-                            if 'bridge' in val_lower and 'lung' in val_lower:
-                                val = re.sub(r'Bridge-To-Lung', 'Bridge-to-Lung', val, flags=re.I)
-                            # Map "Other Applications" to "Industrial" if needed
-                            if 'other' in val_lower and 'industrial' in val_lower:
-                                if 'Industrial' not in cleaned_values:
-                                    cleaned_values.append('Industrial')
-                            elif 'other application' in val_lower:
-                                # Skip "Other Applications" if we have Industrial already
-                                if 'Industrial' not in cleaned_values:
-                                    cleaned_values.append('Industrial')
-                            else:
-                                cleaned_values.append(val)
+        # Build title parts in specific order: Phase Type, Output Power, Product Type, Application, End-User, Distribution Channel, Geography
+        # Note: Order matters for consistency (see SEGMENT_TITLE_BUILDERS)
+        for segment_key, build_title_part in SEGMENT_TITLE_BUILDERS:
+            if segment_key in segments and segment_key in segment_indices:
+                segment_values = extract_segment_values(segment_indices[segment_key], segment_key)
+                if segment_values:
+                    label, cleaned_values = build_title_part(segment_values, segments[segment_key], paras, is_gcsf_market)
                     if cleaned_values:
-                        # Keep consistent capitalization for titles
-                        title_parts.append(f"By Application ({', '.join(cleaned_values[:6])})")
-        
-        # 3. End-User Industry
-        if 'enduser' in segments:
-            if 'enduser' in segment_indices:
-                enduser_values = extract_segment_values(segment_indices['enduser'], 'enduser')
-                if enduser_values:
-                    # Clean up values - preserve all found values
-                    cleaned_values = []
-                    value_added = set()
-                    
-                    for val in enduser_values:
-                        val_lower = val.lower()
-                        # Medical-specific mappings
-                        if 'hospitals' in val_lower:
-                            if 'Hospitals' not in cleaned_values:
-                                cleaned_values.append('Hospitals')
-                        elif 'diagnostic laborator' in val_lower:
-                            if 'Diagnostic Laboratories' not in cleaned_values:
-                                cleaned_values.append('Diagnostic Laboratories')
-                        elif 'research' in val_lower and ('institut' in val_lower or 'academic' in val_lower):
-                            if 'Research Institutions' not in cleaned_values:
-                                cleaned_values.append('Research Institutions')
-                        # G-CSF specific end-user mappings
-                        elif 'hospital' in val_lower:
-                            if 'Hospitals' not in cleaned_values:
-                                cleaned_values.append('Hospitals')
-                        elif 'oncology clinic' in val_lower:
-                            if 'Oncology Clinics' not in cleaned_values:
-                                cleaned_values.append('Oncology Clinics')
-                        elif 'ambulatory' in val_lower and ('surgical' in val_lower or 'surgery' in val_lower):
-                            if 'Ambulatory Surgical Centers' not in cleaned_values:
-                                cleaned_values.append('Ambulatory Surgical Centers')
-                        elif 'homecare' in val_lower or 'home care' in val_lower:
-                            if 'Homecare Settings' not in cleaned_values:
-                                cleaned_values.append('Homecare Settings')
-                        elif 'pharmaceutical' in val_lower:
-                            if 'Pharmaceutical' not in ' '.join(cleaned_values):
-                                # Map to "Pharmaceuticals" or "Pharmaceutical Industry"
-                                if 'industry' in val_lower:
-                                    cleaned_values.append('Pharmaceuticals')
-                                else:
-                                    cleaned_values.append('Pharmaceuticals')
-                        elif 'food' in val_lower:
-                            if 'Food Industry' not in cleaned_values:
-                                cleaned_values.append('Food Industry')
-                        elif 'cosmetic' in val_lower:
-                            if 'Cosmetics & Personal Care' not in cleaned_values:
-                                cleaned_values.append('Cosmetics & Personal Care')
-                        elif 'agricultural' in val_lower or 'agriculture' in val_lower:
-                            if 'Agriculture' not in cleaned_values:
-                                cleaned_values.append('Agriculture')
-                        elif 'industrial' in val_lower or 'other' in val_lower:
-                            if 'Industrial' not in cleaned_values:
-                                cleaned_values.append('Industrial')
-                        elif val not in cleaned_values:
-                            # Preserve original value
-                            cleaned_values.append(val)
-                    
-                    # For G-CSF markets, also search document-wide for "Ambulatory Surgical Centers" if not found
-                    if 'g-csf' in base_market_name.lower() and 'Ambulatory Surgical Centers' not in cleaned_values:
-                        for para in doc.paragraphs:
-                            para_text_lower = para.text.lower()
-                            if 'ambulatory' in para_text_lower and ('surgical center' in para_text_lower or 'asc' in para_text_lower):
-                                cleaned_values.append('Ambulatory Surgical Centers')
-                                break
-                    
-                    # For G-CSF markets, ensure correct order: Hospitals, Oncology Clinics, Ambulatory Surgical Centers, Homecare Settings
-                    if 'g-csf' in base_market_name.lower() and cleaned_values:
-                        ordered_enduser = []
-                        preferred_order = ['Hospitals', 'Oncology Clinics', 'Ambulatory Surgical Centers', 'Homecare Settings']
-                        for preferred in preferred_order:
-                            if preferred in cleaned_values:
-                                ordered_enduser.append(preferred)
-                        # Add any remaining values not in preferred order
-                        for val in cleaned_values:
-                            if val not in ordered_enduser:
-                                ordered_enduser.append(val)
-                        cleaned_values = ordered_enduser
-                    
-                    # Use "by End-User" for G-CSF, "By End User" for others (remove "Industry")
-                    if cleaned_values:
-                        if 'g-csf' in base_market_name.lower():
-                            title_parts.append(f"by End-User ({', '.join(cleaned_values[:6])})")
-                        else:
-                            # Check if segment text says "By End User" (without Industry)
-                            segment_text = segments.get('enduser', '').lower()
-                            if 'industry' not in segment_text:
-                                title_parts.append(f"By End User ({', '.join(cleaned_values[:6])})")
-                            else:
-                                title_parts.append(f"By End-User Industry ({', '.join(cleaned_values[:6])})")
-        
-        # 3.5. Distribution Channel
-        if 'distribution' in segments:
-            if 'distribution' in segment_indices:
-                distribution_values = extract_segment_values(segment_indices['distribution'], 'distribution')
-                if distribution_values:
-                    # Clean up values
-                    cleaned_values = []
-                    for val in distribution_values:
-                        val_lower = val.lower()
-                        # Map to standard names
-                        if 'supermarket' in val_lower or 'hypermarket' in val_lower:
-                            if 'Supermarkets' not in cleaned_values:
-                                cleaned_values.append('Supermarkets')
-                        elif 'online' in val_lower and 'retail' in val_lower:
-                            if 'Online Retail' not in cleaned_values:
-                                cleaned_values.append('Online Retail')
-                        elif 'convenience' in val_lower and 'store' in val_lower:
-                            if 'Convenience Stores' not in cleaned_values:
-                                cleaned_values.append('Convenience Stores')
-                        elif 'foodservice' in val_lower or 'food service' in val_lower:
-                            if 'Foodservice' not in cleaned_values:
-                                cleaned_values.append('Foodservice')
-                        elif val not in cleaned_values:
-                            cleaned_values.append(val)
-                    
-                    if cleaned_values:
-                        if 'g-csf' in base_market_name.lower():
-                            title_parts.append(f"by Distribution Channel ({', '.join(cleaned_values[:6])})")
-                        else:
-                            title_parts.append(f"By Distribution Channel ({', '.join(cleaned_values[:6])})")
+                        title_parts.append(_format_segment(label, cleaned_values))
         
         # 4. Region (Geography) - always add if segments found
         # Check if region segment was found in the document
         if 'region' in segments:
             # In long-form report titles, this is typically expressed as "By Geography"
             # (even if the body text lists regions). Prefer this stable label.
-            if 'g-csf' in base_market_name.lower():
+            if is_gcsf_market:
                 title_parts.append("by Region")
             else:
                 title_parts.append("By Geography")
         elif len(segments) >= 2:
             # If we have other segments, add Region anyway
-            if 'g-csf' in base_market_name.lower():
+            if is_gcsf_market:
                 title_parts.append("by Region")
             else:
                 title_parts.append("By Geography")
@@ -3069,23 +3268,12 @@ def extract_title(docx_path: str) -> str:
         
         # Join title parts with special handling: first segment after market name should have space
         # For G-CSF markets, use commas; for others, use semicolons
-        is_gcsf_market = 'g-csf' in base_market_name.lower()
         separator = ', ' if is_gcsf_market else '; '
         
         if len(title_parts) > 1:
             # First part is market name, rest are segments
-            market_name = title_parts[0]
-            segments = title_parts[1:]
-            
             # Join: Market Name + space + first segment, then separator for rest
-            if segments:
-                # First segment should be joined with space after market name
-                constructed_title = f"{market_name} {segments[0]}"
-                # Rest segments joined with separator
-                if len(segments) > 1:
-                    constructed_title += separator + separator.join(segments[1:])
-            else:
-                constructed_title = market_name
+            constructed_title = separator.join((f"{title_parts[0]} {title_parts[1]}", *title_parts[2:]))
         else:
             constructed_title = separator.join(title_parts)
         
@@ -3093,128 +3281,105 @@ def extract_title(docx_path: str) -> str:
 
     # NEW LOGIC: Look for market report patterns in first few paragraphs
     # Increased to 50 paragraphs to catch titles that appear after intro text
-    filename_normalized = filename_low.replace('-', ' ').replace('_', ' ')
-    filename_keywords = [w for w in filename_normalized.split() if w not in ['market', 'the', 'and', 'or', 'global']]
-    
-    # For 2-word market names, require both words to match (more flexible)
-    # For longer names, require at least 2 keywords or 70% match
-    min_keywords_needed = max(2, min(len(filename_keywords), 3)) if len(filename_keywords) > 2 else len(filename_keywords)
+    # filename_normalized was computed for Priority 0 above
+    filename_keywords, long_filename_keywords, min_keywords_needed = _filename_keywords(filename_normalized)
     
-    for para_idx, para in enumerate(doc.paragraphs[:50]):  # Check first 50 paragraphs
-        text = para.text.strip()
+    for para_idx, para in enumerate(paras[:50]):  # Check first 50 paragraphs
+        text = para.text
         if not text:
             continue
             
-        clean_text = remove_emojis(text)
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        clean_text = WHITESPACE_RUN_RE.sub(' ', remove_emojis(text)).strip()
         
         # Skip section headings (text ending with colon) - but allow if it's short and looks like a title
         if clean_text.endswith(':') and len(clean_text) > 100:
             continue
         
-        # Skip very short text (likely headings) - but allow if it contains market name
+        # Every priority below needs "market" in the text, so nothing else can match
         text_lower = clean_text.lower()
-        has_market_keywords = any(kw in text_lower for kw in filename_keywords if len(kw) > 3)
-        if len(clean_text) < 20 and not has_market_keywords:
+        if 'market' not in text_lower:
+            continue
+        
+        # Skip very short text (likely headings) - but allow if it contains market name
+        if len(clean_text) < 20 and not any(kw in text_lower for kw in long_filename_keywords):
             continue
         
+        # Filename keyword matches (hyphens/underscores normalized) shared by the priorities below
+        text_normalized = text_lower.replace('-', ' ').replace('_', ' ')
+        keywords_matched = _has_keywords(text_normalized, filename_keywords, min_keywords_needed)
+        has_forecast = 'forecast' in text_lower
+        
         # Priority 1: Look for "The Global [Topic] Market" or "Global [Topic] Market" at the start
         # This is usually the actual title
-        title_match = re.search(r'(?:^the\s+)?global\s+([^.]*?)\s+market', clean_text, re.I)
+        title_match = GLOBAL_MARKET_TITLE_RE.search(clean_text)
         if title_match:
             # Extract the title up to "Market"
-            full_title_match = re.search(r'(?:^the\s+)?global\s+[^.]*?\s+market', clean_text, re.I)
-            if full_title_match:
-                extracted_title = full_title_match.group(0).strip()
-                # Check if it contains the filename keywords (normalize both)
-                text_normalized = clean_text.lower().replace('-', ' ').replace('_', ' ')
-                # Check if at least some keywords match
-                matching_keywords = sum(1 for kw in filename_keywords if kw in text_normalized)
-                if matching_keywords >= min_keywords_needed and not _is_section_heading_title(extracted_title):
-                    return _ensure_filename_start_and_year(extracted_title, filename)
+            extracted_title = title_match.group(0).strip()
+            # Check if at least some filename keywords match
+            if keywords_matched and not _is_section_heading_title(extracted_title):
+                return _ensure_filename_start_and_year(extracted_title, filename)
         
         # Priority 1.5: Look for full title with segmentation pattern
         # Pattern: "[Market Name] Market By [Category] (...); By [Category] (...); ... Forecast, 2024–2030"
-        if 'market' in text_lower and re.search(r'by\s+(?:application|product\s+type|type|end[-\s]*user|region|geography)', text_lower, re.I):
+        if TITLE_SEGMENT_BY_RE.search(text_lower):
             # Check if it contains market name and forecast
-            text_normalized = clean_text.lower().replace('-', ' ').replace('_', ' ')
-            matching_keywords = sum(1 for kw in filename_keywords if kw in text_normalized)
-            if matching_keywords >= min_keywords_needed and ('forecast' in text_lower or re.search(r'20\d{2}', clean_text)):
+            if keywords_matched and (has_forecast or YEAR_RE.search(clean_text)):
                 # Extract title from start to forecast year or end
-                year_match = re.search(r'(20\d{2}.*?20\d{2})', clean_text)
+                year_match = YEAR_SPAN_RE.search(clean_text)
                 if year_match:
                     end_pos = year_match.end()
                     full_title = clean_text[:end_pos].strip()
                     # Remove "The Global" prefix
-                    full_title = re.sub(r'^(?:The\s+)?Global\s+', '', full_title, flags=re.I).strip()
+                    full_title = GLOBAL_PREFIX_RE.sub('', full_title).strip()
                     if not _is_section_heading_title(full_title):
                         return _clean_final_title(_norm(full_title))
         
         # Priority 2: Look for patterns like "[Topic] Market" that contains filename
-        text_normalized = clean_text.lower().replace('-', ' ').replace('_', ' ')
-        matching_keywords = sum(1 for kw in filename_keywords if kw in text_normalized)
-        
         # More flexible matching - check if text starts with capital (or quote/capital)
         starts_with_capital = clean_text and (clean_text[0].isupper() or (len(clean_text) > 1 and clean_text[0] in ['"', "'"] and clean_text[1].isupper()))
+        # Priorities 2 and 4 share this gate: filename keywords, a capital start and no leading number (not a heading)
+        title_candidate = keywords_matched and starts_with_capital and not NUMBERED_HEADING_RE.match(clean_text)
         
-        if (starts_with_capital and 
-            matching_keywords >= min_keywords_needed and
-            'market' in text_lower and 
-            len(clean_text) < 400):  # Increased length limit
-            # Check if it's not a heading (doesn't end with colon if long, doesn't start with numbers)
-            is_heading = re.match(r'^\d+[\.\)]\s*', clean_text)
-            if not is_heading:
-                # Extract up to "Market" or first sentence ending with forecast/year
-                # First try to find complete title with forecast
-                forecast_match = re.search(r'^(.*?market.*?forecast.*?20\d{2}.*?20\d{2})', clean_text, re.I | re.DOTALL)
-                if forecast_match:
-                    title_text = forecast_match.group(1).strip()
-                    title_text = re.sub(r'^(?:The\s+)?Global\s+', '', title_text, flags=re.I).strip()
-                    if not _is_section_heading_title(title_text):
-                        return _ensure_filename_start_and_year(title_text, filename)
-                
-                # Otherwise extract up to "Market" or first sentence
-                title_match = re.search(r'^([^.]*?market)', clean_text, re.I)
-                if title_match:
-                    title_text = title_match.group(1).strip()
-                    # Only use if it has substantial content and not a section heading
-                    if len(title_text.split()) >= 3 and not _is_section_heading_title(title_text):
-                        return _ensure_filename_start_and_year(title_text, filename)
+        if title_candidate and len(clean_text) < 400:  # Increased length limit
+            # Extract up to "Market" or first sentence ending with forecast/year
+            # First try to find complete title with forecast: the shortest prefix that runs through
+            # "market", then "forecast", then two years (whitespace is already collapsed, so no newlines)
+            forecast_title_end = _forecast_title_end(clean_text)
+            if forecast_title_end != -1:
+                title_text = clean_text[:forecast_title_end].strip()
+                title_text = GLOBAL_PREFIX_RE.sub('', title_text).strip()
+                if not _is_section_heading_title(title_text):
+                    return _ensure_filename_start_and_year(title_text, filename)
+            
+            # Otherwise extract up to "Market" or first sentence
+            title_text = _market_title_prefix(clean_text)
+            if title_text:
+                # Only use if it has substantial content and not a section heading
+                if len(title_text.split()) >= 3 and not _is_section_heading_title(title_text):
+                    return _ensure_filename_start_and_year(title_text, filename)
         
         # Priority 3: Look for "Forecast, 2024–2030" pattern with market name
-        if re.search(r'forecast\s*[,:]\s*20\d{2}[\s\-–]20\d{2}', text_lower):
-            text_normalized = clean_text.lower().replace('-', ' ').replace('_', ' ')
-            matching_keywords = sum(1 for kw in filename_keywords if kw in text_normalized)
-            if matching_keywords >= min_keywords_needed or 'market' in text_lower:
-                # Extract title portion before forecast
-                forecast_pos = re.search(r'forecast\s*[,:]', text_lower, re.I)
-                if forecast_pos:
-                    title_part = clean_text[:forecast_pos.end()].strip()
-                    # Try to extract complete title
-                    if 'market' in title_part.lower() and not _is_section_heading_title(clean_text):
-                        return _ensure_filename_start_and_year(clean_text, filename)
+        # ("market" is already known to be in the text, so no keyword check is needed)
+        # Any "forecast, 2024-2030" match also matches the label, so the years pattern is only tried from the first label on
+        forecast_pos = FORECAST_LABEL_RE.search(text_lower) if has_forecast else None
+        if forecast_pos and FORECAST_YEARS_RE.search(text_lower, forecast_pos.start()):
+            # Try to extract complete title (the part up to the forecast label must name the market)
+            if text_lower.find('market') + 6 <= forecast_pos.end() and not _is_section_heading_title(clean_text):
+                return _ensure_filename_start_and_year(clean_text, filename)
     
         # Priority 4: Look for market name with "Market" keyword (flexible positioning)
-        if matching_keywords >= min_keywords_needed and 'market' in text_lower and len(clean_text) < 200:
-            # Check if it looks like a title (starts with capital, reasonable length)
-            if starts_with_capital and not re.match(r'^\d+[\.\)]\s*', clean_text):
-                # Extract title pattern
-                # Look for: Market Name + Market [+ optional segmentation] [+ Forecast/Year]
-                title_pattern = re.search(r'^((?:The\s+)?(?:Global\s+)?[^.]*?market(?:\s+by\s+[^,;.]*?)*?)(?:\s*[,;]\s*.*?forecast.*?20\d{2}.*?20\d{2})?', clean_text, re.I)
-                if title_pattern:
-                    title_text = title_pattern.group(1).strip()
-                    title_text = re.sub(r'^(?:The\s+)?Global\s+', '', title_text, flags=re.I).strip()
-                    if len(title_text.split()) >= 3 and not _is_section_heading_title(title_text):
-                        return _ensure_filename_start_and_year(title_text, filename)
+        # Check if it looks like a title (starts with capital, reasonable length)
+        if title_candidate and len(clean_text) < 200:
+            # Extract title pattern: everything up to the first "market", provided no sentence ends before it
+            title_text = _market_title_prefix(clean_text)
+            if title_text:
+                title_text = GLOBAL_PREFIX_RE.sub('', title_text).strip()
+                if len(title_text.split()) >= 3 and not _is_section_heading_title(title_text):
+                    return _ensure_filename_start_and_year(title_text, filename)
 
     # Last resort: If we found segmentation patterns but no full title, construct basic title
     # Check if we have any segmentation patterns in document
-    has_segmentation = False
-    for para in doc.paragraphs[:100]:
-        text = para.text.strip().lower()
-        if re.search(r'by\s+(?:application|product\s+type|type|end[-\s]*user|region|geography|segment)', text, re.I):
-            has_segmentation = True
-            break
+    has_segmentation = any(SEGMENTATION_HINT_RE.search(para.lower) for para in paras[:100])
     
     if has_segmentation:
         # Construct basic title with filename + Market + Forecast
@@ -3226,10 +3391,115 @@ def extract_title(docx_path: str) -> str:
     return "Title Not Available"
 
 # ------------------- Extract Description -------------------
-def extract_description(docx_path):
-    doc = Document(docx_path)
+# Patterns applied per paragraph by extract_description.
+HEADING_LEAD_SYMBOLS_RE = re.compile(r'^[^\w]+')
+SECTION_LABEL_RE = re.compile(r'(?i)section\s*\d+[:\-]?\s*')
+HEADING_NUMBER_RE = re.compile(r'^\d+[\.\-\)]\s*')
+NUMBERED_POINT_RE = re.compile(r'^\d+\.\s*')
+BOLD_NUMBERED_POINT_RE = re.compile(r'^<b>\d+\.\s*')
+DOTTED_NUMBER_RE = re.compile(r'^\d+(\.\d+)+')
+LIST_NUMBER_RE = re.compile(r'^\d+[\.\)]\s*')
+BULLET_RE = re.compile(r'^[•\-–]\s*')
+BOLD_BY_HEADING_RE = re.compile(r'<b>\s*by\s+([^<]+)</b>')
+BOLD_TEXT_RE = re.compile(r'<b>(.*?)</b>')
+LEADING_BOLD_RE = re.compile(r'^<b>([^<]+)</b>')
+
+# Main section headings that start capture and become h2
+TARGET_HEADINGS = (
+    "introduction and strategic context",
+    "market segmentation and forecast scope",
+    "market trends and innovation landscape",
+    "competitive intelligence and benchmarking",
+    "regional landscape and adoption outlook",
+    "end-user dynamics and use case",
+    "recent developments + opportunities & restraints",
+    "opportunities & restraints",
+)
+# One word from each target heading; clean_heading only trims prefixes, collapses whitespace and drops
+# "section N" labels, so without a label every heading it can produce still has its word in the raw text
+TARGET_HEADING_WORDS = ("strategic", "segmentation", "innovation", "benchmarking", "adoption", "end-user", "restraints")
+
+# Regional headings that should only be h2 when inside "Regional Landscape" section
+# (lookups take the first entry found, so the LAMEA and "(mea)" spellings are covered by their
+# "latin america" / "middle east and africa" prefixes; cleaned text is already lowercase)
+REGIONAL_HEADINGS = (
+    "north america",
+    "north-america",
+    "europe",
+    "asia pacific",
+    "asia-pacific",
+    "latin america",
+    "latin-america",
+    "middle east and africa",
+    "middle east & africa",
+    "middle-east and africa",
+    "middle-east & africa",
+)
+
+# Opportunities heading that should only be h2 when inside "Recent Developments" section
+OPPORTUNITIES_HEADINGS = ("opportunities", "restraints", "Opportunities & Restraints")
+
+# Section titles that end the description
+END_CAPTURE_PHRASES = (
+    "report summary, faqs, and seo schema",
+    "report title",
+    "report coverage table",
+    "7.1. report coverage table",
+    "report coverage",
+    "faqs and seo schema",
+)
+
+# One alternation per list tells whether any entry occurs at all; most paragraphs match none,
+# and the list-order lookups only run when one does
+TARGET_HEADING_RE = re.compile('|'.join(map(re.escape, TARGET_HEADINGS)))
+REGIONAL_HEADING_RE = re.compile('|'.join(map(re.escape, REGIONAL_HEADINGS)))
+OPPORTUNITIES_HEADING_RE = re.compile('|'.join(map(re.escape, OPPORTUNITIES_HEADINGS)))
+END_CAPTURE_RE = re.compile('|'.join(map(re.escape, END_CAPTURE_PHRASES)))
+
+# Punctuation that rules a paragraph out as a standalone heading, widest set first
+PUNCTUATION_RE = re.compile(r'[,.;:!?]')
+PUNCTUATION_NO_COLON_RE = re.compile(r'[,.;!?]')
+SENTENCE_PUNCTUATION_RE = re.compile(r'[.;!?]')
+STRONG_PUNCTUATION_RE = re.compile(r'[;!?]')
+
+
+def _normalize_bold_word(word: str) -> str:
+    """Lowercase a leading bold word without its "1." numbering; most words have none, so the regex is skipped."""
+    if word[:1].isdecimal():
+        word = NUMBERED_POINT_RE.sub('', word)
+    return word.strip().lower()
+
+
+def _bold_word_spacing(content, is_short_bold, leading_bold, bold_word, previous_bold_word):
+    """Decide whether a section paragraph gets &nbsp; above it; returns (add_nbsp, previous_bold_word)."""
+    add_nbsp = False
+    # First check: If entire paragraph is bold (p tag with bold content), short and not a label
+    if is_short_bold:
+        if leading_bold:
+            # Don't add &nbsp; if this is the same bold word as previous paragraph
+            add_nbsp = bold_word != previous_bold_word
+            previous_bold_word = bold_word
+    # Second check: If first word is bold and not followed by a colon
+    elif leading_bold:
+        if not content[leading_bold.end():].strip().startswith(':'):
+            # A bold word contained in the previous one (or vice versa) is the same company in a different format
+            is_same_company = bool(previous_bold_word) and (
+                bold_word in previous_bold_word or previous_bold_word in bold_word)
+            if is_same_company:
+                logger.debug("Same company detected: '%s' vs '%s'", bold_word, previous_bold_word)
+            add_nbsp = bold_word != previous_bold_word and not is_same_company
+        previous_bold_word = bold_word
+    # Special check for numbered points like "7. Company Name" (the pattern needs a digit right after "<b>")
+    if not add_nbsp and content[3:4].isdecimal() and BOLD_NUMBERED_POINT_RE.match(content):
+        add_nbsp = True
+    return add_nbsp, previous_bold_word
+
+
+def extract_description(docx_path, doc=None):
+    if doc is None:
+        doc = Document(docx_path)
     html_output = []
-    capture, inside_list = False, None
+    capture, inside_list = False, False  # inside_list: a <ul> is open
     last_heading = None
     used_headings = set()
     inside_regional_section = False
@@ -3246,163 +3516,117 @@ def extract_description(docx_path):
 
     
 
-    target_headings = [
-        "introduction and strategic context",
-        "market segmentation and forecast scope",
-        "market trends and innovation landscape",
-        "competitive intelligence and benchmarking",
-        "regional landscape and adoption outlook",
-        "end-user dynamics and use case",
-        "recent developments + opportunities & restraints",
-        "opportunities & restraints"
-        
-    ]
-    
-    # Regional headings that should only be h2 when inside "Regional Landscape" section
-    regional_headings = [
-        "north america",
-        "north-america",
-        "europe", 
-        "asia pacific",
-        "asia-pacific",
-        "latin america",
-        "latin-america",
-        "latin america and middle east & africa (lamea)",
-        "latin america & middle east & africa (lamea)",
-        "latin america & middle east and africa (lamea)",
-        "latin-america and middle east & africa (lamea)",
-        "latin-america & middle east & africa (lamea)",
-        "latin-america & middle east and africa (lamea)",
-        "latin america and middle-east & africa (lamea)",
-        "latin america & middle-east & africa (lamea)",
-        "latin america & middle-east and africa (lamea)",
-        "latin-america and middle-east & africa (lamea)",
-        "latin-america & middle-east & africa (lamea)",
-        "latin-america & middle-east and africa (lamea)",
-        "latin america and middle east & africa (LAMEA)",
-        "latin america & middle east & africa (LAMEA)",
-        "latin america & middle east and africa (LAMEA)",
-        "middle east and africa",
-        "middle east & africa",
-        "middle east and africa (mea)",
-        "middle east & africa (mea)",
-        "middle-east and africa",
-        "middle-east & africa",
-        "middle-east and africa (mea)",
-        "middle-east & africa (mea)"
-    ]
-    
-    # Opportunities heading that should only be h2 when inside "Recent Developments" section
-    opportunities_heading = ["opportunities","restraints","Opportunities & Restraints"]
-    
     # Segmentation headings now use pattern-based detection (any "By X" format)
     # No keyword list needed - automatically detects all "By X" patterns
 
     def clean_heading(text):
-        text = remove_emojis(text.strip())
-        text = re.sub(r'^[^\w]+', '', text)
-        text = re.sub(r'(?i)section\s*\d+[:\-]?\s*', '', text)
-        text = re.sub(r'^\d+[\.\-\)]\s*', '', text)
-        text = re.sub(r'\s+', ' ', text)
+        # text has already been through remove_emojis, and the leading-symbol pass and final
+        # strip() take care of surrounding whitespace
+        text = HEADING_LEAD_SYMBOLS_RE.sub('', text)
+        text = SECTION_LABEL_RE.sub('', text)
+        text = HEADING_NUMBER_RE.sub('', text)
+        text = WHITESPACE_RUN_RE.sub(' ', text)
         return text.lower().strip()
 
+    h2_emitted = False  # Set once the first <h2> heading is in html_output
+
     def add_nbsp_safely(content=None):
         """Add &nbsp; only if the last item is not already &nbsp; and not before first heading"""
-        if not html_output or html_output[-1] != "&nbsp;":
-            # Check if this would be before the first heading
-            if not any("<h2><strong>" in item for item in html_output):
-                return  # Don't add &nbsp; before first heading
-            
-            # If content is provided, only add &nbsp; for long content (>= 200 chars)
-            # Exception: Always add &nbsp; for numbered points (1., 2., 3., etc.)
-            if content is not None and len(content) < 200:
-                # Check if this is a numbered point
-                if re.match(r'^\d+\.\s*', content.strip()):
-                    html_output.append("&nbsp;")
-                    return
-                return
-                
-            html_output.append("&nbsp;")
-
-    for block in doc.element.body:
+        # Nothing goes in before the first heading, and once it is emitted html_output is never empty
+        if not h2_emitted or html_output[-1] == "&nbsp;":
+            return
+
+        # If content is provided, only add &nbsp; for long content (>= 200 chars)
+        # Exception: Always add &nbsp; for numbered points (1., 2., 3., etc.)
+        if content is not None and len(content) < 200:
+            # Check if this is a numbered point
+            if NUMBERED_POINT_RE.match(content.strip()):
+                html_output.append("&nbsp;")
+            return
+
+        html_output.append("&nbsp;")
+
+    # Only paragraphs and tables are handled, so lxml skips section properties and other body children
+    for block in doc.element.body.iterchildren(qn('w:p'), qn('w:tbl')):
         if isinstance(block, CT_P):  
             para = Paragraph(block, doc)
-            text = remove_emojis(para.text.strip())
+            text = para.text.strip()
+            if not text:
+                continue
+            text = remove_emojis(text)
             if not text:
                 continue
 
+            if not capture:
+                # Before capture only the start check runs, so skip clean_heading when it cannot find a heading
+                text_lower = text.lower()
+                if (text.isascii() and 'section' not in text_lower
+                        and not any(word in text_lower for word in TARGET_HEADING_WORDS)):
+                    continue
+
             cleaned = clean_heading(text)
+            has_target_heading = TARGET_HEADING_RE.search(cleaned) is not None
 
             # Start capture
-            if not capture and any(h in cleaned for h in target_headings):
+            if not capture and has_target_heading:
                 capture = True  
 
             # End capture - enhanced conditions
-            if capture and any(end_phrase in cleaned for end_phrase in [
-                "report summary, faqs, and seo schema",
-                "report title",
-                "report coverage table",
-                "7.1. report coverage table",
-                "report coverage",
-                "faqs and seo schema"
-            ]):
+            if capture and END_CAPTURE_RE.search(cleaned):
                 break  
 
             if capture:
-                content = runs_to_html(para.runs)
-                matched_heading = next((h for h in target_headings if h in cleaned), None)
+                matched_heading = next((h for h in TARGET_HEADINGS if h in cleaned), None) if has_target_heading else None
+                # A new main heading is written from matched_heading alone, so the runs are only rendered
+                # and the other heading kinds only looked for when the paragraph is not one
+                is_new_heading = matched_heading is not None and matched_heading not in used_headings
+                regional_heading = opportunities_match = segmentation_heading = None
+                if not is_new_heading:
+                    content = runs_to_html(para.runs)  # already stripped
+                    content_lower = content.lower()
                 
-                # Check for regional headings with more flexible matching
-                regional_heading = None
-                for h in regional_headings:
-                    if h in cleaned:
-                        regional_heading = h
-                        break
+                    # Check for regional headings with more flexible matching
+                    if REGIONAL_HEADING_RE.search(cleaned):
+                        regional_heading = next(h for h in REGIONAL_HEADINGS if h in cleaned)
                 
-                # Special check for LAMEA - simple direct matching
-                if not regional_heading and inside_regional_section:
-                    # Direct check for LAMEA text pattern
-                    if ("latin america" in cleaned and "middle east" in cleaned and "africa" in cleaned and 
-                        ("lamea" in cleaned or "LAMEA" in text)):
-                        regional_heading = "latin america and middle east & africa (lamea)"
-                        print(f"DEBUG LAMEA: Direct match found for LAMEA heading")
+                    # Special check for LAMEA - simple direct matching
+                    if not regional_heading and inside_regional_section:
+                        # Direct check for LAMEA text pattern
+                        if ("latin america" in cleaned and "middle east" in cleaned and "africa" in cleaned and 
+                            ("lamea" in cleaned or "LAMEA" in text)):
+                            regional_heading = "latin america and middle east & africa (lamea)"
+                            logger.debug("LAMEA: Direct match found for LAMEA heading")
                     
-                    # Also check in content with HTML tags
-                    elif ("latin america" in content.lower() and "middle east" in content.lower() and 
-                          "africa" in content.lower() and ("lamea" in content.lower() or "LAMEA" in content)):
-                        regional_heading = "latin america and middle east & africa (lamea)"
-                        print(f"DEBUG LAMEA: Content match found for LAMEA heading")
-                
-                # Check for opportunities heading
-                opportunities_match = next((h for h in opportunities_heading if h in cleaned), None)
+                        # Also check in content with HTML tags
+                        elif ("latin america" in content_lower and "middle east" in content_lower and 
+                              "africa" in content_lower and "lamea" in content_lower):
+                            regional_heading = "latin america and middle east & africa (lamea)"
+                            logger.debug("LAMEA: Content match found for LAMEA heading")
                 
-                # Check for segmentation headings with pattern-based detection
-                segmentation_heading = None
+                    # Check for opportunities heading
+                    if OPPORTUNITIES_HEADING_RE.search(cleaned):
+                        opportunities_match = next(h for h in OPPORTUNITIES_HEADINGS if h in cleaned)
                 
-                # Pattern-based detection for "By X" format headings
-                # ONLY check in segmentation section (between "Market Segmentation And Forecast Scope" and "Market Trends And Innovation Landscape")
-                if inside_segmentation_section:
-                    # Check both cleaned text and content for "By X" pattern
-                    text_to_check = cleaned
-                    content_to_check = content.lower()
-                    
-                    # Check for "by X" pattern in cleaned text
-                    if re.match(r'^by\s+', text_to_check):
-                        match = re.match(r'^by\s+(.+)', text_to_check)
-                        if match:
-                            segmentation_heading = f"by {match.group(1)}"
-                            print(f"DEBUG: Found segmentation heading by pattern: '{text}' -> '{segmentation_heading}'")
+                    # Check for segmentation headings with pattern-based detection
+                    # Pattern-based detection for "By X" format headings
+                    # ONLY check in segmentation section (between "Market Segmentation And Forecast Scope" and "Market Trends And Innovation Landscape")
+                    if inside_segmentation_section:
+                        # Check for "by X" pattern in cleaned text (whitespace is already collapsed and
+                        # stripped, so the whole cleaned text is the heading)
+                        if cleaned.startswith('by '):
+                            segmentation_heading = cleaned
+                            logger.debug("Found segmentation heading by pattern: '%s' -> '%s'", text, segmentation_heading)
                     
-                    # Also check in content for bold "By X" patterns
-                    elif re.search(r'<b>\s*by\s+', content_to_check):
-                        bold_match = re.search(r'<b>\s*by\s+([^<]+)</b>', content_to_check)
-                        if bold_match:
-                            segmentation_heading = f"by {bold_match.group(1).strip()}"
-                            print(f"DEBUG: Found bold segmentation heading: '{text}' -> '{segmentation_heading}'")
+                        # Also check in content for bold "By X" patterns
+                        else:
+                            bold_match = BOLD_BY_HEADING_RE.search(content_lower)
+                            if bold_match:
+                                segmentation_heading = f"by {bold_match.group(1).strip()}"
+                                logger.debug("Found bold segmentation heading: '%s' -> '%s'", text, segmentation_heading)
                 
                 # No fallback needed - pattern-based detection handles all "By X" formats
 
-                if matched_heading and matched_heading not in used_headings:
+                if is_new_heading:
                     last_heading = matched_heading
                     if matched_heading == "report coverage table":
                         last_heading = "report coverage table"  # flag set
@@ -3457,7 +3681,7 @@ def extract_description(docx_path):
                         inside_market_trends_section = False
                         inside_competitive_intelligence_section = False
                         inside_end_user_dynamics_section = False  # Stop End-User Dynamics logic here
-                    elif matched_heading in ["end-user dynamics and use case"]:
+                    elif matched_heading == "end-user dynamics and use case":
                         inside_regional_section = False
                         inside_recent_developments_section = False
                         inside_introduction_section = False
@@ -3469,39 +3693,41 @@ def extract_description(docx_path):
                         inside_end_user_dynamics_section = True  # Start End-User Dynamics logic
 
                     if inside_list:
-                        html_output.append(f"</{inside_list}>")
-                        inside_list = None
+                        html_output.append("</ul>")
+                        inside_list = False
 
                     # ✅ Add &nbsp; before all main headings EXCEPT "Introduction And Strategic Context"
                     if matched_heading != "introduction and strategic context":
                         add_nbsp_safely()
                     
                     html_output.append(f"<h2><strong>{matched_heading.title()}</strong></h2>")
+                    h2_emitted = True
                     used_headings.add(matched_heading)
                 
                 # Handle regional headings only when inside regional section
                 elif regional_heading and inside_regional_section and regional_heading not in used_headings:
+                    text_lower = text.strip().lower()
                     # Check if it's a standalone heading (no text before or after in the same paragraph)
                     is_standalone = (
                         len(text.strip()) <= len(regional_heading) + 10 and  # Allow more extra characters for longer headings
-                        text.strip().lower().startswith(regional_heading.lower()) and
-                        not any(char in text for char in [',', '.', ';', ':', '!', '?'])  # No punctuation
+                        text_lower.startswith(regional_heading) and
+                        not PUNCTUATION_RE.search(text)  # No punctuation
                     )
                     
                     # Check for numbered/bulleted regional headings like "1. North America", "• Europe", etc.
                     if not is_standalone:
                         # Remove numbering and bullets to check the core heading
-                        cleaned_for_regional = re.sub(r'^\d+[\.\)]\s*', '', text.strip())  # Remove "1. ", "2) ", etc.
-                        cleaned_for_regional = re.sub(r'^[•\-–]\s*', '', cleaned_for_regional)  # Remove bullets
+                        cleaned_for_regional = LIST_NUMBER_RE.sub('', text.strip())  # Remove "1. ", "2) ", etc.
+                        cleaned_for_regional = BULLET_RE.sub('', cleaned_for_regional)  # Remove bullets
                         cleaned_for_regional = cleaned_for_regional.lower()
                         
                         # Check if the cleaned text matches any regional heading
-                        for h in regional_headings:
+                        for h in REGIONAL_HEADINGS:
                             if h in cleaned_for_regional or cleaned_for_regional.startswith(h):
                                 # Check if it's reasonably short (not a long paragraph)
-                                if len(text.strip()) <= 50 and not any(char in text for char in [';', '!', '?']):
+                                if len(text.strip()) <= 50 and not STRONG_PUNCTUATION_RE.search(text):
                                     is_standalone = True
-                                    print(f"DEBUG: Found numbered/bulleted regional heading: '{text}' -> '{h}'")
+                                    logger.debug("Found numbered/bulleted regional heading: '%s' -> '%s'", text, h)
                                     break
                     
                     # Simple check for LAMEA standalone heading
@@ -3510,30 +3736,27 @@ def extract_description(docx_path):
                         text_length = len(text.strip())
                         # LAMEA heading is around 50 characters, allow up to 80
                         if (text_length <= 80 and 
-                            not any(char in text for char in ['.', ';', '!', '?']) and  # Allow commas and colons
-                            ("latin america" in text.lower() or "latin america" in content.lower())):
+                            not SENTENCE_PUNCTUATION_RE.search(text) and  # Allow commas and colons
+                            ("latin america" in text_lower or "latin america" in content_lower)):
                             is_standalone = True
-                            print(f"DEBUG LAMEA: Simple standalone check passed for: '{text}'")
+                            logger.debug("LAMEA: Simple standalone check passed for: '%s'", text)
                     
                     # Additional fallback for longer regional headings
                     if not is_standalone and regional_heading and len(regional_heading) > 30:
                         # More flexible check for long regional headings
-                        cleaned_text = text.strip().lower()
-                        content_text = content.lower()
-                        
                         # Check both original text and content (with HTML)
-                        if ((regional_heading in cleaned_text and 
-                             len(cleaned_text) <= len(regional_heading) + 15) or
-                            ("latin america" in content_text and "middle east" in content_text and 
-                             "africa" in content_text and ("lamea" in content_text or "LAMEA" in content_text))):
+                        if ((regional_heading in text_lower and 
+                             len(text_lower) <= len(regional_heading) + 15) or
+                            ("latin america" in content_lower and "middle east" in content_lower and 
+                             "africa" in content_lower and "lamea" in content_lower)):
                             # Additional check: no sentence punctuation
-                            if not any(char in text for char in [',', '.', ';', ':', '!', '?']):
+                            if not PUNCTUATION_RE.search(text):
                                 is_standalone = True
                     
                     if is_standalone:
                         if inside_list:
-                            html_output.append(f"</{inside_list}>")
-                            inside_list = None
+                            html_output.append("</ul>")
+                            inside_list = False
 
                         # ✅ Add &nbsp; before <h2>, but not after
                         add_nbsp_safely()
@@ -3548,31 +3771,32 @@ def extract_description(docx_path):
                         title_text = text.strip()
                         if "<b>" in content and "</b>" in content:
                             # Extract text from bold tags for cleaner title
-                            bold_match = re.search(r'<b>(.*?)</b>', content)
+                            bold_match = BOLD_TEXT_RE.search(content)
                             if bold_match:
                                 title_text = bold_match.group(1)
                         
                         # Clean up numbered/bulleted text for title
-                        title_text = re.sub(r'^\d+[\.\)]\s*', '', title_text)  # Remove "1. ", "2) "
-                        title_text = re.sub(r'^[•\-–]\s*', '', title_text)  # Remove bullets
+                        title_text = LIST_NUMBER_RE.sub('', title_text)  # Remove "1. ", "2) "
+                        title_text = BULLET_RE.sub('', title_text)  # Remove bullets
                         title_text = title_text.strip()
                         
                         html_output.append(f"<h2><strong>{title_text}</strong></h2>")
+                        h2_emitted = True
                         used_headings.add(regional_heading)
                     else:
                         # It's part of a larger sentence, treat as normal paragraph
                         if inside_list:
-                            html_output.append(f"</{inside_list}>")
-                            inside_list = None
+                            html_output.append("</ul>")
+                            inside_list = False
                         
                         # Special logic for Regional Landscape section: Add &nbsp; above paragraphs with regional heading + next word not bold
                         if inside_regional_landscape_section and not is_list_item(para):
                             # Check if this is a regional heading but next word is not bold
                             # Look for pattern: <b>RegionalHeading</b> followed by non-bold text
-                            regional_heading_bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
+                            regional_heading_bold_match = LEADING_BOLD_RE.match(content)
                             if regional_heading_bold_match:
                                 # Check if the next word after bold is not bold
-                                remaining_content = content.strip()[len(regional_heading_bold_match.group(0)):].strip()
+                                remaining_content = content[len(regional_heading_bold_match.group(0)):].strip()
                                 # If there's content after bold word, check if it doesn't start with <b>
                                 if remaining_content and not remaining_content.startswith('<b>'):
                                     # Add &nbsp; above paragraphs with regional heading + next word not bold
@@ -3584,21 +3808,24 @@ def extract_description(docx_path):
                 # Handle opportunities heading only when inside recent developments section
                 elif opportunities_match and inside_recent_developments_section and opportunities_match not in used_headings:
                     if inside_list:
-                        html_output.append(f"</{inside_list}>")
-                        inside_list = None
+                        html_output.append("</ul>")
+                        inside_list = False
 
                     # ✅ Add &nbsp; before <h2>, but not after
                     add_nbsp_safely()
                     html_output.append(f"<h2><strong>{opportunities_match.title()}</strong></h2>")
+                    h2_emitted = True
                     used_headings.add(opportunities_match)
                 
                 # Handle segmentation headings (both keyword-based and pattern-based)
                 elif segmentation_heading and segmentation_heading not in used_headings:
+                    # segmentation_heading comes from lowercased text, so only the paragraph needs lowering
+                    text_lower = text.strip().lower()
                     # Check if it's a standalone heading (no text before or after in the same paragraph)
                     is_standalone = (
                         len(text.strip()) <= len(segmentation_heading) + 10 and  # Allow more extra characters for punctuation
-                        text.strip().lower().startswith(segmentation_heading.lower()) and
-                        not any(char in text for char in [',', '.', ';', '!', '?'])  # No punctuation (allow colon)
+                        text_lower.startswith(segmentation_heading) and
+                        not PUNCTUATION_NO_COLON_RE.search(text)  # No punctuation (allow colon)
                     )
                     
                     # Special case: if text ends with colon and is close to heading length, treat as standalone
@@ -3609,23 +3836,23 @@ def extract_description(docx_path):
                     if not is_standalone and len(text.strip()) <= len(segmentation_heading) + 5:
                         # Check if the text contains the heading pattern (for hyphen/underscore variations)
                         base_pattern = segmentation_heading.replace(' ', '').replace('-', '').replace('_', '')
-                        if base_pattern in text.strip().lower().replace(' ', '').replace('-', '').replace('_', ''):
+                        if base_pattern in text_lower.replace(' ', '').replace('-', '').replace('_', ''):
                             is_standalone = True
                     
                     # Pattern-based segmentation headings (like "By psychiatric condition")
                     if not is_standalone and segmentation_heading.startswith("by "):
                         # More flexible check for "By X" pattern headings
                         if (len(text.strip()) <= 50 and  # Reasonable length
-                            ("by " in text.lower() or "<b>by " in content.lower()) and
-                            not any(char in text for char in [';', '!', '?'])):  # No sentence punctuation
+                            ("by " in text.lower() or "<b>by " in content_lower) and
+                            not STRONG_PUNCTUATION_RE.search(text)):  # No sentence punctuation
                             is_standalone = True
-                            print(f"DEBUG: Pattern-based segmentation heading detected: '{text}'")
+                            logger.debug("Pattern-based segmentation heading detected: '%s'", text)
                     
                     
                     if is_standalone:
                         if inside_list:
-                            html_output.append(f"</{inside_list}>")
-                            inside_list = None
+                            html_output.append("</ul>")
+                            inside_list = False
 
                         # Set flag that we're inside a segmentation subheading
                         inside_segmentation_subheading = True
@@ -3640,36 +3867,36 @@ def extract_description(docx_path):
                                 html_output.append("&nbsp;")
                         
                         html_output.append(f"<h2><strong>{text.strip()}</strong></h2>")
+                        h2_emitted = True
                         used_headings.add(segmentation_heading)
                     else:
                         # It's part of a larger sentence, treat as normal paragraph
                         if inside_list:
-                            html_output.append(f"</{inside_list}>")
-                            inside_list = None
+                            html_output.append("</ul>")
+                            inside_list = False
                         html_output.append(f"<p style='line-height:1.6'>{content}</p>")
 
                 # Subheading detection → h3
-                elif re.match(r'^\d+(\.\d+)+', text.strip()):  
+                elif DOTTED_NUMBER_RE.match(text.strip()):  
                     if inside_list:
-                        html_output.append(f"</{inside_list}>")
-                        inside_list = None
+                        html_output.append("</ul>")
+                        inside_list = False
                     html_output.append(f"<h3><strong>{content}</strong></h3>")
 
                 elif is_list_item(para):
-                    if inside_list != "ul":
-                        if inside_list:
-                            html_output.append(f"</{inside_list}>")
+                    if not inside_list:
                         # Don't add &nbsp; before starting a list
                         html_output.append("<ul>")
-                        inside_list = "ul"
+                        inside_list = True
 
                     # ✅ CKEditor-friendly list items with p tags
                     html_output.append(f"<li><p>{content}</p></li>")
 
                 else:
+                    # List items were taken by the branch above, so the section checks below need no is_list_item call
                     if inside_list:
-                        html_output.append(f"</{inside_list}>")
-                        inside_list = None
+                        html_output.append("</ul>")
+                        inside_list = False
                     
                     # Check if this paragraph comes immediately after a main heading
                     is_after_main_heading = False
@@ -3677,263 +3904,36 @@ def extract_description(docx_path):
                         is_after_main_heading = True
                     
                     # Check if this paragraph is entirely bold (pure bold paragraph)
-                    is_entirely_bold = content.strip().startswith('<b>') and content.strip().endswith('</b>')
+                    is_entirely_bold = content.startswith('<b>') and content.endswith('</b>')
                     
                     # Check if this paragraph has any bold content
                     has_bold_content = "<b>" in content and "</b>" in content
+
+                    # Short, entirely bold paragraph that doesn't end with a colon (a bold line rather than a label)
+                    is_short_bold = is_entirely_bold and len(content) < 80 and not content.endswith(':')
+
+                    # Leading bold word (numbering removed, lowercased), shared by the section spacing checks below
+                    leading_bold = LEADING_BOLD_RE.match(content)
+                    leading_bold_word = _normalize_bold_word(leading_bold.group(1)) if leading_bold else None
                     
-                    # Special logic for Market Trends section: Add &nbsp; above paragraphs
-                    if inside_market_trends_section and not is_list_item(para) and not is_after_main_heading:
-                        should_add_nbsp = False
-                        
-                        # First check: If entire paragraph is bold (p tag with bold content)
-                        if is_entirely_bold and len(content) < 80 and not content.strip().endswith(':'):
-                            # Extract bold word from entirely bold paragraph for consecutive check
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Don't add &nbsp; if this is the same bold word as previous paragraph
-                                if current_bold_word != previous_bold_word:
-                                    should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        # Second check: If first word is bold (only if first check didn't match)
-                        elif content.strip():
-                            # Check if content starts with <b> followed by a word
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Check if the next word after bold is not a colon
-                                remaining_content = content.strip()[len(bold_match.group(0)):].strip()
-                                # If there's content after bold word, check if it doesn't start with colon
-                                if not remaining_content or not remaining_content.startswith(':'):
-                                    # Check if this is a company name continuation (same company, different format)
-                                    is_same_company = False
-                                    if previous_bold_word:
-                                        # Check if current word is contained in previous word or vice versa
-                                        if (current_bold_word in previous_bold_word or 
-                                            previous_bold_word in current_bold_word):
-                                            is_same_company = True
-                                            print(f"DEBUG: Same company detected: '{current_bold_word}' vs '{previous_bold_word}'")
-                                    
-                                    # Don't add &nbsp; if this is the same bold word or same company as previous paragraph
-                                    if current_bold_word != previous_bold_word and not is_same_company:
-                                        should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        
-                        # Special check for numbered points like "7. Company Name"
-                        if not should_add_nbsp and re.match(r'^<b>\d+\.\s*', content.strip()):
-                            should_add_nbsp = True
-                        
-                        if should_add_nbsp:
-                            # Add &nbsp; above paragraphs in Market Trends section
-                            if not html_output or html_output[-1] != "&nbsp;":
-                                html_output.append("&nbsp;")
-                    
-                    # Special logic for Competitive Intelligence section: Add &nbsp; above paragraphs
-                    if inside_competitive_intelligence_section and not is_list_item(para) and not is_after_main_heading:
-                        should_add_nbsp = False
-                        print(f"DEBUG: Competitive Intelligence section processing: {content.strip()[:30]}...")
-                        
-                        # Special check for numbered points like "7. Company Name"
-                        if re.match(r'^<b>\d+\.\s*', content.strip()):
-                            should_add_nbsp = True
-                        
-                        # First check: If entire paragraph is bold (p tag with bold content)
-                        if is_entirely_bold and len(content) < 80 and not content.strip().endswith(':'):
-                            # Extract bold word from entirely bold paragraph for consecutive check
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Don't add &nbsp; if this is the same bold word as previous paragraph
-                                if current_bold_word != previous_bold_word:
-                                    should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        # Second check: If first word is bold (only if first check didn't match)
-                        elif content.strip():
-                            # Check if content starts with <b> followed by a word
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Check if the next word after bold is not a colon
-                                remaining_content = content.strip()[len(bold_match.group(0)):].strip()
-                                # If there's content after bold word, check if it doesn't start with colon
-                                if not remaining_content or not remaining_content.startswith(':'):
-                                    # Check if this is a company name continuation (same company, different format)
-                                    is_same_company = False
-                                    if previous_bold_word:
-                                        # Check if current word is contained in previous word or vice versa
-                                        if (current_bold_word in previous_bold_word or 
-                                            previous_bold_word in current_bold_word):
-                                            is_same_company = True
-                                            print(f"DEBUG: Same company detected: '{current_bold_word}' vs '{previous_bold_word}'")
-                                    
-                                    # Don't add &nbsp; if this is the same bold word or same company as previous paragraph
-                                    if current_bold_word != previous_bold_word and not is_same_company:
-                                        should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        
-                        # Special check for numbered points like "7. Company Name"
-                        if not should_add_nbsp and re.match(r'^<b>\d+\.\s*', content.strip()):
-                            should_add_nbsp = True
-                            print(f"DEBUG: Competitive Intelligence - Special check triggered for: {content.strip()[:50]}...")
-                        
-                        if should_add_nbsp:
-                            # Add &nbsp; above paragraphs in Competitive Intelligence section
-                            if not html_output or html_output[-1] != "&nbsp;":
-                                html_output.append("&nbsp;")
-                                print(f"DEBUG: Competitive Intelligence - Added &nbsp; for: {content.strip()[:30]}...")
-                    
-                    # Special logic for End-User Dynamics section: Add &nbsp; above paragraphs
-                    if inside_end_user_dynamics_section and not is_list_item(para) and not is_after_main_heading:
-                        should_add_nbsp = False
-                        
-                        # First check: If entire paragraph is bold (p tag with bold content)
-                        if is_entirely_bold and len(content) < 80 and not content.strip().endswith(':'):
-                            # Extract bold word from entirely bold paragraph for consecutive check
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Don't add &nbsp; if this is the same bold word as previous paragraph
-                                if current_bold_word != previous_bold_word:
-                                    should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        # Second check: If first word is bold (only if first check didn't match)
-                        elif content.strip():
-                            # Check if content starts with <b> followed by a word
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Check if the next word after bold is not a colon
-                                remaining_content = content.strip()[len(bold_match.group(0)):].strip()
-                                # If there's content after bold word, check if it doesn't start with colon
-                                if not remaining_content or not remaining_content.startswith(':'):
-                                    # Check if this is a company name continuation (same company, different format)
-                                    is_same_company = False
-                                    if previous_bold_word:
-                                        # Check if current word is contained in previous word or vice versa
-                                        if (current_bold_word in previous_bold_word or 
-                                            previous_bold_word in current_bold_word):
-                                            is_same_company = True
-                                            print(f"DEBUG: Same company detected: '{current_bold_word}' vs '{previous_bold_word}'")
-                                    
-                                    # Don't add &nbsp; if this is the same bold word or same company as previous paragraph
-                                    if current_bold_word != previous_bold_word and not is_same_company:
-                                        should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        
-                        # Special check for numbered points like "7. Company Name"
-                        if not should_add_nbsp and re.match(r'^<b>\d+\.\s*', content.strip()):
-                            should_add_nbsp = True
-                            print(f"DEBUG: End-User Dynamics - Special check triggered for: {content.strip()[:50]}...")
-                        
-                        if should_add_nbsp:
-                            # Add &nbsp; above paragraphs in End-User Dynamics section
-                            if not html_output or html_output[-1] != "&nbsp;":
-                                html_output.append("&nbsp;")
-                                print(f"DEBUG: End-User Dynamics - Added &nbsp; for: {content.strip()[:30]}...")
-                    
-                    # Special logic for Regional Landscape section: Add &nbsp; above paragraphs
-                    if inside_regional_landscape_section and not is_list_item(para) and not is_after_main_heading:
-                        should_add_nbsp = False
-                        
-                        # First check: If entire paragraph is bold (p tag with bold content)
-                        if is_entirely_bold and len(content) < 80 and not content.strip().endswith(':'):
-                            # Extract bold word from entirely bold paragraph for consecutive check
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Don't add &nbsp; if this is the same bold word as previous paragraph
-                                if current_bold_word != previous_bold_word:
-                                    should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        # Second check: If first word is bold (only if first check didn't match)
-                        elif content.strip():
-                            # Check if content starts with <b> followed by a word
-                            bold_match = re.match(r'^<b>([^<]+)</b>', content.strip())
-                            if bold_match:
-                                # Normalize bold word by removing common prefixes (numbers, bullets, etc.) and make lowercase
-                                raw_bold_word = bold_match.group(1)
-                                normalized_bold_word = re.sub(r'^\d+\.\s*', '', raw_bold_word).strip().lower()
-                                current_bold_word = normalized_bold_word
-                                # Check if the next word after bold is not a colon
-                                remaining_content = content.strip()[len(bold_match.group(0)):].strip()
-                                # If there's content after bold word, check if it doesn't start with colon
-                                if not remaining_content or not remaining_content.startswith(':'):
-                                    # Check if this is a company name continuation (same company, different format)
-                                    is_same_company = False
-                                    if previous_bold_word:
-                                        # Check if current word is contained in previous word or vice versa
-                                        if (current_bold_word in previous_bold_word or 
-                                            previous_bold_word in current_bold_word):
-                                            is_same_company = True
-                                            print(f"DEBUG: Same company detected: '{current_bold_word}' vs '{previous_bold_word}'")
-                                    
-                                    # Don't add &nbsp; if this is the same bold word or same company as previous paragraph
-                                    if current_bold_word != previous_bold_word and not is_same_company:
-                                        should_add_nbsp = True
-                                # Update previous bold word for next iteration
-                                previous_bold_word = current_bold_word
-                        
-                        # Special check for numbered points like "7. Company Name"
-                        if not should_add_nbsp and re.match(r'^<b>\d+\.\s*', content.strip()):
-                            should_add_nbsp = True
-                            print(f"DEBUG: Regional Landscape - Special check triggered for: {content.strip()[:50]}...")
-                        
-                        if should_add_nbsp:
-                            # Add &nbsp; above paragraphs in Regional Landscape section
-                            if not html_output or html_output[-1] != "&nbsp;":
+                    # Special logic for Market Trends, Competitive Intelligence, End-User Dynamics and Regional Landscape
+                    # sections: add &nbsp; above paragraphs that start a new bold word. The flags can overlap, and each
+                    # active section takes its turn so the bold word tracking advances the same way for every one.
+                    for in_spaced_section in (inside_market_trends_section, inside_competitive_intelligence_section,
+                                              inside_end_user_dynamics_section, inside_regional_landscape_section):
+                        if in_spaced_section and not is_after_main_heading:
+                            should_add_nbsp, previous_bold_word = _bold_word_spacing(
+                                content, is_short_bold, leading_bold, leading_bold_word, previous_bold_word)
+                            if should_add_nbsp and (not html_output or html_output[-1] != "&nbsp;"):
                                 html_output.append("&nbsp;")
-                                print(f"DEBUG: Regional Landscape - Added &nbsp; for: {content.strip()[:30]}...")
+                                logger.debug("Added &nbsp; for: %.30s...", content)
                     
                     # Special logic for Market Segmentation section: Add &nbsp; above bold paragraphs
-                    if inside_market_segmentation_section and is_entirely_bold and not is_after_main_heading:
-                        # Apply nbsp only for content with length < 100 characters and not ending with colon
-                        if (len(content) < 80 and not content.strip().endswith(':')):  # Only add if content is less than 100 characters and doesn't end with colon
-                            # Add &nbsp; directly without length check for Market Segmentation bold paragraphs
-                            if not html_output or html_output[-1] != "&nbsp;":
-                                html_output.append("&nbsp;")
-                    
-                    
+                    if inside_market_segmentation_section and is_short_bold and not is_after_main_heading:
+                        if not html_output or html_output[-1] != "&nbsp;":
+                            html_output.append("&nbsp;")
                     
-                    # No &nbsp; before paragraphs - only after paragraphs with length >= 200
                     
-                    # Add &nbsp; BEFORE the paragraph if we're in Segmentation section (only for main heading paragraphs, not sub-heading paragraphs)
-                    # Check if this paragraph comes after a segmentation subheading
-                    is_after_subheading = False
-                    if inside_segmentation_section:
-                        # Look at recent headings to see if we're after a segmentation subheading
-                        for recent_item in html_output[-10:]:  # Check last 10 items
-                            if "<h2><strong>By " in recent_item:
-                                is_after_subheading = True
-                                break
                     
                     # No &nbsp; before paragraphs - only after paragraphs with length >= 200
                     
@@ -3961,7 +3961,7 @@ def extract_description(docx_path):
             html_output.append(table_html)
 
     if inside_list:
-        html_output.append(f"</{inside_list}>")
+        html_output.append("</ul>")
 
     return "\n".join(html_output)
 
@@ -3973,20 +3973,24 @@ def runs_to_html(runs):
         txt = remove_emojis(run.text.strip())
         if not txt:
             continue
-        if run.bold and run.italic:
-            parts.append(f"<b><i>{txt}</i></b>")
-        elif run.bold:
-            parts.append(f"<b>{txt}</b>")
-        elif run.italic:
+        # bold and italic are XML look-ups on the run, so read each of them once
+        italic = run.italic
+        if run.bold:
+            parts.append(f"<b><i>{txt}</i></b>" if italic else f"<b>{txt}</b>")
+        elif italic:
             parts.append(f"<i>{txt}</i>")
         else:
             parts.append(txt)
     return " ".join(parts).strip()
 
  # ------------------- FAQ Schema + Methodology -------------------
-def _get_text(docx_path):
-    doc = Document(docx_path)
-    return "\n".join(p.text for p in doc.paragraphs if p.text and p.text.strip())
+def _get_text(docx_path, doc=None):
+    if doc is None:
+        doc = Document(docx_path)
+    # Paragraph.text is rebuilt from the runs on every access, so read it once per paragraph
+    return "\n".join(t for t in (p.text for p in doc.paragraphs) if t.strip())
+
+JSON_BRACE_RE = re.compile(r"[{}]")
 
 def _extract_json_block(text, type_name):
     pat = re.compile(r'"@type"\s*:\s*"' + re.escape(type_name) + r'"')
@@ -3996,31 +4000,32 @@ def _extract_json_block(text, type_name):
     start_idx = text.rfind("{", 0, m.start())
     if start_idx == -1:
         return ""
-    depth, i, n = 0, start_idx, len(text)
-    block_chars = []
-    while i < n:
-        ch = text[i]
-        block_chars.append(ch)
-        if ch == "{":
+    depth = 0
+    for brace in JSON_BRACE_RE.finditer(text, start_idx):
+        if brace.group() == "{":
             depth += 1
-        elif ch == "}":
+        else:
             depth -= 1
             if depth == 0:
-                break
-        i += 1
-    return "".join(block_chars).strip()
+                return text[start_idx:brace.end()]
+    return text[start_idx:].strip()
 
-def extract_faq_schema(docx_path):
-    text = _get_text(docx_path)
+def extract_faq_schema(docx_path, doc=None):
+    text = _get_text(docx_path, doc)
     return _extract_json_block(text, "FAQPage")
 
-def extract_methodology_from_faqschema(docx_path):
-    faq_schema_str = extract_faq_schema(docx_path)  
+@lru_cache(maxsize=512)
+def _escape_faq_text(text):
+    """html.escape for FAQ questions and answers, which repeat across documents of a batch."""
+    return html.escape(text)
+
+def extract_methodology_from_faqschema(docx_path, doc=None):
+    faq_schema_str = extract_faq_schema(docx_path, doc)  
     if not faq_schema_str:
         return ""   
     try:
         # Clean the JSON string by removing extra whitespace and newlines
-        cleaned_json = re.sub(r'\s+', ' ', faq_schema_str.strip())
+        cleaned_json = WHITESPACE_RUN_RE.sub(' ', faq_schema_str)
         faq_data = json.loads(cleaned_json)
     except json.JSONDecodeError:
         return ""   
@@ -4032,95 +4037,96 @@ def extract_methodology_from_faqschema(docx_path):
         answer = item.get("acceptedAnswer", {}).get("text", "").strip()
         if question and answer:
             faqs.append(
-                f"<p><strong>Q{q_count}: {html.escape(question)}</strong><br>"
-                f"A{q_count}: {html.escape(answer)}</p>"
+                f"<p><strong>Q{q_count}: {_escape_faq_text(question)}</strong><br>"
+                f"A{q_count}: {_escape_faq_text(answer)}</p>"
             )
     return "\n".join(faqs)
 
 # ------------------- Report Coverage -------------------
-def extract_report_coverage_table_with_style(docx_path):
-    doc = Document(docx_path)
-    print(f"DEBUG: Found {len(doc.tables)} tables in document")  # Debug log
+# "forecast period" and "market size" are covered by the word-pair checks below.
+REPORT_TABLE_KEYWORD_RE = re.compile(r"report attribute|report coverage table|revenue forecast")
+
+# Cell styles for the (first, second) column of each kind of report coverage table row
+REPORT_TABLE_HEADER_STYLES = (
+    "background-color:#4472c4; border-bottom:1px solid #4472c4; border-left:1px solid #4472c4; border-right:none; border-top:1px solid #4472c4; vertical-align:top; width:195px",
+    "background-color:#4472c4; border-bottom:1px solid #4472c4; border-left:none; border-right:1px solid #4472c4; border-top:1px solid #4472c4; vertical-align:top; width:370px",
+)
+REPORT_TABLE_SHADED_ROW_STYLES = (
+    "background-color:#d9e2f3; border-bottom:1px solid #8eaadb; border-left:1px solid #8eaadb; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:195px",
+    "background-color:#d9e2f3; border-bottom:1px solid #8eaadb; border-left:none; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:370px",
+)
+REPORT_TABLE_ROW_STYLES = (
+    "border-bottom:1px solid #8eaadb; border-left:1px solid #8eaadb; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:195px",
+    "border-bottom:1px solid #8eaadb; border-left:none; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:370px",
+)
+REPORT_TABLE_CELL_HTML = (
+    "                <td style='{}'>\n"
+    "                <p><strong>{}</strong></p>\n"
+    "                </td>"
+)
+REPORT_TABLE_HTML_OPEN = (
+    "<h2><strong>7.1. Report Coverage Table</strong></h2>\n"
+    "\n"
+    "<table cellspacing=0 style='border-collapse:collapse; width:100%'>\n"
+    "        <tbody>"
+)
+REPORT_TABLE_HTML_CLOSE = "        </tbody>\n</table>"
+
+def extract_report_coverage_table_with_style(docx_path, doc=None):
+    if doc is None:
+        doc = Document(docx_path)
+    # doc.tables and table.rows build fresh proxy lists on every access, so take each once
+    tables = doc.tables
+    logger.debug("Found %s tables in document", len(tables))  # Debug log
     
-    for table_idx, table in enumerate(doc.tables):
-        if len(table.rows) == 0:
+    for table_idx, table in enumerate(tables):
+        rows = table.rows
+        if len(rows) == 0:
             continue
             
-        first_row_text = " ".join([c.text.strip().lower() for c in table.rows[0].cells])
-        print(f"DEBUG: Table {table_idx} first row: {first_row_text}")  # Debug log
+        first_row_text = " ".join(c.text.strip().lower() for c in rows[0].cells)
+        logger.debug("Table %s first row: %s", table_idx, first_row_text)  # Debug log
         
         # Check if this looks like a report coverage table
         is_report_table = (
-            "report attribute" in first_row_text or 
-            "report coverage table" in first_row_text or
-            "forecast period" in first_row_text or
-            "market size" in first_row_text or
-            "revenue forecast" in first_row_text or
+            REPORT_TABLE_KEYWORD_RE.search(first_row_text) is not None or
             ("forecast" in first_row_text and "period" in first_row_text) or
             ("market" in first_row_text and "size" in first_row_text)
         )
         
         if is_report_table:
-            print(f"DEBUG: Found report coverage table at index {table_idx}")  # Debug log
-            html_parts = []
-            html_parts.append('<h2><strong>7.1. Report Coverage Table</strong></h2>')
-            html_parts.append('')
-            html_parts.append('<table cellspacing=0 style=\'border-collapse:collapse; width:100%\'>')
-            html_parts.append('        <tbody>')
+            logger.debug("Found report coverage table at index %s", table_idx)  # Debug log
+            html_parts = [REPORT_TABLE_HTML_OPEN]
             
-            for r_idx, row in enumerate(table.rows):
+            for r_idx, row in enumerate(rows):
                 html_parts.append('            <tr>')
-                
-                # Process each cell in the row
-                for c_idx, cell in enumerate(row.cells):
-                    text = remove_emojis(cell.text.strip())
-                    
-                    # Determine cell styling based on position
-                    if r_idx == 0:  # Header row
-                        if c_idx == 0:  # First column
-                            cell_style = "background-color:#4472c4; border-bottom:1px solid #4472c4; border-left:1px solid #4472c4; border-right:none; border-top:1px solid #4472c4; vertical-align:top; width:195px"
-                        else:  # Second column
-                            cell_style = "background-color:#4472c4; border-bottom:1px solid #4472c4; border-left:none; border-right:1px solid #4472c4; border-top:1px solid #4472c4; vertical-align:top; width:370px"
-                        
-                        html_parts.append(f'                <td style=\'{cell_style}\'>')
-                        html_parts.append(f'                <p><strong>{text}</strong></p>')
-                        html_parts.append(f'                </td>')
-                    
-                    else:  # Data rows
-                        # Alternate row colors
-                        bg_color = "#d9e2f3" if r_idx % 2 == 1 else ""
-                        
-                        if c_idx == 0:  # First column
-                            if bg_color:
-                                cell_style = f"background-color:{bg_color}; border-bottom:1px solid #8eaadb; border-left:1px solid #8eaadb; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:195px"
-                            else:
-                                cell_style = "border-bottom:1px solid #8eaadb; border-left:1px solid #8eaadb; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:195px"
-                        else:  # Second column
-                            if bg_color:
-                                cell_style = f"background-color:{bg_color}; border-bottom:1px solid #8eaadb; border-left:none; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:370px"
-                            else:
-                                cell_style = "border-bottom:1px solid #8eaadb; border-left:none; border-right:1px solid #8eaadb; border-top:none; vertical-align:top; width:370px"
-                        
-                        html_parts.append(f'                <td style=\'{cell_style}\'>')
-                        
-                        # Both columns are bold
-                        html_parts.append(f'                <p><strong>{text}</strong></p>')
-                        
-                        html_parts.append(f'                </td>')
-                
+
+                # Header row, then data rows with alternate row colors
+                if r_idx == 0:
+                    row_styles = REPORT_TABLE_HEADER_STYLES
+                elif r_idx % 2 == 1:
+                    row_styles = REPORT_TABLE_SHADED_ROW_STYLES
+                else:
+                    row_styles = REPORT_TABLE_ROW_STYLES
+
+                # Process each cell in the row; both columns are bold
+                html_parts.extend(
+                    REPORT_TABLE_CELL_HTML.format(row_styles[c_idx > 0], remove_emojis(cell.text.strip()))
+                    for c_idx, cell in enumerate(row.cells)
+                )
                 html_parts.append('            </tr>')
             
-            html_parts.append('        </tbody>')
-            html_parts.append('</table>')
-            print(f"DEBUG: Generated HTML for report coverage table")  # Debug log
+            html_parts.append(REPORT_TABLE_HTML_CLOSE)
+            logger.debug("Generated HTML for report coverage table")  # Debug log
             return "\n".join(html_parts)
     
-    print("DEBUG: No report coverage table found")  # Debug log
+    logger.debug("No report coverage table found")  # Debug log
     return ""
 
 # ------------------- Extra Extractors -------------------
-def extract_meta_description(docx_path):
-    doc = Document(docx_path)
+def extract_meta_description(docx_path, doc=None):
+    if doc is None:
+        doc = Document(docx_path)
     capture = False
     for para in doc.paragraphs:
         text = para.text.strip()
@@ -4132,20 +4138,28 @@ def extract_meta_description(docx_path):
             return text
     return ""
 
-def extract_seo_title(docx_path):
-    doc = Document(docx_path)
-    file_name = os.path.splitext(os.path.basename(docx_path))[0]
-    revenue_forecast = ""
-
-    def normalize_label(txt: str) -> str:
-        t = txt.strip().lower()
-        t = re.sub(r"\s+", " ", t)
+def _normalize_attribute_label(txt: str) -> str:
+    """Lowercase a report attribute label, collapse whitespace and spell forecast variants as "forecast in"."""
+    t = WHITESPACE_RUN_RE.sub(" ", txt.strip().lower())
+    if "forecast" in t:
         t = t.replace("forecast by", "forecast in")
         t = t.replace("forecasts in", "forecast in")
         t = t.replace("forecast (", "forecast in ")
-        t = t.replace(")", "")
-        return t
+    return t.replace(")", "")
+
+USD_RE = re.compile(r"USD", re.I)
+
+def _is_forecast_label(attr_raw):
+    """Whether a report attribute label implies the revenue/market size forecast for 2030."""
+    # The normalized label is only needed when the plain checks miss
+    attr_lower = attr_raw.lower()
+    if "2030" in attr_raw and ("revenue forecast" in attr_lower or "market size" in attr_lower):
+        return True
+    attr = _normalize_attribute_label(attr_raw)
+    return "revenue forecast" in attr and (" 2030" in attr or "forecast in" in attr)
 
+def _find_revenue_forecast(doc):
+    """Return the 2030 revenue forecast from the report attribute table, or "" if there is none."""
     for table in doc.tables:
         if not table.rows or not table.rows[0].cells:
             continue
@@ -4155,17 +4169,20 @@ def extract_seo_title(docx_path):
             details_idx = headers.index("details")
             for row in table.rows[1:]:
                 attr_raw = row.cells[attr_idx].text.strip()
-                attr = normalize_label(attr_raw)
                 details = row.cells[details_idx].text.strip()
-                # Match any variant that implies revenue/market size forecast for 2030
-                attr_lower = attr_raw.lower()
-                if (("revenue forecast" in attr and (" 2030" in attr or "forecast in" in attr)) or \
-                   ("revenue forecast" in attr_lower and "2030" in attr_raw)) or \
-                   (("market size forecast" in attr_lower or "market size" in attr_lower) and "2030" in attr_raw):
-                    revenue_forecast = re.sub(r"USD", "$", details, flags=re.I).strip()
+                if _is_forecast_label(attr_raw):
+                    revenue_forecast = USD_RE.sub("$", details).strip()
+                    if revenue_forecast:
+                        return revenue_forecast
                     break
-        if revenue_forecast:
-            break
+    return ""
+
+def extract_seo_title(docx_path, doc=None):
+    # Callers that already opened the document can pass it in to skip a second parse
+    if doc is None:
+        doc = Document(docx_path)
+    file_name = os.path.splitext(os.path.basename(docx_path))[0]
+    revenue_forecast = _find_revenue_forecast(doc)
 
     # SEO title: market name with spaces (no underscores)
     title_name = file_name.replace("_", " ")
@@ -4173,40 +4190,11 @@ def extract_seo_title(docx_path):
         return f"{title_name} Size ({revenue_forecast}) 2030"
     return title_name
 
-def extract_breadcrumb_text(docx_path):
+def extract_breadcrumb_text(docx_path, doc=None):
     file_name = os.path.splitext(os.path.basename(docx_path))[0]
-    revenue_forecast = ""
-    doc = Document(docx_path)
-
-    def normalize_label(txt: str) -> str:
-        t = txt.strip().lower()
-        t = re.sub(r"\s+", " ", t)
-        t = t.replace("forecast by", "forecast in")
-        t = t.replace("forecasts in", "forecast in")
-        t = t.replace("forecast (", "forecast in ")
-        t = t.replace(")", "")
-        return t
-
-    for table in doc.tables:
-        if not table.rows or not table.rows[0].cells:
-            continue
-        headers = [cell.text.strip().lower() for cell in table.rows[0].cells]
-        if "report attribute" in headers and "details" in headers:
-            attr_idx = headers.index("report attribute")
-            details_idx = headers.index("details")
-            for row in table.rows[1:]:
-                attr_raw = row.cells[attr_idx].text.strip()
-                attr = normalize_label(attr_raw)
-                details = row.cells[details_idx].text.strip()
-                # Match any variant that implies revenue/market size forecast for 2030
-                attr_lower = attr_raw.lower()
-                if (("revenue forecast" in attr and (" 2030" in attr or "forecast in" in attr)) or \
-                   ("revenue forecast" in attr_lower and "2030" in attr_raw)) or \
-                   (("market size forecast" in attr_lower or "market size" in attr_lower) and "2030" in attr_raw):
-                    revenue_forecast = re.sub(r"USD", "$", details, flags=re.I).strip()
-                    break
-        if revenue_forecast:
-            break
+    if doc is None:
+        doc = Document(docx_path)
+    revenue_forecast = _find_revenue_forecast(doc)
 
     # Breadcrumb: market name with spaces (no underscores)
     title_name = file_name.replace("_", " ")
@@ -4214,64 +4202,50 @@ def extract_breadcrumb_text(docx_path):
         return f"{title_name} Report 2030"
     return title_name
 
+# Every SKU rule turns its match into a space, so each pipeline runs as a single substitution:
+# "and"/"global" (case insensitive), "(...)" groups, and the separators the rule drops
+SKU_CODE_STRIP_RE = re.compile(r'(?i:\b(?:and|global)\b)|\([^)]*\)|[^a-zA-Z0-9\s]')
+SKU_URL_STRIP_RE = re.compile(r'[&-]|(?i:\band\b)|\([^)]*\)')
+
+@lru_cache(maxsize=4096)
 def extract_sku_code(docx_path):
-    import re
     sku_code = os.path.splitext(os.path.basename(docx_path))[0]
     
     # Apply new SKU processing rules:
     # 1. Replace "and" with space (case insensitive)
-    processed_sku = re.sub(r'\band\b', ' ', sku_code, flags=re.IGNORECASE)
-    
     # 2. Remove "Global" word (case insensitive)
-    processed_sku = re.sub(r'\bglobal\b', '', processed_sku, flags=re.IGNORECASE)
-    
     # 3. Remove parentheses and content inside, replace with space
-    processed_sku = re.sub(r'\([^)]*\)', ' ', processed_sku)
-    
-    # 4. Replace "- and" with single space (case insensitive)
-    processed_sku = re.sub(r'\s*-\s*and\b', ' ', processed_sku, flags=re.IGNORECASE)
-    
-    # 5. Replace hyphens with space
-    processed_sku = processed_sku.replace('-', ' ')
-    
-    # 6. Remove all special characters except letters, numbers and spaces
-    processed_sku = re.sub(r'[^a-zA-Z0-9\s]', ' ', processed_sku)
+    # 4. Replace "- and", hyphens and all other special characters except letters, numbers and spaces with space
+    processed_sku = SKU_CODE_STRIP_RE.sub(' ', sku_code)
     
-    # 7. Clean up multiple spaces and trim
-    processed_sku = re.sub(r'\s+', ' ', processed_sku).strip()
+    # 5. Clean up multiple spaces and trim
+    processed_sku = WHITESPACE_RUN_RE.sub(' ', processed_sku).strip()
     
-    # 8. Convert to lowercase
+    # 6. Convert to lowercase
     processed_sku = processed_sku.lower()
     
     return processed_sku
 
+@lru_cache(maxsize=4096)
 def extract_sku_url(docx_path):
-    import re
     sku_code = os.path.splitext(os.path.basename(docx_path))[0]
     
     # Apply same SKU processing rules as extract_sku_code:
-    # 1. Replace & with space
-    processed_sku = sku_code.replace('&', ' ')
-    
-    # 2. Replace - with space  
-    processed_sku = processed_sku.replace('-', ' ')
-    
-    # 3. Replace "and" with space (case insensitive)
-    processed_sku = re.sub(r'\band\b', ' ', processed_sku, flags=re.IGNORECASE)
-    
-    # 4. Remove parentheses and content inside, replace with space
-    processed_sku = re.sub(r'\([^)]*\)', ' ', processed_sku)
+    # 1. Replace & and - with space
+    # 2. Replace "and" with space (case insensitive)
+    # 3. Remove parentheses and content inside, replace with space
+    processed_sku = SKU_URL_STRIP_RE.sub(' ', sku_code)
     
-    # 5. Clean up multiple spaces and trim
-    processed_sku = re.sub(r'\s+', ' ', processed_sku).strip()
+    # 4. Clean up multiple spaces and trim
+    processed_sku = WHITESPACE_RUN_RE.sub(' ', processed_sku).strip()
     
-    # 6. Convert to lowercase
+    # 5. Convert to lowercase
     processed_sku = processed_sku.lower()
     
     return processed_sku
 
-def extract_breadcrumb_schema(docx_path):
-    text = _get_text(docx_path)
+def extract_breadcrumb_schema(docx_path, doc=None):
+    text = _get_text(docx_path, doc)
     breadcrumb_json = _extract_json_block(text, "BreadcrumbList")
     
     if not breadcrumb_json:
@@ -4305,8 +4279,9 @@ def extract_breadcrumb_schema(docx_path):
 # ------------------- Merge -------------------
 def merge_description_and_coverage(docx_path):
     try:
-        desc_html = extract_description(docx_path) or ""
-        coverage_html = extract_report_coverage_table_with_style(docx_path) or ""
+        doc = Document(docx_path)
+        desc_html = extract_description(docx_path, doc=doc) or ""
+        coverage_html = extract_report_coverage_table_with_style(docx_path, doc=doc) or ""
         merged_html = desc_html + "\n\n" + coverage_html if (desc_html or coverage_html) else ""
         return merged_html
     except Exception as e:
@@ -285,19 +285,20 @@ def _convert_worker(job_id: str):
 
             logger.info(f"Processing {file}... ({i+1}/{total_files})")
 
-            # extract fields
-            title = extractor.extract_title(str(path))
-            description = extractor.extract_description(str(path))
-            toc = extractor.extract_toc(str(path))
-            methodology = extractor.extract_methodology_from_faqschema(str(path))
-            seo_title = extractor.extract_seo_title(str(path))
-            breadcrumb_text = extractor.extract_breadcrumb_text(str(path))
+            # extract fields; parse the document once and share it across the extractors for this file
+            doc = extractor.Document(str(path))
+            title = extractor.extract_title(str(path), doc=doc)
+            description = extractor.extract_description(str(path), doc=doc)
+            toc = extractor.extract_toc(str(path), doc=doc)
+            methodology = extractor.extract_methodology_from_faqschema(str(path), doc=doc)
+            seo_title = extractor.extract_seo_title(str(path), doc=doc)
+            breadcrumb_text = extractor.extract_breadcrumb_text(str(path), doc=doc)
             skucode = extractor.extract_sku_code(str(path))
             urlrp = extractor.extract_sku_code(str(path))
-            breadcrumb_schema = extractor.extract_breadcrumb_schema(str(path))
-            meta = extractor.extract_meta_description(str(path))
-            schema2 = extractor.extract_faq_schema(str(path))
-            report = extractor.extract_report_coverage_table_with_style(str(path))
+            breadcrumb_schema = extractor.extract_breadcrumb_schema(str(path), doc=doc)
+            meta = extractor.extract_meta_description(str(path), doc=doc)
+            schema2 = extractor.extract_faq_schema(str(path), doc=doc)
+            report = extractor.extract_report_coverage_table_with_style(str(path), doc=doc)
 
             # ✅ merge description + report
             merged_text = (description or "") + "\n\n" + (report or "")